@@ -0,0 +1,58 @@
+import numpy as np
+
+from metpy.interpolate import interpolate_to_grid, ObjectiveAnalysis; 
+
+
+class TimeSuite:
+    #NOTE: I'm using CalVer https://calver.org/ YYYY.MM.DD
+    version = "2026.10.18"; 
+    
+    params = [5000, 20000, 100000]; 
+    param_names = ["num_obs"]; 
+    
+    def setup(self, num_obs):
+       # Scattered obs over a CONUS sized domain, gridded at 25 km
+       rng = np.random.default_rng(0)
+       self.x, self.y = rng.uniform(0, 5e6, (2, num_obs))
+       self.z = rng.normal(size=num_obs)
+       self.z_times = rng.normal(size=(num_obs, 24))
+       grid_x, grid_y = np.meshgrid(np.arange(0, 5e6, 25000.), np.arange(0, 5e6, 25000.))
+       self.points = np.stack([self.x, self.y], axis=1)
+       self.grid_points = np.stack([grid_x.ravel(), grid_y.ravel()], axis=1)
+       self.radius = 5 * 5e6 / np.sqrt(num_obs)
+       self.analysis = ObjectiveAnalysis(self.points, self.grid_points, self.radius, 
+                                         kind='barnes', kappa=self.radius**2 / 10, 
+                                         gamma=0.3, passes=2)
+       
+    def time_barnes_one_pass(self, num_obs): 
+        """Benchmarking a single pass barnes analysis to a grid"""
+        interpolate_to_grid(self.x, self.y, self.z, interp_type='barnes', hres=25000); 
+        
+    def time_barnes_two_pass(self, num_obs): 
+        """Benchmarking a two pass barnes analysis to a grid"""
+        interpolate_to_grid(self.x, self.y, self.z, interp_type='barnes', hres=25000, 
+                            passes=2); 
+        
+    def time_barnes_three_pass(self, num_obs): 
+        """Benchmarking a three pass barnes analysis to a grid"""
+        interpolate_to_grid(self.x, self.y, self.z, interp_type='barnes', hres=25000, 
+                            passes=3); 
+        
+    def time_barnes_two_pass_reuse(self, num_obs): 
+        """Benchmarking reusing two pass barnes weights for 24 hours of obs"""
+        self.analysis(self.z_times); 
+        
+    def peakmem_barnes_two_pass(self, num_obs): 
+        """Benchmarking memory use of a two pass barnes analysis to a grid"""
+        interpolate_to_grid(self.x, self.y, self.z, interp_type='barnes', hres=25000, 
+                            passes=2); 
+        
+    def time_barnes_two_pass_tiled(self, num_obs): 
+        """Benchmarking a two pass barnes analysis to a grid in 64x64 tiles"""
+        interpolate_to_grid(self.x, self.y, self.z, interp_type='barnes', hres=25000, 
+                            passes=2, tile_size=64); 
+        
+    def peakmem_barnes_two_pass_tiled(self, num_obs): 
+        """Benchmarking memory use of a two pass barnes analysis to a grid in 64x64 tiles"""
+        interpolate_to_grid(self.x, self.y, self.z, interp_type='barnes', hres=25000, 
+                            passes=2, tile_size=64); 
@@ -0,0 +1,48 @@
+import os
+import xarray as xr
+
+import metpy.calc as mpcalc; 
+from metpy.units import units; 
+
+
+class TimeSuite:
+    #NOTE: I'm using CalVer https://calver.org/ YYYY.MM.DD
+    version = "2026.10.18"; 
+    
+    def setup_cache(self):
+       base_path = os.path.dirname(__file__) # path to current file
+       file_path = os.path.join(base_path, "..", "data_array_compressed.nc");
+       file_path = os.path.abspath(file_path)
+       ds = xr.open_dataset(file_path)
+       return ds; 
+   
+    def setup(self, ds):
+       # One time step and a fifth of the levels per chunk, so only a few chunks
+       # need to be in memory at once when results are reduced
+       self.chunked = ds.chunk({'time': 1, 'pressure': 10})
+       
+    def time_potential_temperature_chunked(self, ds): 
+        """Benchmarking lazy potential temperature on a chunked 4d cube"""
+        mpcalc.potential_temperature(self.chunked.pressure, self.chunked.temperature).compute(); 
+        
+    def time_dewpoint_chunked(self, ds): 
+        """Benchmarking lazy dewpoint from mixing ratio on a chunked 4d cube"""
+        e = mpcalc.vapor_pressure(self.chunked.pressure, self.chunked.mixing_ratio)
+        mpcalc.dewpoint(e).compute(); 
+        
+    def peakmem_potential_temperature_chunked(self, ds): 
+        """Peak memory of lazy potential temperature reduced chunk by chunk"""
+        mpcalc.potential_temperature(self.chunked.pressure, self.chunked.temperature).max().compute(); 
+        
+    def peakmem_dewpoint_chunked(self, ds): 
+        """Peak memory of lazy dewpoint from mixing ratio reduced chunk by chunk"""
+        e = mpcalc.vapor_pressure(self.chunked.pressure, self.chunked.mixing_ratio)
+        mpcalc.dewpoint(e).max().compute(); 
+        
+    def time_smooth_gaussian_chunked(self, ds): 
+        """Benchmarking lazy gaussian smoothing of a 4d cube chunked along lat/lon too"""
+        mpcalc.smooth_gaussian(self.chunked.temperature.chunk({'lat': 25, 'lon': 25}), 8).compute(); 
+        
+    def peakmem_smooth_n_point_chunked(self, ds): 
+        """Peak memory of lazy multi-pass 9 point smoothing reduced chunk by chunk"""
+        mpcalc.smooth_n_point(self.chunked.temperature, 9, 4).max().compute(); 
@@ -88,4 +88,18 @@ class TimeSuite:
         
     def time_wind_components(self, timeSlice):
         """Benchmarking the wind components calculation on a 3d cube"""
-        mpcalc.wind_components(self.timeSlice.windspeed, self.timeSlice.winddir)
\ No newline at end of file
+        mpcalc.wind_components(self.timeSlice.windspeed, self.timeSlice.winddir)
+        
+    def time_vorticity_divergence_cold_grid_cache(self, pressureSlice): 
+        """Benchmarking vorticity and divergence on a 2d surface, finding the grid deltas and map factors once"""
+        mpcalc.clear_grid_cache(); 
+        mpcalc.vorticity(self.pressureSlice.uwind, self.pressureSlice.vwind); 
+        mpcalc.divergence(self.pressureSlice.uwind, self.pressureSlice.vwind); 
+        
+    def time_kinematics_bundle(self, pressureSlice): 
+        """Benchmarking 8 kinematics diagnostics from one set of wind derivatives on a 2d surface"""
+        mpcalc.kinematics_bundle(self.pressureSlice.uwind, self.pressureSlice.vwind, 
+                                 outputs = ['vorticity', 'absolute_vorticity', 'divergence', 'shearing_deformation', 
+                                            'stretching_deformation', 'total_deformation', 'frontogenesis', 'q_vector'], 
+                                 potential_temperature = self.pressureSlice.theta, temperature = self.pressureSlice.temperature, 
+                                 pressure = self.pressureSlice.pressure); 
@@ -0,0 +1,39 @@
+from metpy.cbook import get_test_data
+from metpy.io import GempakGrid; 
+
+
+class TimeSuite:
+    #NOTE: I'm using CalVer https://calver.org/ YYYY.MM.DD
+    version = "2026.10.18"; 
+    
+    def setup_cache(self):
+       # Bundled GEMPAK test grids, one for each supported packing type
+       files = {}
+       for packing in ['none', 'diff', 'dec', 'grib']:
+           files[packing] = get_test_data(f'gem_packing_{packing}.grd', as_file_obj=False)
+       files['multi'] = get_test_data('gem_multilevel_multidate.grd', as_file_obj=False)
+       return files; 
+        
+    def time_gdxarray_packing_none(self, files): 
+        """Benchmarking reading an unpacked GEMPAK grid"""
+        GempakGrid(files['none']).gdxarray(); 
+        
+    def time_gdxarray_packing_diff(self, files): 
+        """Benchmarking reading a DIF packed GEMPAK grid"""
+        GempakGrid(files['diff']).gdxarray(); 
+        
+    def time_gdxarray_packing_dec(self, files): 
+        """Benchmarking reading a DEC packed GEMPAK grid"""
+        GempakGrid(files['dec']).gdxarray(); 
+        
+    def time_gdxarray_packing_grib(self, files): 
+        """Benchmarking reading a GRIB packed GEMPAK grid"""
+        GempakGrid(files['grib']).gdxarray(); 
+        
+    def time_gdxarray_multilevel_multidate(self, files): 
+        """Benchmarking reading all grids from a multi-level, multi-time GEMPAK file"""
+        GempakGrid(files['multi']).gdxarray(); 
+        
+    def peakmem_gdxarray_single_grid(self, files): 
+        """Peak memory reading one grid from a multi-level, multi-time GEMPAK file"""
+        GempakGrid(files['multi']).gdxarray(parameter='STPC'); 
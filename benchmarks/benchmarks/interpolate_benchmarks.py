@@ -0,0 +1,83 @@
+import os
+import numpy as np
+import xarray as xr
+
+from metpy.interpolate import (interpolate_1d, log_interpolate_1d, natural_neighbor_to_grid, 
+                               inverse_distance_to_grid, ObjectiveAnalysis, 
+                               VerticalInterpolator); 
+from metpy.units import units; 
+
+
+class TimeSuite:
+    #NOTE: I'm using CalVer https://calver.org/ YYYY.MM.DD
+    version = "2026.10.18"; 
+    
+    def setup_cache(self):
+       base_path = os.path.dirname(__file__) # path to current file
+       file_path = os.path.join(base_path, "..", "data_array_compressed.nc");
+       file_path = os.path.abspath(file_path)
+       ds = xr.open_dataset(file_path)
+       return ds; 
+   
+    def setup(self, ds):
+       # Full 4d pressure and height grids, like we get on model levels
+       pressure, temperature = xr.broadcast(ds.pressure, ds.temperature)
+       self.pressure = units.Quantity(pressure.values, 'hPa')
+       self.temperature = units.Quantity(temperature.values, 'K')
+       self.height = units.Quantity(np.broadcast_to(ds.height.values[..., np.newaxis], 
+                                                    ds.temperature.shape), 'm')
+       self.uwind = units.Quantity(ds.uwind.values, 'm/s')
+       self.vwind = units.Quantity(ds.vwind.values, 'm/s')
+       self.plevs = units.Quantity([925., 850., 700., 500., 300.], 'hPa')
+       self.zlevs = units.Quantity([1000., 2000., 3000., 5000., 8000.], 'm')
+       self.interp = VerticalInterpolator(self.plevs, self.pressure, log=True)
+       # Scattered surface obs, like a few thousand METARs
+       rng = np.random.default_rng(0)
+       self.xp, self.yp = rng.uniform(0, 1000, (2, 3000))
+       self.obs = rng.normal(size=3000)
+       self.grid_x, self.grid_y = np.meshgrid(np.linspace(0, 1000, 250), np.linspace(0, 1000, 250))
+       self.grid_points = np.stack([self.grid_x.ravel(), self.grid_y.ravel()], axis=1)
+       self.obs_points = np.stack([self.xp, self.yp], axis=1)
+       self.obs_times = rng.normal(size=(3000, 24))
+       self.analysis = ObjectiveAnalysis(self.obs_points, self.grid_points, 50, kind='barnes', 
+                                         kappa=1000.)
+       
+    def time_log_interpolate_1d_gridded(self, ds): 
+        """Benchmarking interpolating a 4d grid to pressure levels"""
+        log_interpolate_1d(self.plevs, self.pressure, self.temperature, axis=0); 
+        
+    def time_interpolate_1d_gridded(self, ds): 
+        """Benchmarking interpolating multiple 4d grids to height levels"""
+        interpolate_1d(self.zlevs, self.height, self.temperature, self.uwind, self.vwind, 
+                       axis=0); 
+        
+    def time_log_interpolate_1d_gridded_increasing(self, ds): 
+        """Benchmarking interpolating a 4d grid stored top-down to pressure levels"""
+        log_interpolate_1d(self.plevs, self.pressure[::-1], self.temperature[::-1], axis=0); 
+        
+    def time_vertical_interpolator_setup(self, ds): 
+        """Benchmarking precomputing interpolation from a 4d grid to pressure levels"""
+        VerticalInterpolator(self.plevs, self.pressure, log=True); 
+        
+    def time_vertical_interpolator_apply(self, ds): 
+        """Benchmarking reusing precomputed interpolation for multiple 4d grids"""
+        self.interp(self.temperature); 
+        self.interp(self.uwind); 
+        self.interp(self.vwind); 
+        
+    def time_natural_neighbor_to_grid(self, ds): 
+        """Benchmarking natural neighbor gridding of 3000 scattered obs"""
+        natural_neighbor_to_grid(self.xp, self.yp, self.obs, self.grid_x, self.grid_y); 
+        
+    def time_inverse_distance_to_grid(self, ds): 
+        """Benchmarking barnes gridding of 3000 scattered obs"""
+        inverse_distance_to_grid(self.xp, self.yp, self.obs, self.grid_x, self.grid_y, 50, 
+                                 kappa=1000., kind='barnes'); 
+        
+    def time_objective_analysis_setup(self, ds): 
+        """Benchmarking precomputing barnes weights for 3000 scattered obs"""
+        ObjectiveAnalysis(self.obs_points, self.grid_points, 50, kind='barnes', kappa=1000.); 
+        
+    def time_objective_analysis_apply(self, ds): 
+        """Benchmarking reusing barnes weights for 24 hours of obs"""
+        self.analysis(self.obs_times); 
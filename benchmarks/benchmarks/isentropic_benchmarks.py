@@ -0,0 +1,38 @@
+import os
+import numpy as np
+import xarray as xr
+
+import metpy.calc as mpcalc; 
+from metpy.units import units; 
+
+
+class TimeSuite:
+    #NOTE: I'm using CalVer https://calver.org/ YYYY.MM.DD
+    version = "2026.10.18"; 
+    
+    def setup_cache(self):
+       base_path = os.path.dirname(__file__) # path to current file
+       file_path = os.path.join(base_path, "..", "data_array_compressed.nc");
+       file_path = os.path.abspath(file_path)
+       ds = xr.open_dataset(file_path)
+       return ds; 
+   
+    def setup(self, ds):
+       self.pressure = units.Quantity(ds.pressure.values, 'hPa')
+       self.temperature = units.Quantity(ds.temperature.values, 'K')
+       self.theta_levels = units.Quantity(np.arange(280., 400., 5.), 'K')
+       
+    def time_isentropic_interpolation(self, ds): 
+        """Benchmarking interpolating a 4d grid to isentropic levels"""
+        mpcalc.isentropic_interpolation(self.theta_levels, self.pressure, self.temperature, 
+                                        vertical_dim=0); 
+        
+    def time_isentropic_interpolation_float32(self, ds): 
+        """Benchmarking interpolating a 4d grid to isentropic levels in single precision"""
+        mpcalc.isentropic_interpolation(self.theta_levels, self.pressure, self.temperature, 
+                                        vertical_dim=0, dtype=np.float32); 
+        
+    def peakmem_isentropic_interpolation(self, ds): 
+        """Benchmarking memory use interpolating a 4d grid to isentropic levels"""
+        mpcalc.isentropic_interpolation(self.theta_levels, self.pressure, self.temperature, 
+                                        vertical_dim=0); 
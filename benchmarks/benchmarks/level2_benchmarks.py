@@ -0,0 +1,65 @@
+from metpy.cbook import get_test_data
+from metpy.io import Level2File, Level2Stream; 
+
+
+class TimeSuite:
+    #NOTE: I'm using CalVer https://calver.org/ YYYY.MM.DD
+    version = "2026.10.18"; 
+    
+    def setup_cache(self):
+       # Bundled Level II test files: KFTG uses the internal bzip2 blocks, KTLX is an
+       # old message 1 volume that is gzipped as a whole
+       files = {}
+       files['kftg'] = get_test_data('Level2_KFTG_20150430_1419.ar2v', as_file_obj=False)
+       files['ktlx'] = get_test_data('KTLX19990503_235621.gz', as_file_obj=False)
+       return files; 
+   
+    def setup(self, files):
+       self.kftg = Level2File(files['kftg'])
+       
+       # Split the KFTG volume into real-time style chunks: header and metadata record,
+       # then 5 compressed records per chunk
+       with open(files['kftg'], 'rb') as f:
+           data = f.read()
+       offsets = [24]
+       while offsets[-1] < len(data):
+           offsets.append(offsets[-1] + 4 + int.from_bytes(data[offsets[-1]:offsets[-1] + 4], 'big', signed=True))
+       bounds = [0] + offsets[1:-1:5] + [len(data)]
+       self.chunks = [data[start:end] for start, end in zip(bounds[:-1], bounds[1:])]
+        
+    def time_open_bzip_blocks(self, files): 
+        """Benchmarking opening a Level II volume with internal bzip2 blocks"""
+        Level2File(files['kftg']); 
+        
+    def time_open_bzip_blocks_threaded(self, files): 
+        """Benchmarking opening a Level II volume decompressing blocks with 4 threads"""
+        Level2File(files['kftg'], workers=4); 
+        
+    def time_open_selected_sweep(self, files): 
+        """Benchmarking opening a Level II volume decoding only REF and VEL from sweep 0"""
+        Level2File(files['kftg'], sweeps=[0], moments=['REF', 'VEL']); 
+        
+    def time_stream_first_sweep(self, files): 
+        """Benchmarking adding real-time chunks until the first sweep is complete"""
+        stream = Level2Stream()
+        for chunk in self.chunks:
+            if stream.add_chunk(chunk):
+                break
+        
+    def time_stream_volume(self, files): 
+        """Benchmarking adding all real-time chunks of a volume one at a time"""
+        stream = Level2Stream()
+        for chunk in self.chunks:
+            stream.add_chunk(chunk)
+        
+    def time_open_gzip_legacy(self, files): 
+        """Benchmarking opening a gzipped Level II volume with legacy message 1 radials"""
+        Level2File(files['ktlx']); 
+        
+    def time_moment_array(self, files): 
+        """Benchmarking getting reflectivity for a whole sweep as one array"""
+        self.kftg.sweeps[0].moment_array('REF'); 
+        
+    def peakmem_open_bzip_blocks(self, files): 
+        """Peak memory opening a Level II volume with internal bzip2 blocks"""
+        Level2File(files['kftg']); 
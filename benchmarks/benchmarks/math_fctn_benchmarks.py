@@ -1,7 +1,9 @@
 import os
+import numpy as np
 import xarray as xr
 
 import metpy.calc as mpcalc; 
+from metpy.units import units; 
 
  
 class TimeSuite:
@@ -19,6 +21,8 @@ class TimeSuite:
     def setup(self, ds):
        self.pressureSlice = ds.isel(pressure = 0, time = 0)
        self.timeSlice = ds.isel(time = 0)
+       self.temp4d = ds.temperature.metpy.unit_array
+       self.out = np.empty(self.temp4d.shape)
        
     def time_geospatial_gradient(self, pressureSlice):
         """Benchmarking calculating the geospatial gradient of temp on a 2d array"""
@@ -36,6 +40,22 @@ class TimeSuite:
         """Benchmarking calculating the vector derivative of wind on a 2d slice"""
         mpcalc.vector_derivative(self.pressureSlice.uwind, self.pressureSlice.vwind); 
         
+    def time_first_derivative_uniform(self, ds): 
+        """Benchmarking the first derivative of temp on a 4d cube with uniform spacing"""
+        mpcalc.first_derivative(self.temp4d, axis = 1, delta = 25 * units.km); 
+        
+    def time_second_derivative_uniform(self, ds): 
+        """Benchmarking the second derivative of temp on a 4d cube with uniform spacing"""
+        mpcalc.second_derivative(self.temp4d, axis = 0, delta = 25 * units.km); 
+        
+    def peakmem_first_derivative_uniform_out(self, ds): 
+        """Peak memory of the first derivative of temp on a 4d cube into a preallocated array"""
+        mpcalc.first_derivative(self.temp4d, axis = 1, delta = 25 * units.km, out = self.out); 
+        
+    def time_geospatial_laplacian_4d(self, ds): 
+        """Benchmarking calculating the geospatial laplacian of temp on a 4d cube"""
+        mpcalc.geospatial_laplacian(ds.temperature); 
+        
     # def time_tangential_component(self, timeSlice):
     #     """Benchmarking calculation of the tangential component of wind on a 2d slice"""
     #     mpcalc.tangential_component(self.pressureSlice.uwind, self.pressureSlice.vwind); 
@@ -0,0 +1,42 @@
+from metpy.cbook import get_test_data
+from metpy.io import iter_metar_file, parse_metar_file; 
+from metpy.io.metar import parse_metar; 
+
+
+class TimeSuite:
+    #NOTE: I'm using CalVer https://calver.org/ YYYY.MM.DD
+    version = "2026.10.18"; 
+    
+    def setup_cache(self):
+       # Bundled METAR test files, roughly 9000 reports each
+       files = {}
+       files['metar'] = get_test_data('metar_20190701_1200.txt', as_file_obj=False)
+       files['sao'] = get_test_data('2020010600_sao.wmo', as_file_obj=False)
+       return files; 
+        
+    def time_parse_metar_file(self, files): 
+        """Benchmarking decoding a full hour of METAR reports"""
+        parse_metar_file(files['metar'], year=2019, month=7); 
+        
+    def time_parse_metar_file_sao(self, files): 
+        """Benchmarking decoding a WMO bulletin file of METAR reports"""
+        parse_metar_file(files['sao'], year=2020, month=1); 
+        
+    def time_parse_metar(self, files): 
+        """Benchmarking decoding a single METAR report"""
+        parse_metar('KDEN 012153Z 09010KT 10SM FEW060 BKN110 BKN220 27/13 A3010 RMK AO2 '
+                    'LTG DSNT SW AND W SLP114', 2019, 7); 
+        
+    def peakmem_parse_metar_file(self, files): 
+        """Peak memory decoding a full hour of METAR reports"""
+        parse_metar_file(files['metar'], year=2019, month=7); 
+        
+    def time_iter_metar_file(self, files): 
+        """Benchmarking decoding a full hour of METAR reports in batches"""
+        for df in iter_metar_file(files['metar'], chunksize=2000, year=2019, month=7): 
+            pass; 
+        
+    def peakmem_iter_metar_file(self, files): 
+        """Peak memory decoding a full hour of METAR reports in batches"""
+        for df in iter_metar_file(files['metar'], chunksize=2000, year=2019, month=7): 
+            pass; 
@@ -18,6 +18,8 @@ class TimeSuite:
     def setup(self, ds):
        self.pressureSlice = ds.isel(pressure = 0, time = 0)
        self.timeSlice = ds.isel(time = 0)
+       # Larger 2d grid for large smoothing windows
+       self.bigGrid = np.tile(self.pressureSlice.relative_humidity.values, (10, 10))
        
     def time_smooth_gaussian(self, pressureSlice): 
         """Benchmarking the gaussian smoothing of a 2d grid"""
@@ -42,4 +44,20 @@ class TimeSuite:
     def time_zoom_xarray(self, pressureSlice):
         """Benchmarking the zoom xarray function"""
         mpcalc.zoom_xarray(self.pressureSlice.temperature, zoom = 3.0);
-        
\ No newline at end of file
+        
+        
+    def time_smooth_circular_large(self, pressureSlice): 
+        """Benchmarking the circular smoothing of a 2d grid with a radius of 20"""
+        mpcalc.smooth_circular(self.bigGrid, 20); 
+        
+    def time_smooth_rectangular_large(self, pressureSlice): 
+        """Benchmarking the rectangular smoothing of a 2d grid with a 41x41 window"""
+        mpcalc.smooth_rectangular(self.bigGrid, 41, passes=3); 
+        
+    def time_smooth_window_gaussian_large(self, pressureSlice): 
+        """Benchmarking the window smoothing of a 2d grid with a large separable window"""
+        mpcalc.smooth_window(self.bigGrid, np.outer(*[np.exp(-np.linspace(-2, 2, 21)**2)] * 2)); 
+        
+    def time_smooth_circular_large_direct(self, pressureSlice): 
+        """Benchmarking the direct circular smoothing of a 2d grid with a radius of 20"""
+        mpcalc.smooth_circular(self.bigGrid, 20, method='direct'); 
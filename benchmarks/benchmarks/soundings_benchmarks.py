@@ -21,6 +21,10 @@ class TimeSuite:
         self.parcelProfile = mpcalc.parcel_profile(self.profileSlice.pressure, 
                                                   self.profileSlice.temperature[0], 
                                                   self.profileSlice.dewpoint[0]); 
+        self.gridPressure = self.timeSlice.pressure.broadcast_like(self.timeSlice.temperature)
+        self.gridParcelProfile = mpcalc.parcel_profile(self.gridPressure, 
+                                                      self.timeSlice.temperature[0], 
+                                                      self.timeSlice.dewpoint[0]); 
         
     def time_bulk_shear(self, profileSlice): 
         """Benchmarking calculating the bulk shear of a profile"""
@@ -34,6 +38,14 @@ class TimeSuite:
         """Benchmarking the atmospheric parcel profile for one profile"""
         mpcalc.parcel_profile(self.profileSlice.pressure, self.profileSlice.temperature[0], self.profileSlice.dewpoint[0]);
         
+    def time_parcel_profile_grid(self, timeSlice): 
+        """Benchmarking the atmospheric parcel profile for every column of a 3d cube at once"""
+        mpcalc.parcel_profile(self.gridPressure, self.timeSlice.temperature[0], self.timeSlice.dewpoint[0]);
+        
+    def time_moist_lapse_grid(self, timeSlice): 
+        """Benchmarking the moist lapse rate for every column of a 3d cube at once"""
+        mpcalc.moist_lapse(self.gridPressure, self.timeSlice.temperature[0]);
+        
     def time_most_unstable_parcel(self, profileSlice): 
         """Benchmarking the calculation to find the most unstable parcel for one profile"""
         mpcalc.most_unstable_parcel(self.profileSlice.pressure, self.profileSlice.temperature, self.profileSlice.dewpoint); 
@@ -42,6 +54,22 @@ class TimeSuite:
         """Benchmarking cape_cin calculation for one profile"""
         mpcalc.cape_cin(self.profileSlice.pressure, self.profileSlice.temperature, self.profileSlice.dewpoint, self.parcelProfile); 
     
+    def time_cape_cin_grid(self, timeSlice): 
+        """Benchmarking cape_cin calculation for every column of a 3d cube at once"""
+        mpcalc.cape_cin(self.timeSlice.pressure, self.timeSlice.temperature, self.timeSlice.dewpoint, self.gridParcelProfile); 
+        
+    def time_surface_based_cape_cin_grid(self, timeSlice): 
+        """Benchmarking surface based cape/cin for every column of a 3d cube at once"""
+        mpcalc.surface_based_cape_cin(self.timeSlice.pressure, self.timeSlice.temperature, self.timeSlice.dewpoint); 
+        
+    def time_mixed_layer_cape_cin_grid(self, timeSlice): 
+        """Benchmarking mixed layer cape/cin for every column of a 3d cube at once"""
+        mpcalc.mixed_layer_cape_cin(self.timeSlice.pressure, self.timeSlice.temperature, self.timeSlice.dewpoint); 
+        
+    def time_most_unstable_cape_cin_grid(self, timeSlice): 
+        """Benchmarking most unstable cape/cin for every column of a 3d cube at once"""
+        mpcalc.most_unstable_cape_cin(self.timeSlice.pressure, self.timeSlice.temperature, self.timeSlice.dewpoint); 
+    
     def time_lcl(self, timeSlice):
         """Benchmarks lcl on a 3d cube - many profiles"""
         mpcalc.lcl(self.timeSlice.pressure, self.timeSlice.temperature, self.timeSlice.dewpoint); 
@@ -54,16 +54,17 @@ az = units.Quantity(az, 'degrees')
 # Calculate ranges for the gates from the metadata
 
 # 5th item is a dict mapping a var name (byte string) to a tuple
-# of (header, data array)
+# of (header, data array). Each sweep can also stack the data for a
+# variable from all of its radials into a single 2D array.
 ref_hdr = f.sweeps[sweep][0][4][b'REF'][0]
 ref_range = (np.arange(ref_hdr.num_gates + 1) - 0.5) * ref_hdr.gate_width + ref_hdr.first_gate
 ref_range = units.Quantity(ref_range, 'kilometers')
-ref = np.array([ray[4][b'REF'][1] for ray in f.sweeps[sweep]])
+ref = f.sweeps[sweep].moment_array('REF')
 
 rho_hdr = f.sweeps[sweep][0][4][b'RHO'][0]
 rho_range = (np.arange(rho_hdr.num_gates + 1) - 0.5) * rho_hdr.gate_width + rho_hdr.first_gate
 rho_range = units.Quantity(rho_range, 'kilometers')
-rho = np.array([ray[4][b'RHO'][1] for ray in f.sweeps[sweep]])
+rho = f.sweeps[sweep].moment_array('RHO')
 
 # Extract central longitude and latitude from file
 cent_lon = f.sweeps[0][0][1].lon
@@ -10,9 +10,11 @@ These include:
 * windchill
 """
 import contextlib
+import functools
 from itertools import product
 
 import numpy as np
+from scipy import fft as scipy_fft
 from scipy.ndimage import gaussian_filter, zoom as scipy_zoom
 import xarray as xr
 
@@ -31,7 +33,7 @@ gamma = units.Quantity(6.5, 'K/km')
 
 
 @exporter.export
-@preprocess_and_wrap(wrap_like='u')
+@preprocess_and_wrap(wrap_like='u', lazy='elementwise')
 @check_units('[speed]', '[speed]')
 def wind_speed(u, v):
     r"""Compute the wind speed from u and v-components.
@@ -64,7 +66,7 @@ def wind_speed(u, v):
 
 
 @exporter.export
-@preprocess_and_wrap(wrap_like='u')
+@preprocess_and_wrap(wrap_like='u', lazy='elementwise')
 @check_units('[speed]', '[speed]')
 def wind_direction(u, v, convention='from'):
     r"""Compute the wind direction from u and v-components.
@@ -126,7 +128,7 @@ def wind_direction(u, v, convention='from'):
 
 
 @exporter.export
-@preprocess_and_wrap(wrap_like=('speed', 'speed'))
+@preprocess_and_wrap(wrap_like=('speed', 'speed'), lazy='elementwise')
 @check_units('[speed]')
 def wind_components(speed, wind_direction):
     r"""Calculate the U, V wind vector components from the speed and direction.
@@ -439,7 +441,7 @@ def apparent_temperature(temperature, relative_humidity, speed, face_level_winds
 
 
 @exporter.export
-@preprocess_and_wrap(wrap_like='pressure')
+@preprocess_and_wrap(wrap_like='pressure', lazy='elementwise')
 @check_units('[pressure]')
 def pressure_to_height_std(pressure):
     r"""Convert pressure data to height using the U.S. standard atmosphere [NOAA1976]_.
@@ -583,7 +585,7 @@ def geopotential_to_height(geopotential):
 
 
 @exporter.export
-@preprocess_and_wrap(wrap_like='height')
+@preprocess_and_wrap(wrap_like='height', lazy='elementwise')
 @check_units('[length]')
 def height_to_pressure_std(height):
     r"""Convert height data to pressures using the U.S. standard atmosphere [NOAA1976]_.
@@ -757,6 +759,28 @@ def sigma_to_pressure(sigma, pressure_sfc, pressure_top):
     return sigma * (pressure_sfc - pressure_top) + pressure_top
 
 
+def _is_dask_collection(data):
+    """Return whether ``data`` is a dask collection, without needing dask installed."""
+    graph = getattr(data, '__dask_graph__', None)
+    return callable(graph) and graph() is not None
+
+
+def _smooth_chunked(smooth, data, depth):
+    """Apply a smoother lazily to each block of a dask array.
+
+    ``depth`` gives the number of points along each trailing dimension that the smoother
+    needs around each point. Blocks overlap by that much so that the result matches
+    smoothing the whole array at once, while the edges of the full array are left alone.
+    """
+    import dask.array as da
+
+    axes = range(data.ndim - len(depth), data.ndim)
+    return da.map_overlap(smooth, data, depth={axis: d for axis, d in zip(axes, depth,
+                                                                       strict=True) if d},
+                          boundary='none', dtype=data.dtype,
+                          meta=np.array((), dtype=data.dtype))
+
+
 @exporter.export
 @preprocess_and_wrap(wrap_like='scalar_grid', match_unit=True, to_magnitude=True)
 def smooth_gaussian(scalar_grid, n):
@@ -848,16 +872,208 @@ def smooth_gaussian(scalar_grid, n):
     scalar_grid = getattr(scalar_grid, 'magnitude', scalar_grid)
 
     filter_args = {'sigma': sgma_seq, 'truncate': 2 * np.sqrt(2)}
-    if hasattr(scalar_grid, 'mask'):
+    if _is_dask_collection(scalar_grid):
+        # Match the kernel radius used within gaussian_filter
+        depth = [int(filter_args['truncate'] * sigma + 0.5) for sigma in sgma_seq]
+        return _smooth_chunked(functools.partial(gaussian_filter, **filter_args),
+                               scalar_grid, depth)
+    elif hasattr(scalar_grid, 'mask'):
         smoothed = gaussian_filter(scalar_grid.data, **filter_args)
         return np.ma.array(smoothed, mask=scalar_grid.mask)
     else:
         return gaussian_filter(scalar_grid, **filter_args)
 
 
+def _box_sum(src, axis, n, out, cumulative):
+    """Sum ``n`` consecutive values of ``src`` along ``axis`` into ``out``.
+
+    This uses a running (cumulative) sum, the 1D version of a summed-area table, so the cost
+    does not depend on ``n``. ``cumulative`` is a buffer with one more entry than ``src``
+    along ``axis``.
+    """
+    first = [slice(None)] * src.ndim
+    first[axis] = slice(0, 1)
+    cumulative[tuple(first)] = 0
+    rest = [slice(None)] * src.ndim
+    rest[axis] = slice(1, None)
+    np.cumsum(src, axis=axis, out=cumulative[tuple(rest)])
+
+    upper = [slice(None)] * src.ndim
+    upper[axis] = slice(n, None)
+    lower = [slice(None)] * src.ndim
+    lower[axis] = slice(None, -n)
+    return np.subtract(cumulative[tuple(upper)], cumulative[tuple(lower)], out=out)
+
+
+def _weighted_sum(src, axis, weights, out, scratch):
+    """Sum values of ``src`` along ``axis`` into ``out``, weighted by the 1D ``weights``."""
+    def shifted(k):
+        index = [slice(None)] * src.ndim
+        index[axis] = slice(k, src.shape[axis] - len(weights) + 1 + k)
+        return src[tuple(index)]
+
+    np.multiply(weights[0], shifted(0), out=out)
+    for k in range(1, len(weights)):
+        out += np.multiply(weights[k], shifted(k), out=scratch)
+    return out
+
+
+def _separable_weights(weights):
+    """Split weights into 1D weights along each dimension, or return None if not possible."""
+    total = np.sum(weights)
+    if weights.ndim == 1:
+        return [weights]
+    if total == 0:
+        return None
+
+    all_axes = set(range(weights.ndim))
+    factors = [np.sum(weights, axis=tuple(all_axes - {i})) for i in range(weights.ndim)]
+    factors[0] = factors[0] / total**(weights.ndim - 1)
+    outer = factors[0]
+    for factor in factors[1:]:
+        outer = np.multiply.outer(outer, factor)
+    return factors if np.allclose(outer, weights, rtol=1e-12, atol=0) else None
+
+
+class _WindowSmoother:
+    """Apply a smoothing window to the interior of an array using a selectable method.
+
+    All of the work buffers are allocated up front, so that repeated passes can reuse them.
+    """
+
+    methods = ('direct', 'separable', 'summed_area', 'fft')
+
+    def __init__(self, weights, shape, dtype, method='auto'):
+        self.weights = weights
+        self.shape = shape
+        self.axes = tuple(range(len(shape) - weights.ndim, len(shape)))
+        self.sizes = [shape[axis] - n + 1 for axis, n in zip(self.axes, weights.shape,
+                                                            strict=True)]
+        self.work_dtype = np.result_type(dtype, weights.dtype, np.float64)
+
+        # Index for the interior elements that are affected by the smoothing
+        self.inner_index = (Ellipsis,) + tuple(slice((n - 1) // 2, (n - 1) // 2 + size)
+                                               for n, size in zip(weights.shape, self.sizes,
+                                                                  strict=True))
+
+        self.factors = _separable_weights(weights)
+        box = self.factors is not None and np.all(weights == weights.flat[0])
+        if method == 'auto':
+            # Stick with direct sums for non-float data, since it is truncated afterwards
+            if not np.issubdtype(dtype, np.inexact) or weights.size == 1:
+                method = 'direct'
+            elif box:
+                method = 'summed_area'
+            elif self.factors is not None:
+                method = 'separable'
+            elif weights.size <= 9:
+                method = 'direct'
+            else:
+                method = 'fft'
+
+        if method not in self.methods:
+            raise ValueError(f'Unknown smoothing method {method}. Options are: auto, '
+                             + ', '.join(self.methods) + '.')
+        if method == 'separable' and self.factors is None:
+            raise ValueError('The smoothing window is not separable.')
+        if method == 'summed_area' and not box:
+            raise ValueError('Summed-area smoothing requires a window of equal weights.')
+        self.method = method
+
+        if min(self.sizes) <= 0:
+            # Nothing to smooth if the window does not fit within the data
+            self.method = None
+        elif method == 'separable':
+            self._stages = self._make_stages(cumulative=False)
+        elif method == 'summed_area':
+            self._stages = self._make_stages(cumulative=True)
+        elif method == 'fft':
+            self._fft_shape = [scipy_fft.next_fast_len(size, real=True)
+                               for size in shape[-weights.ndim:]]
+            # Correlate by convolving with the flipped window; its transform is reused
+            self._fft_weights = scipy_fft.rfftn(np.flip(weights), s=self._fft_shape)
+        self._footprint_stages = None
+
+    def _make_stages(self, cumulative, dtype=None):
+        """Allocate an output and scratch buffer for a 1D pass along each trailing axis.
+
+        For running sums, the scratch buffer has one more element than the input along the
+        axis; otherwise, it matches the output.
+        """
+        dtype = dtype or self.work_dtype
+        stages = []
+        out_shape = list(self.shape)
+        for axis, n in zip(self.axes, self.weights.shape, strict=True):
+            scratch_shape = list(out_shape)
+            scratch_shape[axis] += 1
+            out_shape[axis] -= n - 1
+            stages.append((axis, n, np.empty(out_shape, dtype=dtype),
+                           np.empty(scratch_shape if cumulative else out_shape, dtype=dtype)))
+        return stages
+
+    def __call__(self, data, passes=1):
+        """Smooth the interior of ``data`` in place ``passes`` times."""
+        if self.method is None:
+            return data
+
+        for _ in range(passes):
+            if self.method == 'direct':
+                data[self.inner_index] = self._direct(data)
+                continue
+
+            # Non-finite values would spread through the whole of a running sum or FFT, so
+            # zero them and mark the points whose window includes one afterwards
+            bad = ~np.isfinite(data)
+            if bad.any():
+                data[self.inner_index] = self._smooth(np.where(bad, 0, data))
+                data[self.inner_index][self._footprint_sum(bad) > 0] = np.nan
+            else:
+                data[self.inner_index] = self._smooth(data)
+        return data
+
+    def _direct(self, data):
+        """Sum over each weight, applying offsets in needed dimensions."""
+        def offset_full_index(weight_index):
+            return (Ellipsis,) + tuple(slice(k, k + size) for k, size in
+                                       zip(weight_index, self.sizes, strict=True))
+
+        return sum(self.weights[index] * data[offset_full_index(index)]
+                   for index in product(*(range(n) for n in self.weights.shape)))
+
+    def _smooth(self, src):
+        """Calculate the smoothed values for the interior of ``src``."""
+        if self.method == 'fft':
+            transformed = scipy_fft.rfftn(src, s=self._fft_shape, axes=self.axes)
+            transformed *= self._fft_weights
+            full = scipy_fft.irfftn(transformed, s=self._fft_shape, axes=self.axes)
+            return full[(Ellipsis,) + tuple(slice(n - 1, n - 1 + size) for n, size in
+                                            zip(self.weights.shape, self.sizes,
+                                                strict=True))]
+
+        for (axis, n, out, scratch), factor in zip(self._stages, self.factors, strict=True):
+            if self.method == 'summed_area':
+                src = _box_sum(src, axis, n, out, scratch)
+            else:
+                src = _weighted_sum(src, axis, factor, out, scratch)
+
+        if self.method == 'summed_area':
+            src *= self.weights.flat[0]
+        return src
+
+    def _footprint_sum(self, values):
+        """Sum ``values`` over the full rectangle covered by the window."""
+        if self._footprint_stages is None:
+            self._footprint_stages = self._make_stages(cumulative=True, dtype=np.float64)
+
+        src = values
+        for axis, n, out, scratch in self._footprint_stages:
+            src = _box_sum(src, axis, n, out, scratch)
+        return src
+
+
 @exporter.export
 @preprocess_and_wrap(wrap_like='scalar_grid', match_unit=True, to_magnitude=True)
-def smooth_window(scalar_grid, window, passes=1, normalize_weights=True):
+def smooth_window(scalar_grid, window, passes=1, normalize_weights=True, method='auto'):
     """Filter with an arbitrary window smoother.
 
     Parameters
@@ -878,6 +1094,14 @@ def smooth_window(scalar_grid, window, passes=1, normalize_weights=True):
         the normalized smoothing weights. If false, use supplied values directly as the
         weights.
 
+    method : str
+        How to calculate the weighted sums. ``'direct'`` sums the shifted grid once for each
+        element of the window. ``'separable'`` makes one pass along each dimension, for
+        windows that are the outer product of 1D windows. ``'summed_area'`` uses running sums
+        so that the cost does not depend on the size of the window, for windows with equal
+        weights. ``'fft'`` convolves using FFTs, which is fastest for large arbitrary windows.
+        Defaults to ``'auto'``, which picks based on the window.
+
     Returns
     -------
     array-like
@@ -895,25 +1119,14 @@ def smooth_window(scalar_grid, window, passes=1, normalize_weights=True):
     `window` around the data). If a masked value or NaN values exists in the array, it will
     propagate to any point that uses that particular grid point in the smoothing calculation.
     Applying the smoothing function multiple times will propagate NaNs further throughout the
-    domain.
-
-    """
-    def _pad(n):
-        # Return number of entries to pad given length along dimension.
-        return (n - 1) // 2
+    domain. Other than with the ``'direct'`` method, infinite values propagate as NaN.
 
-    def _zero_to_none(x):
-        # Convert zero values to None, otherwise return what is given.
-        return x if x != 0 else None
-
-    def _offset(pad, k):
-        # Return padded slice offset by k entries
-        return slice(_zero_to_none(pad + k), _zero_to_none(-pad + k))
-
-    def _trailing_dims(indexer):
-        # Add ... to the front of an indexer, since we are working with trailing dimensions.
-        return (Ellipsis,) + tuple(indexer)
+    Dask arrays are smoothed lazily, one block at a time, with blocks overlapping by the
+    distance each point can spread over all passes. The ``'direct'`` and ``'separable'``
+    methods give identical results to smoothing the whole array; the others agree to within
+    rounding.
 
+    """
     # Verify that shape in all dimensions is odd (need to have a neighborhood around a
     # central point)
     if any((size % 2 == 0) for size in window.shape):
@@ -922,30 +1135,21 @@ def smooth_window(scalar_grid, window, passes=1, normalize_weights=True):
     # Optionally normalize the supplied weighting window
     weights = window / np.sum(window) if normalize_weights else window
 
-    # Set indexes
-    # Inner index for the centered array elements that are affected by the smoothing
-    inner_full_index = _trailing_dims(_offset(_pad(n), 0) for n in weights.shape)
-    # Indexes to iterate over each weight
-    weight_indexes = tuple(product(*(range(n) for n in weights.shape)))
+    weights = np.asarray(weights)
 
-    # Index for full array elements, offset by the weight index
-    def offset_full_index(weight_index):
-        return _trailing_dims(_offset(_pad(n), weight_index[i] - _pad(n))
-                              for i, n in enumerate(weights.shape))
+    def smooth(data):
+        return _WindowSmoother(weights, data.shape, data.dtype, method=method)(data, passes)
 
-    # TODO: this is not lazy-loading/dask compatible, as it "densifies" the data
-    data = np.array(scalar_grid)
-    for _ in range(passes):
-        # Set values corresponding to smoothing weights by summing over each weight and
-        # applying offsets in needed dimensions
-        data[inner_full_index] = sum(weights[index] * data[offset_full_index(index)]
-                                     for index in weight_indexes)
+    # Smooth dask arrays lazily by blocks, overlapping by how far each point can spread
+    if _is_dask_collection(scalar_grid):
+        return _smooth_chunked(lambda block: smooth(np.array(block)), scalar_grid,
+                               [passes * ((n - 1) // 2) for n in weights.shape])
 
-    return data
+    return smooth(np.array(scalar_grid))
 
 
 @exporter.export
-def smooth_rectangular(scalar_grid, size, passes=1):
+def smooth_rectangular(scalar_grid, size, passes=1, method='auto'):
     """Filter with a rectangular window smoother.
 
     Parameters
@@ -959,6 +1163,9 @@ def smooth_rectangular(scalar_grid, size, passes=1):
     passes : int
         The number of times to apply the filter to the grid. Defaults to 1.
 
+    method : str
+        How to calculate the weighted sums, see `smooth_window`. Defaults to ``'auto'``.
+
     Returns
     -------
     array-like
@@ -978,11 +1185,11 @@ def smooth_rectangular(scalar_grid, size, passes=1):
     smoothing function multiple times will propagate NaNs further throughout the domain.
 
     """
-    return smooth_window(scalar_grid, np.ones(size), passes=passes)
+    return smooth_window(scalar_grid, np.ones(size), passes=passes, method=method)
 
 
 @exporter.export
-def smooth_circular(scalar_grid, radius, passes=1):
+def smooth_circular(scalar_grid, radius, passes=1, method='auto'):
     """Filter with a circular window smoother.
 
     Parameters
@@ -998,6 +1205,9 @@ def smooth_circular(scalar_grid, radius, passes=1):
     passes : int
         The number of times to apply the filter to the grid. Defaults to 1.
 
+    method : str
+        How to calculate the weighted sums, see `smooth_window`. Defaults to ``'auto'``.
+
     Returns
     -------
     array-like
@@ -1024,11 +1234,11 @@ def smooth_circular(scalar_grid, radius, passes=1):
     circle = distance <= radius
 
     # Apply smoother
-    return smooth_window(scalar_grid, circle, passes=passes)
+    return smooth_window(scalar_grid, circle, passes=passes, method=method)
 
 
 @exporter.export
-def smooth_n_point(scalar_grid, n=5, passes=1):
+def smooth_n_point(scalar_grid, n=5, passes=1, method='auto'):
     """Filter with an n-point smoother.
 
     Parameters
@@ -1044,6 +1254,9 @@ def smooth_n_point(scalar_grid, n=5, passes=1):
     passes : int
         The number of times to apply the filter to the grid. Defaults to 1.
 
+    method : str
+        How to calculate the weighted sums, see `smooth_window`. Defaults to ``'auto'``.
+
     Returns
     -------
     array-like or `pint.Quantity`
@@ -1077,7 +1290,8 @@ def smooth_n_point(scalar_grid, n=5, passes=1):
         raise ValueError('The number of points to use in the smoothing '
                          'calculation must be either 5 or 9.')
 
-    return smooth_window(scalar_grid, window=weights, passes=passes, normalize_weights=False)
+    return smooth_window(scalar_grid, window=weights, passes=passes, normalize_weights=False,
+                         method=method)
 
 
 @exporter.export
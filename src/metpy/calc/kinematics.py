@@ -704,23 +704,25 @@ def frontogenesis(potential_temperature, u, v, dx=None, dy=None, x_dim=-1, y_dim
                                                meridional_scale=meridional_scale,
                                                return_only=('df/dy', 'df/dx'))
 
+    dudx, dudy, dvdx, dvdy = vector_derivative(
+        u, v, dx=dx, dy=dy, x_dim=x_dim, y_dim=y_dim, parallel_scale=parallel_scale,
+        meridional_scale=meridional_scale
+    )
+    return _frontogenesis(ddx_theta, ddy_theta, dudx, dudy, dvdx, dvdy)
+
+
+def _frontogenesis(ddx_theta, ddy_theta, dudx, dudy, dvdx, dvdy):
+    """Calculate frontogenesis from the gradient of potential temperature and the wind."""
     # Compute the magnitude of the potential temperature gradient
     mag_theta = np.sqrt(ddx_theta**2 + ddy_theta**2)
 
     # Get the shearing, stretching, and total deformation of the wind field
-    shrd = shearing_deformation(u, v, dx, dy, x_dim=x_dim, y_dim=y_dim,
-                                parallel_scale=parallel_scale,
-                                meridional_scale=meridional_scale)
-    strd = stretching_deformation(u, v, dx, dy, x_dim=x_dim, y_dim=y_dim,
-                                  parallel_scale=parallel_scale,
-                                  meridional_scale=meridional_scale)
-    tdef = total_deformation(u, v, dx, dy, x_dim=x_dim, y_dim=y_dim,
-                             parallel_scale=parallel_scale,
-                             meridional_scale=meridional_scale)
+    shrd = dvdx + dudy
+    strd = dudx - dvdy
+    tdef = np.sqrt(shrd**2 + strd**2)
 
     # Get the divergence of the wind field
-    div = divergence(u, v, dx=dx, dy=dy, x_dim=x_dim, y_dim=y_dim,
-                     parallel_scale=parallel_scale, meridional_scale=meridional_scale)
+    div = dudx + dvdy
 
     # Compute the angle (beta) between the wind field and the gradient of potential temperature
     psi = 0.5 * np.arctan2(shrd, strd)
@@ -1534,12 +1536,170 @@ def q_vector(
         temperature, dx=dx, dy=dy, x_dim=x_dim, y_dim=y_dim,
         parallel_scale=parallel_scale, meridional_scale=meridional_scale)
 
+    return _q_vector(dudx, dudy, dvdx, dvdy, dtempdx, dtempdy, pressure, static_stability)
+
+
+def _q_vector(dudx, dudy, dvdx, dvdy, dtempdx, dtempdy, pressure, static_stability):
+    """Calculate the Q-vector from the derivatives of the wind and temperature."""
     q1 = -mpconsts.Rd / (pressure * static_stability) * (dudx * dtempdx + dvdx * dtempdy)
     q2 = -mpconsts.Rd / (pressure * static_stability) * (dudy * dtempdx + dvdy * dtempdy)
 
     return q1.to_base_units(), q2.to_base_units()
 
 
+# Components of the wind derivative matrix needed for each output of kinematics_bundle
+_BUNDLE_DERIVATIVES = {
+    'vorticity': ('du/dy', 'dv/dx'),
+    'absolute_vorticity': ('du/dy', 'dv/dx'),
+    'divergence': ('du/dx', 'dv/dy'),
+    'shearing_deformation': ('du/dy', 'dv/dx'),
+    'stretching_deformation': ('du/dx', 'dv/dy'),
+    'total_deformation': ('du/dx', 'du/dy', 'dv/dx', 'dv/dy'),
+    'frontogenesis': ('du/dx', 'du/dy', 'dv/dx', 'dv/dy'),
+    'q_vector': ('du/dx', 'du/dy', 'dv/dx', 'dv/dy')
+}
+
+
+@exporter.export
+@parse_grid_arguments
+@preprocess_and_wrap(
+    wrap_like='u',
+    broadcast=('u', 'v', 'potential_temperature', 'temperature', 'pressure',
+               'static_stability', 'latitude', 'parallel_scale', 'meridional_scale')
+)
+@check_units('[speed]', '[speed]', potential_temperature='[temperature]',
+             temperature='[temperature]', pressure='[pressure]',
+             static_stability='[energy] / [mass] / [pressure]**2',
+             latitude='[dimensionless]', dx='[length]', dy='[length]')
+def kinematics_bundle(
+    u, v, *, outputs, potential_temperature=None, temperature=None, pressure=None,
+    static_stability=1, latitude=None, dx=None, dy=None, x_dim=-1, y_dim=-2,
+    parallel_scale=None, meridional_scale=None
+):
+    r"""Calculate several kinematic diagnostics of the horizontal wind together.
+
+    The derivatives of the wind, including any map factor corrections, are calculated only
+    once and shared among all requested diagnostics, rather than once per diagnostic as when
+    calling the individual functions.
+
+    Parameters
+    ----------
+    u : (..., M, N) `xarray.DataArray` or `pint.Quantity`
+        x component of the wind
+    v : (..., M, N) `xarray.DataArray` or `pint.Quantity`
+        y component of the wind
+    outputs : str or Sequence[str]
+        Names of the diagnostics to calculate, from ``'vorticity'``,
+        ``'absolute_vorticity'``, ``'divergence'``, ``'shearing_deformation'``,
+        ``'stretching_deformation'``, ``'total_deformation'``, ``'frontogenesis'`` and
+        ``'q_vector'``. Keyword-only argument.
+    potential_temperature : (..., M, N) `xarray.DataArray` or `pint.Quantity`, optional
+        Potential temperature, needed for ``'frontogenesis'``
+    temperature : (..., M, N) `xarray.DataArray` or `pint.Quantity`, optional
+        Temperature, needed for ``'q_vector'``
+    pressure : `pint.Quantity`, optional
+        Pressure at level, needed for ``'q_vector'``
+    static_stability : `pint.Quantity`, optional
+        The static stability at the pressure level, used for ``'q_vector'``. Defaults to 1 if
+        not given.
+    latitude : `pint.Quantity`, optional
+        Latitude of the wind data, needed for ``'absolute_vorticity'``. Optional if
+        `xarray.DataArray` with latitude/longitude coordinates used as input.
+
+    Returns
+    -------
+    dict
+        Each requested diagnostic, keyed by name, as (..., M, N) `xarray.DataArray` or
+        `pint.Quantity`. ``'q_vector'`` is a tuple of its two components.
+
+    Other Parameters
+    ----------------
+    dx : `pint.Quantity`, optional
+        The grid spacing(s) in the x-direction. If an array, there should be one item less than
+        the size of `u` along the applicable axis. Optional if `xarray.DataArray` with
+        latitude/longitude coordinates used as input. Also optional if one-dimensional
+        longitude and latitude arguments are given for your data on a non-projected grid.
+        Keyword-only argument.
+    dy : `pint.Quantity`, optional
+        The grid spacing(s) in the y-direction. If an array, there should be one item less than
+        the size of `u` along the applicable axis. Optional if `xarray.DataArray` with
+        latitude/longitude coordinates used as input. Also optional if one-dimensional
+        longitude and latitude arguments are given for your data on a non-projected grid.
+        Keyword-only argument.
+    x_dim : int, optional
+        Axis number of x dimension. Defaults to -1 (implying [..., Y, X] order). Automatically
+        parsed from input if using `xarray.DataArray`. Keyword-only argument.
+    y_dim : int, optional
+        Axis number of y dimension. Defaults to -2 (implying [..., Y, X] order). Automatically
+        parsed from input if using `xarray.DataArray`. Keyword-only argument.
+    parallel_scale : `pint.Quantity`, optional
+        Parallel scale of map projection at data coordinate. Optional if `xarray.DataArray`
+        with latitude/longitude coordinates and MetPy CRS used as input. Also optional if
+        longitude, latitude, and crs are given. If otherwise omitted, calculation will be
+        carried out on a Cartesian, rather than geospatial, grid. Keyword-only argument.
+    meridional_scale : `pint.Quantity`, optional
+        Meridional scale of map projection at data coordinate. Optional if `xarray.DataArray`
+        with latitude/longitude coordinates and MetPy CRS used as input. Also optional if
+        longitude, latitude, and crs are given. If otherwise omitted, calculation will be
+        carried out on a Cartesian, rather than geospatial, grid. Keyword-only argument.
+
+    See Also
+    --------
+    vorticity, absolute_vorticity, divergence, shearing_deformation, stretching_deformation,
+    total_deformation, frontogenesis, q_vector, vector_derivative
+
+    Notes
+    -----
+    The results match those of the individual functions.
+
+    """
+    if isinstance(outputs, str):
+        outputs = (outputs,)
+    unknown = [name for name in outputs if name not in _BUNDLE_DERIVATIVES]
+    if unknown:
+        raise ValueError(f'Unknown kinematics outputs: {", ".join(unknown)}.')
+    for name, arg_name, arg in (('absolute_vorticity', 'latitude', latitude),
+                                ('frontogenesis', 'potential_temperature',
+                                 potential_temperature),
+                                ('q_vector', 'temperature', temperature),
+                                ('q_vector', 'pressure', pressure)):
+        if name in outputs and arg is None:
+            raise ValueError(f'`{arg_name}` is required to calculate {name}.')
+
+    grid_args = {'dx': dx, 'dy': dy, 'x_dim': x_dim, 'y_dim': y_dim,
+                 'parallel_scale': parallel_scale, 'meridional_scale': meridional_scale}
+    components = [component for component in ('du/dx', 'du/dy', 'dv/dx', 'dv/dy')
+                  if any(component in _BUNDLE_DERIVATIVES[name] for name in outputs)]
+    derivs = dict(zip(components, vector_derivative(u, v, return_only=components,
+                                                    **grid_args), strict=True))
+
+    def calc_frontogenesis():
+        ddy_theta, ddx_theta = geospatial_gradient(potential_temperature,
+                                                   return_only=('df/dy', 'df/dx'),
+                                                   **grid_args)
+        return _frontogenesis(ddx_theta, ddy_theta, derivs['du/dx'], derivs['du/dy'],
+                              derivs['dv/dx'], derivs['dv/dy'])
+
+    def calc_q_vector():
+        dtempdx, dtempdy = geospatial_gradient(temperature, **grid_args)
+        return _q_vector(derivs['du/dx'], derivs['du/dy'], derivs['dv/dx'], derivs['dv/dy'],
+                         dtempdx, dtempdy, pressure, static_stability)
+
+    calcs = {
+        'vorticity': lambda: derivs['dv/dx'] - derivs['du/dy'],
+        'absolute_vorticity': lambda: (derivs['dv/dx'] - derivs['du/dy']
+                                       + coriolis_parameter(latitude)),
+        'divergence': lambda: derivs['du/dx'] + derivs['dv/dy'],
+        'shearing_deformation': lambda: derivs['dv/dx'] + derivs['du/dy'],
+        'stretching_deformation': lambda: derivs['du/dx'] - derivs['dv/dy'],
+        'total_deformation': lambda: np.sqrt((derivs['dv/dx'] + derivs['du/dy'])**2
+                                             + (derivs['du/dx'] - derivs['dv/dy'])**2),
+        'frontogenesis': calc_frontogenesis,
+        'q_vector': calc_q_vector
+    }
+    return {name: calcs[name]() for name in outputs}
+
+
 @exporter.export
 @parse_grid_arguments
 @preprocess_and_wrap(wrap_like='f', broadcast=('f', 'parallel_scale', 'meridional_scale'))
@@ -13,7 +13,6 @@ except ImportError:
     from numpy import trapz as trapezoid
 
 import scipy.integrate as si
-import scipy.optimize as so
 from scipy.special import lambertw
 import xarray as xr
 
@@ -276,7 +275,8 @@ def water_latent_heat_melting(temperature):
 
 
 @exporter.export
-@preprocess_and_wrap(wrap_like='temperature', broadcast=('temperature', 'dewpoint'))
+@preprocess_and_wrap(wrap_like='temperature', broadcast=('temperature', 'dewpoint'),
+                     lazy='elementwise')
 @process_units(input_dimensionalities={'temperature': '[temperature]',
                                        'dewpoint': '[temperature]'},
                output_dimensionalities='[dimensionless]')
@@ -330,7 +330,7 @@ def relative_humidity_from_dewpoint(temperature, dewpoint, *, phase='liquid'):
 
 
 @exporter.export
-@preprocess_and_wrap(wrap_like='pressure')
+@preprocess_and_wrap(wrap_like='pressure', lazy='elementwise')
 @check_units('[pressure]', '[pressure]')
 def exner_function(pressure, reference_pressure=mpconsts.P0):
     r"""Calculate the Exner function.
@@ -366,7 +366,8 @@ def exner_function(pressure, reference_pressure=mpconsts.P0):
 
 
 @exporter.export
-@preprocess_and_wrap(wrap_like='temperature', broadcast=('pressure', 'temperature'))
+@preprocess_and_wrap(wrap_like='temperature', broadcast=('pressure', 'temperature'),
+                     lazy='elementwise')
 @check_units('[pressure]', '[temperature]')
 def potential_temperature(pressure, temperature):
     r"""Calculate the potential temperature.
@@ -410,7 +411,8 @@ def potential_temperature(pressure, temperature):
 @exporter.export
 @preprocess_and_wrap(
     wrap_like='potential_temperature',
-    broadcast=('pressure', 'potential_temperature')
+    broadcast=('pressure', 'potential_temperature'),
+    lazy='elementwise'
 )
 @check_units('[pressure]', '[temperature]')
 def temperature_from_potential_temperature(pressure, potential_temperature):
@@ -517,6 +519,7 @@ def dry_lapse(pressure, temperature, reference_pressure=None, vertical_dim=0):
 
 
 @exporter.export
+@add_vertical_dim_from_xarray
 @preprocess_and_wrap(
     wrap_like='temperature',
     broadcast=('pressure', 'temperature', 'reference_pressure')
@@ -529,7 +532,7 @@ def dry_lapse(pressure, temperature, reference_pressure=None, vertical_dim=0):
     },
     '[temperature]'
 )
-def moist_lapse(pressure, temperature, reference_pressure=None):
+def moist_lapse(pressure, temperature, reference_pressure=None, vertical_dim=0):
     r"""Calculate the temperature at a level assuming liquid saturation processes.
 
     This function lifts a parcel starting at `temperature`. The starting pressure can
@@ -548,6 +551,10 @@ def moist_lapse(pressure, temperature, reference_pressure=None):
         Reference pressure; if not given, it defaults to the first element of the
         pressure array.
 
+    vertical_dim : int, optional
+        The axis corresponding to vertical when `pressure` has more than one dimension,
+        defaults to 0. Automatically determined from xarray DataArray arguments.
+
     Returns
     -------
     `pint.Quantity`
@@ -577,13 +584,27 @@ def moist_lapse(pressure, temperature, reference_pressure=None):
 
     This equation comes from [Bakhshaii2013]_.
 
-    Only reliably functions on 1D profiles (not higher-dimension vertical cross sections or
-    grids).
+    When `pressure` has more than one dimension (e.g. a grid of columns), every column is
+    integrated at once using fixed-step fourth-order Runge-Kutta in log-pressure. In that
+    case `temperature` and `reference_pressure` give the starting point of each column; they
+    may either lack the vertical dimension or span it, in which case the value at the first
+    vertical level is used.
 
     .. versionchanged:: 1.0
        Renamed ``ref_pressure`` parameter to ``reference_pressure``
 
     """
+    if np.ndim(pressure) > 1:
+        pressure = np.asarray(pressure)
+        vertical_dim = vertical_dim % pressure.ndim
+        temperature = _column_start(temperature, pressure.ndim, vertical_dim)
+        if reference_pressure is None:
+            reference_pressure = np.take(pressure, [0], axis=vertical_dim)
+        else:
+            reference_pressure = _column_start(reference_pressure, pressure.ndim,
+                                               vertical_dim)
+        return _moist_lapse_columns(pressure, temperature, reference_pressure, vertical_dim)
+
     def dt(p, t):
         rs = saturation_mixing_ratio._nounit(p, t)
         frac = (
@@ -654,6 +675,88 @@ def moist_lapse(pressure, temperature, reference_pressure=None):
     return ret.squeeze()
 
 
+def _column_start(values, ndim, vertical_dim):
+    """Reshape per-column starting values to broadcast against an N-D column array.
+
+    Values lacking the vertical dimension have it inserted with length one; values that
+    already span it are reduced to their first vertical level.
+    """
+    values = np.asarray(values)
+    if values.ndim == ndim:
+        return np.take(values, [0], axis=vertical_dim)
+    elif values.ndim == ndim - 1:
+        return np.expand_dims(values, vertical_dim)
+    return np.reshape(values, (1,) * (ndim - values.ndim) + values.shape)
+
+
+def _moist_lapse_columns(pressure, temperature, reference_pressure, vertical_dim,
+                         max_step=0.05):
+    """Integrate moist pseudo-adiabats for many columns at once.
+
+    Works on unitless (SI) arrays. `temperature` and `reference_pressure` must have length
+    one along `vertical_dim`. Each column is marched level by level from its reference
+    pressure with a fixed-step fourth-order Runge-Kutta scheme in log-pressure, taking
+    steps no larger than ``max_step``. Levels above and below the reference pressure are
+    integrated in separate passes, which lets columns with differing reference pressures
+    share the same sequence of steps.
+    """
+    def dt_dlogp(p, t):
+        rs = saturation_mixing_ratio._nounit(p, t)
+        return (
+            (mpconsts.nounit.Rd * t + mpconsts.nounit.Lv * rs)
+            / (mpconsts.nounit.Cp_d + (
+                mpconsts.nounit.Lv * mpconsts.nounit.Lv * rs * mpconsts.nounit.epsilon
+                / (mpconsts.nounit.Rd * t**2)
+            ))
+        )
+
+    def integrate(log_p, t, log_p_target):
+        span = log_p_target - log_p
+        max_span = np.nanmax(np.abs(span), initial=0)
+        n_steps = int(np.ceil(max_span / max_step))
+        h = span / max(n_steps, 1)
+        for _ in range(n_steps):
+            k1 = dt_dlogp(np.exp(log_p), t)
+            k2 = dt_dlogp(np.exp(log_p + h / 2), t + h / 2 * k1)
+            k3 = dt_dlogp(np.exp(log_p + h / 2), t + h / 2 * k2)
+            k4 = dt_dlogp(np.exp(log_p + h), t + h * k3)
+            t = t + h / 6 * (k1 + 2 * k2 + 2 * k3 + k4)
+            log_p = log_p + h
+        return t
+
+    pressure, temperature, reference_pressure = (
+        np.moveaxis(a, vertical_dim, 0) for a in (pressure, temperature, reference_pressure))
+    shape = np.broadcast_shapes(pressure.shape, temperature.shape, reference_pressure.shape)
+    log_p = np.log(np.broadcast_to(pressure, shape))
+    start_t = np.broadcast_to(temperature[0], shape[1:])
+    log_ref = np.log(np.broadcast_to(reference_pressure[0], shape[1:]))
+
+    # March upward (towards lower pressure) visiting levels from high to low pressure, and
+    # downward visiting them from low to high. Clipping the target to the reference keeps
+    # each column at its starting point until the march reaches its side of the reference.
+    levels = np.arange(shape[0])
+    if np.nansum(np.diff(log_p, axis=0)) > 0:
+        levels = levels[::-1]
+
+    above = np.empty(shape, dtype=np.result_type(start_t, log_p))
+    t, log_p_cur = start_t, log_ref
+    for level in levels:
+        target = np.fmin(log_p[level], log_ref)
+        t = integrate(log_p_cur, t, target)
+        above[level], log_p_cur = t, target
+
+    below = np.empty_like(above)
+    t, log_p_cur = start_t, log_ref
+    for level in levels[::-1]:
+        target = np.fmax(log_p[level], log_ref)
+        t = integrate(log_p_cur, t, target)
+        below[level], log_p_cur = t, target
+
+    ret = np.where(log_p < log_ref, above, below)
+    ret[np.isnan(log_p)] = np.nan
+    return np.moveaxis(ret, 0, vertical_dim)
+
+
 @exporter.export
 @preprocess_and_wrap()
 @process_units(
@@ -844,10 +947,11 @@ def ccl(pressure, temperature, dewpoint, height=None, mixed_layer_depth=None, wh
 
 
 @exporter.export
+@add_vertical_dim_from_xarray
 @preprocess_and_wrap()
 @check_units('[pressure]', '[temperature]', '[temperature]', '[temperature]')
 def lfc(pressure, temperature, dewpoint, parcel_temperature_profile=None, dewpoint_start=None,
-        which='top'):
+        which='top', vertical_dim=0):
     r"""Calculate the level of free convection (LFC).
 
     This works by finding the first intersection of the ideal parcel path and
@@ -882,6 +986,10 @@ def lfc(pressure, temperature, dewpoint, parcel_temperature_profile=None, dewpoi
         'wide' returns the LFC whose corresponding EL is farthest away,
         'most_cape' returns the LFC that results in the most CAPE in the profile.
 
+    vertical_dim : int, optional
+        The axis corresponding to vertical when the profiles have more than one dimension,
+        defaults to 0. Automatically determined from xarray DataArray arguments.
+
     Returns
     -------
     `pint.Quantity`
@@ -920,14 +1028,32 @@ def lfc(pressure, temperature, dewpoint, parcel_temperature_profile=None, dewpoi
 
     Notes
     -----
-    Only functions on 1D profiles (not higher-dimension vertical cross sections or grids).
-    Since this function returns scalar values when given a profile, this will return Pint
-    Quantities even when given xarray DataArray profiles.
+    When given more than one dimension (e.g. a grid of columns), every column along
+    `vertical_dim` is calculated at once and the LFC is returned for each column; only
+    ``which='top'`` and ``which='bottom'`` are supported in that case. Missing (NaN) levels
+    are skipped in each column. Since this function returns scalar values when given a
+    profile, this will return Pint Quantities even when given xarray DataArray profiles.
 
     .. versionchanged:: 1.0
        Renamed ``dewpt``,``dewpoint_start`` parameters to ``dewpoint``, ``dewpoint_start``
 
     """
+    if np.ndim(temperature) > 1:
+        if parcel_temperature_profile is None:
+            press, temp, dewp = _columns_last(pressure, temperature, dewpoint,
+                                              vertical_dim=vertical_dim)
+            press, temp, dewp, profile = _parcel_profile_with_lcl_columns_nounit(
+                press, temp, dewp)
+        else:
+            press, temp, dewp, profile = _columns_last(pressure, temperature, dewpoint,
+                                                       parcel_temperature_profile,
+                                                       vertical_dim=vertical_dim)
+        if dewpoint_start is not None:
+            dewpoint_start = dewpoint_start.m_as('K')
+        x, y = _lfc_columns(press, temp, dewp, profile, which, dewpoint_start)
+        return (units.Quantity(x, 'Pa').to(pressure.units),
+                units.Quantity(y, 'K').to(temperature.units))
+
     # Default to surface parcel if no profile or starting pressure level is given
     if parcel_temperature_profile is None:
         pressure, temperature, dewpoint = _remove_nans(pressure, temperature, dewpoint)
@@ -1065,9 +1191,11 @@ def _most_cape_option(intersect_type, p_list, t_list, pressure, temperature, dew
 
 
 @exporter.export
+@add_vertical_dim_from_xarray
 @preprocess_and_wrap()
 @check_units('[pressure]', '[temperature]', '[temperature]', '[temperature]')
-def el(pressure, temperature, dewpoint, parcel_temperature_profile=None, which='top'):
+def el(pressure, temperature, dewpoint, parcel_temperature_profile=None, which='top',
+       vertical_dim=0):
     r"""Calculate the equilibrium level.
 
     This works by finding the last intersection of the ideal parcel path and
@@ -1096,6 +1224,10 @@ def el(pressure, temperature, dewpoint, parcel_temperature_profile=None, which='
         'wide' returns the EL whose corresponding LFC is farthest away.
         'most_cape' returns the EL that results in the most CAPE in the profile.
 
+    vertical_dim : int, optional
+        The axis corresponding to vertical when the profiles have more than one dimension,
+        defaults to 0. Automatically determined from xarray DataArray arguments.
+
     Returns
     -------
     `pint.Quantity`
@@ -1136,14 +1268,30 @@ def el(pressure, temperature, dewpoint, parcel_temperature_profile=None, which='
 
     Notes
     -----
-    Only functions on 1D profiles (not higher-dimension vertical cross sections or grids).
-    Since this function returns scalar values when given a profile, this will return Pint
-    Quantities even when given xarray DataArray profiles.
+    When given more than one dimension (e.g. a grid of columns), every column along
+    `vertical_dim` is calculated at once and the EL is returned for each column; only
+    ``which='top'`` and ``which='bottom'`` are supported in that case. Missing (NaN) levels
+    are skipped in each column. Since this function returns scalar values when given a
+    profile, this will return Pint Quantities even when given xarray DataArray profiles.
 
     .. versionchanged:: 1.0
        Renamed ``dewpt`` parameter to ``dewpoint``
 
     """
+    if np.ndim(temperature) > 1:
+        if parcel_temperature_profile is None:
+            press, temp, dewp = _columns_last(pressure, temperature, dewpoint,
+                                              vertical_dim=vertical_dim)
+            press, temp, dewp, profile = _parcel_profile_with_lcl_columns_nounit(
+                press, temp, dewp)
+        else:
+            press, temp, dewp, profile = _columns_last(pressure, temperature, dewpoint,
+                                                       parcel_temperature_profile,
+                                                       vertical_dim=vertical_dim)
+        x, y = _el_columns(press, temp, dewp, profile, which)
+        return (units.Quantity(x, 'Pa').to(pressure.units),
+                units.Quantity(y, 'K').to(temperature.units))
+
     # Default to surface parcel if no profile or starting pressure level is given
     if parcel_temperature_profile is None:
         pressure, temperature, dewpoint = _remove_nans(pressure, temperature, dewpoint)
@@ -1175,9 +1323,10 @@ def el(pressure, temperature, dewpoint, parcel_temperature_profile=None, which='
 
 
 @exporter.export
+@add_vertical_dim_from_xarray
 @preprocess_and_wrap(wrap_like='pressure')
 @check_units('[pressure]', '[temperature]', '[temperature]')
-def parcel_profile(pressure, temperature, dewpoint):
+def parcel_profile(pressure, temperature, dewpoint, vertical_dim=0):
     r"""Calculate the profile a parcel takes through the atmosphere.
 
     The parcel starts at `temperature`, and `dewpoint`, lifted up
@@ -1196,6 +1345,10 @@ def parcel_profile(pressure, temperature, dewpoint):
     dewpoint : `pint.Quantity`
         Starting dewpoint
 
+    vertical_dim : int, optional
+        The axis corresponding to vertical when `pressure` has more than one dimension,
+        defaults to 0. Automatically determined from xarray DataArray arguments.
+
     Returns
     -------
     `pint.Quantity`
@@ -1236,7 +1389,9 @@ def parcel_profile(pressure, temperature, dewpoint):
 
     Notes
     -----
-    Only functions on 1D profiles (not higher-dimension vertical cross sections or grids).
+    When `pressure` has more than one dimension (e.g. a grid of columns), parcel profiles
+    for every column are calculated at once, with `temperature` and `dewpoint` giving the
+    starting point of each column (see `moist_lapse`).
     Duplicate pressure levels return duplicate parcel temperatures. Consider preprocessing
     low-precision, high frequency profiles with tools like `scipy.medfilt`,
     `pandas.drop_duplicates`, or `numpy.unique`.
@@ -1248,14 +1403,19 @@ def parcel_profile(pressure, temperature, dewpoint):
        Renamed ``dewpt`` parameter to ``dewpoint``
 
     """
+    if np.ndim(pressure) > 1:
+        _, _, profile = _parcel_profile_columns(pressure, temperature, dewpoint, vertical_dim)
+        return profile.to(temperature.units)
+
     _, _, _, t_l, _, t_u = _parcel_profile_helper(pressure, temperature, dewpoint)
     return concatenate((t_l, t_u))
 
 
 @exporter.export
+@add_vertical_dim_from_xarray
 @preprocess_and_wrap()
 @check_units('[pressure]', '[temperature]', '[temperature]')
-def parcel_profile_with_lcl(pressure, temperature, dewpoint):
+def parcel_profile_with_lcl(pressure, temperature, dewpoint, vertical_dim=0):
     r"""Calculate the profile a parcel takes through the atmosphere.
 
     The parcel starts at `temperature`, and `dewpoint`, lifted up
@@ -1277,6 +1437,10 @@ def parcel_profile_with_lcl(pressure, temperature, dewpoint):
         Atmospheric dewpoint at the levels in `pressure`. The first entry should be at
         the same level as the first `pressure` data point.
 
+    vertical_dim : int, optional
+        The axis corresponding to vertical for gridded input, defaults to 0. Automatically
+        determined from xarray DataArray arguments.
+
     Returns
     -------
     pressure : `pint.Quantity`
@@ -1322,7 +1486,10 @@ def parcel_profile_with_lcl(pressure, temperature, dewpoint):
 
     Notes
     -----
-    Only functions on 1D profiles (not higher-dimension vertical cross sections or grids).
+    When `temperature` and `dewpoint` have more than one dimension (e.g. a grid of columns),
+    profiles for every column are calculated at once. `pressure` may then either match
+    their shape or be 1D along `vertical_dim`, and each returned array gains one level
+    along `vertical_dim` for the LCL of its column.
     Duplicate pressure levels return duplicate parcel temperatures. Consider preprocessing
     low-precision, high frequency profiles with tools like `scipy.medfilt`,
     `pandas.drop_duplicates`, or `numpy.unique`.
@@ -1334,6 +1501,10 @@ def parcel_profile_with_lcl(pressure, temperature, dewpoint):
        Renamed ``dewpt`` parameter to ``dewpoint``
 
     """
+    if np.ndim(pressure) > 1 or np.ndim(temperature) > 1:
+        return _parcel_profile_with_lcl_columns(pressure, temperature, dewpoint,
+                                                vertical_dim)
+
     p_l, p_lcl, p_u, t_l, t_lcl, t_u = _parcel_profile_helper(pressure, temperature[0],
                                                               dewpoint[0])
     new_press = concatenate((p_l, p_lcl, p_u))
@@ -1413,19 +1584,20 @@ def parcel_profile_with_lcl_as_dataset(pressure, temperature, dewpoint):
     )
 
 
-def _check_pressure(pressure):
+def _check_pressure(pressure, vertical_dim=0):
     """Check that pressure does not increase.
 
     Returns True if the pressure does not increase from one level to the next;
     otherwise, returns False.
 
     """
-    return np.all(pressure[:-1] >= pressure[1:])
+    pressure = np.moveaxis(pressure, vertical_dim, 0)
+    return not np.any(pressure[:-1] < pressure[1:])
 
 
-def _check_pressure_error(pressure):
+def _check_pressure_error(pressure, vertical_dim=0):
     """Raise an `InvalidSoundingError` if _check_pressure returns False."""
-    if not _check_pressure(pressure):
+    if not _check_pressure(pressure, vertical_dim):
         raise InvalidSoundingError('Pressure increases between at least two points in '
                                    'your sounding. Using scipy.signal.medfilt may fix this.')
 
@@ -1475,6 +1647,88 @@ def _parcel_profile_helper(pressure, temperature, dewpoint):
             temp_lower[:-1], temp_lcl, temp_upper[1:])
 
 
+def _parcel_profile_columns(pressure, temperature, dewpoint, vertical_dim):
+    """Help calculate parcel profiles for many columns at once.
+
+    Returns the LCL pressure and temperature of each column, with length one along
+    `vertical_dim`, and the parcel temperature at every level of `pressure`.
+
+    """
+    _check_pressure_error(pressure, vertical_dim)
+
+    press = pressure.m_as('Pa')
+    vertical_dim = vertical_dim % press.ndim
+    temp = _column_start(temperature.m_as('K'), press.ndim, vertical_dim)
+    dewp = _column_start(dewpoint.m_as('K'), press.ndim, vertical_dim)
+
+    # Lift dry adiabatically from the first level to the LCL, then moist adiabatically
+    # starting from the dry adiabat's temperature at the LCL pressure
+    press_start = np.take(press, [0], axis=vertical_dim)
+    press_lcl, temp_lcl = lcl._nounit(press_start, temp, dewp)
+    temp_dry = temp * (press / press_start) ** mpconsts.nounit.kappa
+    temp_moist = _moist_lapse_columns(
+        press, temp * (press_lcl / press_start) ** mpconsts.nounit.kappa, press_lcl,
+        vertical_dim)
+    profile = np.where(press >= press_lcl, temp_dry, temp_moist)
+
+    return (units.Quantity(press_lcl, 'Pa'), units.Quantity(temp_lcl, 'K'),
+            units.Quantity(profile, 'K'))
+
+
+def _parcel_profile_with_lcl_columns(pressure, temperature, dewpoint, vertical_dim):
+    """Calculate parcel profiles including the LCL for many columns at once."""
+    ndim = max(np.ndim(pressure), np.ndim(temperature))
+    vertical_dim = vertical_dim % ndim
+    if np.ndim(pressure) == 1:
+        shape = [1] * ndim
+        shape[vertical_dim] = -1
+        pressure = pressure.reshape(shape)
+    shape = np.broadcast_shapes(pressure.shape, temperature.shape, dewpoint.shape)
+    press = np.broadcast_to(pressure.m, shape)
+    temp = np.broadcast_to(temperature.m, shape)
+    dewp = np.broadcast_to(dewpoint.m, shape)
+
+    press_lcl, temp_lcl, profile = _parcel_profile_columns(
+        units.Quantity(press, pressure.units), units.Quantity(temp, temperature.units),
+        units.Quantity(dewp, dewpoint.units), vertical_dim)
+    press_lcl = press_lcl.m_as(pressure.units)
+    temp_lcl = temp_lcl.m_as(temperature.units)
+    profile = profile.m_as(temperature.units)
+
+    # The LCL goes after all levels at or below it in each column
+    num_levels = shape[vertical_dim]
+    loc = np.sum(press >= press_lcl, axis=vertical_dim, keepdims=True)
+    index_shape = [1] * len(shape)
+    index_shape[vertical_dim] = num_levels + 1
+    index = np.arange(num_levels + 1).reshape(index_shape)
+    at_lcl = index == loc
+    source = np.minimum(index - (index > loc), num_levels - 1)
+
+    # Ambient values at the LCL come from linear interpolation in pressure, and are
+    # undefined if the LCL lies outside of the column
+    below = np.maximum(loc - 1, 0)
+    above = np.minimum(loc, num_levels - 1)
+    press_below = np.take_along_axis(press, below, axis=vertical_dim)
+    press_above = np.take_along_axis(press, above, axis=vertical_dim)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        weight = (press_lcl - press_below) / (press_above - press_below)
+    weight = np.where((loc > 0) & (loc < num_levels), weight, np.nan)
+
+    def insert_lcl(values, lcl_values):
+        values = np.broadcast_to(values, shape)
+        if lcl_values is None:
+            lower = np.take_along_axis(values, below, axis=vertical_dim)
+            upper = np.take_along_axis(values, above, axis=vertical_dim)
+            lcl_values = lower + weight * (upper - lower)
+        return np.where(at_lcl, lcl_values,
+                        np.take_along_axis(values, source, axis=vertical_dim))
+
+    return (units.Quantity(insert_lcl(press, press_lcl), pressure.units),
+            units.Quantity(insert_lcl(temp, None), temperature.units),
+            units.Quantity(insert_lcl(dewp, None), dewpoint.units),
+            units.Quantity(insert_lcl(profile, temp_lcl), temperature.units))
+
+
 def _insert_lcl_level(pressure, temperature, lcl_pressure):
     """Insert the LCL pressure into the profile."""
     interp_temp = interpolate_1d(lcl_pressure, pressure, temperature)
@@ -1486,7 +1740,8 @@ def _insert_lcl_level(pressure, temperature, lcl_pressure):
 
 
 @exporter.export
-@preprocess_and_wrap(wrap_like='mixing_ratio', broadcast=('pressure', 'mixing_ratio'))
+@preprocess_and_wrap(wrap_like='mixing_ratio', broadcast=('pressure', 'mixing_ratio'),
+                     lazy='elementwise')
 @process_units({'pressure': '[pressure]', 'mixing_ratio': '[dimensionless]'}, '[pressure]')
 def vapor_pressure(pressure, mixing_ratio):
     r"""Calculate water vapor (partial) pressure.
@@ -1533,7 +1788,7 @@ def vapor_pressure(pressure, mixing_ratio):
 
 
 @exporter.export
-@preprocess_and_wrap(wrap_like='temperature')
+@preprocess_and_wrap(wrap_like='temperature', lazy='elementwise')
 @process_units({'temperature': '[temperature]'}, '[pressure]')
 def saturation_vapor_pressure(temperature, *, phase='liquid'):
     r"""Calculate the saturation (equilibrium) water vapor (partial) pressure.
@@ -1673,7 +1928,8 @@ def _saturation_vapor_pressure_solid(temperature):
 
 
 @exporter.export
-@preprocess_and_wrap(wrap_like='temperature', broadcast=('temperature', 'relative_humidity'))
+@preprocess_and_wrap(wrap_like='temperature', broadcast=('temperature', 'relative_humidity'),
+                     lazy='elementwise')
 @check_units('[temperature]', '[dimensionless]')
 def dewpoint_from_relative_humidity(temperature, relative_humidity):
     r"""Calculate the ambient dewpoint given air temperature and relative humidity.
@@ -1712,7 +1968,7 @@ def dewpoint_from_relative_humidity(temperature, relative_humidity):
 
 
 @exporter.export
-@preprocess_and_wrap(wrap_like='vapor_pressure')
+@preprocess_and_wrap(wrap_like='vapor_pressure', lazy='elementwise')
 @process_units({'vapor_pressure': '[pressure]'}, '[temperature]', output_to=units.degC)
 def dewpoint(vapor_pressure):
     r"""Calculate the ambient dewpoint given the vapor pressure.
@@ -1755,7 +2011,8 @@ def dewpoint(vapor_pressure):
 
 
 @exporter.export
-@preprocess_and_wrap(wrap_like='partial_press', broadcast=('partial_press', 'total_press'))
+@preprocess_and_wrap(wrap_like='partial_press', broadcast=('partial_press', 'total_press'),
+                     lazy='elementwise')
 @process_units(
     {
         'partial_press': '[pressure]',
@@ -1816,7 +2073,8 @@ def mixing_ratio(partial_press, total_press, molecular_weight_ratio=mpconsts.nou
 
 
 @exporter.export
-@preprocess_and_wrap(wrap_like='temperature', broadcast=('total_press', 'temperature'))
+@preprocess_and_wrap(wrap_like='temperature', broadcast=('total_press', 'temperature'),
+                     lazy='elementwise')
 @process_units(
     {'total_press': '[pressure]', 'temperature': '[temperature]'},
     '[dimensionless]'
@@ -1882,7 +2140,8 @@ def saturation_mixing_ratio(total_press, temperature, *, phase='liquid'):
 @exporter.export
 @preprocess_and_wrap(
     wrap_like='temperature',
-    broadcast=('pressure', 'temperature', 'dewpoint')
+    broadcast=('pressure', 'temperature', 'dewpoint'),
+    lazy='elementwise'
 )
 @check_units('[pressure]', '[temperature]', '[temperature]')
 def equivalent_potential_temperature(pressure, temperature, dewpoint):
@@ -1946,7 +2205,8 @@ def equivalent_potential_temperature(pressure, temperature, dewpoint):
 
 
 @exporter.export
-@preprocess_and_wrap(wrap_like='temperature', broadcast=('pressure', 'temperature'))
+@preprocess_and_wrap(wrap_like='temperature', broadcast=('pressure', 'temperature'),
+                     lazy='elementwise')
 @check_units('[pressure]', '[temperature]')
 def saturation_equivalent_potential_temperature(pressure, temperature):
     r"""Calculate saturation equivalent potential temperature.
@@ -2072,7 +2332,8 @@ def wet_bulb_potential_temperature(pressure, temperature, dewpoint):
 
 
 @exporter.export
-@preprocess_and_wrap(wrap_like='temperature', broadcast=('temperature', 'mixing_ratio'))
+@preprocess_and_wrap(wrap_like='temperature', broadcast=('temperature', 'mixing_ratio'),
+                     lazy='elementwise')
 @process_units(
     {
         'temperature': '[temperature]',
@@ -2198,7 +2459,8 @@ def virtual_temperature_from_dewpoint(
 @exporter.export
 @preprocess_and_wrap(
     wrap_like='temperature',
-    broadcast=('pressure', 'temperature', 'mixing_ratio')
+    broadcast=('pressure', 'temperature', 'mixing_ratio'),
+    lazy='elementwise'
 )
 @check_units('[pressure]', '[temperature]', '[dimensionless]', '[dimensionless]')
 def virtual_potential_temperature(pressure, temperature, mixing_ratio,
@@ -2251,7 +2513,8 @@ def virtual_potential_temperature(pressure, temperature, mixing_ratio,
 @exporter.export
 @preprocess_and_wrap(
     wrap_like='temperature',
-    broadcast=('pressure', 'temperature', 'mixing_ratio')
+    broadcast=('pressure', 'temperature', 'mixing_ratio'),
+    lazy='elementwise'
 )
 @check_units('[pressure]', '[temperature]', '[dimensionless]', '[dimensionless]')
 def density(pressure, temperature, mixing_ratio, molecular_weight_ratio=mpconsts.epsilon):
@@ -2436,7 +2699,8 @@ def psychrometric_vapor_pressure_wet(pressure, dry_bulb_temperature, wet_bulb_te
 @exporter.export
 @preprocess_and_wrap(
     wrap_like='temperature',
-    broadcast=('pressure', 'temperature', 'relative_humidity')
+    broadcast=('pressure', 'temperature', 'relative_humidity'),
+    lazy='elementwise'
 )
 @check_units('[pressure]', '[temperature]', '[dimensionless]')
 def mixing_ratio_from_relative_humidity(
@@ -2506,7 +2770,8 @@ def mixing_ratio_from_relative_humidity(
 @exporter.export
 @preprocess_and_wrap(
     wrap_like='temperature',
-    broadcast=('pressure', 'temperature', 'mixing_ratio')
+    broadcast=('pressure', 'temperature', 'mixing_ratio'),
+    lazy='elementwise'
 )
 @check_units('[pressure]', '[temperature]', '[dimensionless]')
 def relative_humidity_from_mixing_ratio(
@@ -2569,7 +2834,7 @@ def relative_humidity_from_mixing_ratio(
 
 
 @exporter.export
-@preprocess_and_wrap(wrap_like='specific_humidity')
+@preprocess_and_wrap(wrap_like='specific_humidity', lazy='elementwise')
 @process_units({'specific_humidity': '[dimensionless]'}, '[dimensionless]')
 def mixing_ratio_from_specific_humidity(specific_humidity):
     r"""Calculate the mixing ratio from specific humidity.
@@ -2611,7 +2876,7 @@ def mixing_ratio_from_specific_humidity(specific_humidity):
 
 
 @exporter.export
-@preprocess_and_wrap(wrap_like='mixing_ratio')
+@preprocess_and_wrap(wrap_like='mixing_ratio', lazy='elementwise')
 @process_units({'mixing_ratio': '[dimensionless]'}, '[dimensionless]')
 def specific_humidity_from_mixing_ratio(mixing_ratio):
     r"""Calculate the specific humidity from the mixing ratio.
@@ -2653,7 +2918,8 @@ def specific_humidity_from_mixing_ratio(mixing_ratio):
 @exporter.export
 @preprocess_and_wrap(
     wrap_like='temperature',
-    broadcast=('pressure', 'temperature', 'specific_humidity')
+    broadcast=('pressure', 'temperature', 'specific_humidity'),
+    lazy='elementwise'
 )
 @check_units('[pressure]', '[temperature]', '[dimensionless]')
 def relative_humidity_from_specific_humidity(
@@ -2720,10 +2986,11 @@ def relative_humidity_from_specific_humidity(
 
 
 @exporter.export
+@add_vertical_dim_from_xarray
 @preprocess_and_wrap()
 @check_units('[pressure]', '[temperature]', '[temperature]', '[temperature]')
 def cape_cin(pressure, temperature, dewpoint, parcel_profile, which_lfc='bottom',
-             which_el='top'):
+             which_el='top', vertical_dim=0):
     r"""Calculate CAPE and CIN.
 
     Calculate the convective available potential energy (CAPE) and convective inhibition (CIN)
@@ -2754,6 +3021,10 @@ def cape_cin(pressure, temperature, dewpoint, parcel_profile, which_lfc='bottom'
         Choose which EL to integrate to. Valid options are 'top', 'bottom', 'wide',
         and 'most_cape'. Default is 'top'.
 
+    vertical_dim : int, optional
+        The axis corresponding to vertical when the profiles have more than one dimension,
+        defaults to 0. Automatically determined from xarray DataArray arguments.
+
     Returns
     -------
     `pint.Quantity`
@@ -2814,14 +3085,24 @@ def cape_cin(pressure, temperature, dewpoint, parcel_profile, which_lfc='bottom'
     * :math:`T_{{v}_{env}}` is environment virtual temperature
     * :math:`p` is atmospheric pressure
 
-    Only functions on 1D profiles (not higher-dimension vertical cross sections or grids).
-    Since this function returns scalar values when given a profile, this will return Pint
-    Quantities even when given xarray DataArray profiles.
+    When given more than one dimension (e.g. a grid of columns), every column along
+    `vertical_dim` is calculated at once and CAPE and CIN are returned for each column;
+    only the 'top' and 'bottom' options for `which_lfc` and `which_el` are supported in
+    that case. Missing (NaN) levels are skipped in each column. Since this function returns
+    scalar values when given a profile, this will return Pint Quantities even when given
+    xarray DataArray profiles.
 
     .. versionchanged:: 1.0
        Renamed ``dewpt`` parameter to ``dewpoint``
 
     """
+    if np.ndim(temperature) > 1:
+        cape, cin = _cape_cin_columns(*_columns_last(pressure, temperature, dewpoint,
+                                                     parcel_profile,
+                                                     vertical_dim=vertical_dim),
+                                      which_lfc=which_lfc, which_el=which_el)
+        return units.Quantity(cape, 'J/kg'), units.Quantity(cin, 'J/kg')
+
     pressure, temperature, dewpoint, parcel_profile = _remove_nans(pressure, temperature,
                                                                    dewpoint, parcel_profile)
 
@@ -2925,6 +3206,295 @@ def _find_append_zero_crossings(x, y):
     return x, y
 
 
+def _columns_last(pressure, *args, vertical_dim=0):
+    """Prepare many soundings of pressure and temperatures for column-wise calculations.
+
+    Returns unitless arrays (in Pa and K) broadcast against each other, with the vertical
+    dimension last, ordered from high to low pressure, and with any levels that have missing
+    values moved to the top of their column.
+
+    """
+    ndim = max(np.ndim(pressure), *(np.ndim(arg) for arg in args))
+    vertical_dim = vertical_dim % ndim
+    if np.ndim(pressure) == 1:
+        shape = [1] * ndim
+        shape[vertical_dim] = -1
+        pressure = pressure.reshape(shape)
+    arrays = [pressure.m_as('Pa')] + [arg.m_as('K') for arg in args]
+    shape = np.broadcast_shapes(*(a.shape for a in arrays))
+    arrays = [np.moveaxis(np.broadcast_to(a, shape), vertical_dim, -1) for a in arrays]
+    if np.nansum(np.diff(arrays[0], axis=-1)) > 0:
+        arrays = [a[..., ::-1] for a in arrays]
+    return _compact_columns(np.all(np.isfinite(arrays), axis=0), *arrays)
+
+
+def _compact_columns(valid, *args):
+    """Move invalid levels to the end of each column, keeping the others in order."""
+    order = np.argsort(~valid, axis=-1, kind='stable')
+    valid = np.take_along_axis(valid, order, axis=-1)
+    return [np.where(valid, np.take_along_axis(arg, order, axis=-1), np.nan) for arg in args]
+
+
+def _column_top(values):
+    """Return the value at the lowest pressure valid level of each compacted column."""
+    top = np.maximum(np.sum(~np.isnan(values), axis=-1, keepdims=True) - 1, 0)
+    return np.take_along_axis(values, top, axis=-1)[..., 0]
+
+
+def _column_layer_depth(kwargs, default):
+    """Get the layer depth (in Pa) for the column-wise parcel selection."""
+    depth = kwargs.pop('depth', None)
+    if kwargs:
+        raise ValueError('Only the depth of the layer can be given when calculating for '
+                         f'multiple columns, not {", ".join(kwargs)}.')
+    if depth is None:
+        depth = default
+    if not depth.check('[pressure]'):
+        raise ValueError('Depth must be specified in units of pressure when calculating '
+                         'for multiple columns.')
+    return depth.m_as('Pa')
+
+
+def _column_intersections(pressure, a, b, direction=None, start=0):
+    """Find where two profiles cross within each layer of many columns.
+
+    Works like `find_intersections` with logarithmic interpolation, but returns the
+    pressure and value of `a` at the crossing for every layer between consecutive levels,
+    with NaN for layers without a crossing in the requested direction (1 for increasing, -1
+    for decreasing) or those below the level given by `start`.
+
+    """
+    diff = a - b
+    sign = np.sign(diff)
+    log_p = np.log(pressure)
+    x0, x1 = log_p[..., :-1], log_p[..., 1:]
+    d0, d1 = diff[..., :-1], diff[..., 1:]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        x = (d1 * x0 - d0 * x1) / (d1 - d0)
+        y = ((x - x0) / (x1 - x0)) * (a[..., 1:] - a[..., :-1]) + a[..., :-1]
+
+    found = ((sign[..., :-1] != sign[..., 1:])
+             & (np.arange(diff.shape[-1] - 1) >= np.expand_dims(start, -1)))
+    if direction is not None:
+        found &= sign[..., 1:] == direction
+    return np.exp(np.where(found, x, np.nan)), np.where(found, y, np.nan)
+
+
+def _select_column_intersection(x, y, which):
+    """Choose the intersection with the highest ('bottom') or lowest ('top') pressure."""
+    found = ~np.isnan(x)
+    if which == 'bottom':
+        idx = np.argmax(found, axis=-1)
+    elif which == 'top':
+        idx = found.shape[-1] - 1 - np.argmax(found[..., ::-1], axis=-1)
+    else:
+        raise ValueError(f'Invalid option for "which": {which}. Only "top" and "bottom" '
+                         'are supported when calculating for multiple columns.')
+    idx = idx[..., np.newaxis]
+    return (np.take_along_axis(x, idx, axis=-1)[..., 0],
+            np.take_along_axis(y, idx, axis=-1)[..., 0])
+
+
+def _lfc_columns(pressure, temperature, dewpoint, parcel_temperature_profile, which='top',
+                 dewpoint_start=None):
+    """Calculate the LFC for many columns at once, following `lfc`.
+
+    Works on the unitless, compacted arrays returned by `_columns_last`.
+
+    """
+    if dewpoint_start is None:
+        dewpoint_start = dewpoint[..., 0]
+
+    # Skip a shared first point, as in the 1D calculation
+    start = np.isclose(parcel_temperature_profile[..., 0], temperature[..., 0]).astype(int)
+    x, y = _column_intersections(pressure, parcel_temperature_profile, temperature,
+                                 direction=1, start=start)
+    lcl_p, lcl_t = lcl._nounit(pressure[..., 0], parcel_temperature_profile[..., 0],
+                               dewpoint_start)
+
+    # Only LFCs above the LCL count
+    above_lcl = x < lcl_p[..., np.newaxis]
+    lfc_p, lfc_t = _select_column_intersection(np.where(above_lcl, x, np.nan),
+                                               np.where(above_lcl, y, np.nan), which)
+
+    # Without those, the LFC is the LCL if there is positive area above the LCL (with no
+    # crossings at all) or no EL below the LCL (with crossings only below it); else no LFC.
+    el_p, _ = _column_intersections(pressure, parcel_temperature_profile, temperature,
+                                    direction=-1, start=1)
+    positive_area = np.any((pressure < lcl_p[..., np.newaxis])
+                           & ~_less_or_close(parcel_temperature_profile, temperature),
+                           axis=-1)
+    el_below_lcl = np.fmin.reduce(el_p, axis=-1) > lcl_p
+    use_lcl = ~np.any(above_lcl, axis=-1) & np.where(np.all(np.isnan(x), axis=-1),
+                                                     positive_area, ~el_below_lcl)
+    return np.where(use_lcl, lcl_p, lfc_p), np.where(use_lcl, lcl_t, lfc_t)
+
+
+def _el_columns(pressure, temperature, dewpoint, parcel_temperature_profile, which='top'):
+    """Calculate the EL for many columns at once, following `el`.
+
+    Works on the unitless, compacted arrays returned by `_columns_last`.
+
+    """
+    # There is no EL if the top of the sounding parcel is warmer than the environment
+    warm_top = _column_top(parcel_temperature_profile) > _column_top(temperature)
+
+    x, y = _column_intersections(pressure, parcel_temperature_profile, temperature,
+                                 direction=-1, start=1)
+    lcl_p, _ = lcl._nounit(pressure[..., 0], temperature[..., 0], dewpoint[..., 0])
+    above_lcl = x < lcl_p[..., np.newaxis]
+    el_p, el_t = _select_column_intersection(np.where(above_lcl, x, np.nan),
+                                             np.where(above_lcl, y, np.nan), which)
+
+    exists = ~warm_top & (_select_column_intersection(x, y, 'top')[0] < lcl_p)
+    return np.where(exists, el_p, np.nan), np.where(exists, el_t, np.nan)
+
+
+def _cape_cin_columns(pressure, temperature, dewpoint, parcel_profile, which_lfc='bottom',
+                      which_el='top'):
+    """Calculate CAPE and CIN for many columns at once, following `cape_cin`.
+
+    Works on unitless arrays (in Pa and K) with the vertical dimension last and returns
+    values in J/kg.
+
+    """
+    pressure, temperature, dewpoint, parcel_profile = _compact_columns(
+        np.all(np.isfinite([pressure, temperature, dewpoint, parcel_profile]), axis=0),
+        pressure, temperature, dewpoint, parcel_profile)
+
+    # The mixing ratio of the parcel comes from the dewpoint below the LCL, is saturated
+    # based on the temperature above the LCL
+    pressure_lcl, _ = lcl._nounit(pressure[..., :1], temperature[..., :1], dewpoint[..., :1])
+    parcel_mixing_ratio = np.where(
+        pressure > pressure_lcl,
+        saturation_mixing_ratio._nounit(pressure[..., :1], dewpoint[..., :1]),
+        saturation_mixing_ratio._nounit(pressure, parcel_profile)
+    )
+
+    # Convert the temperature/parcel profile to virtual temperature
+    temperature = virtual_temperature._nounit(
+        temperature, saturation_mixing_ratio._nounit(pressure, dewpoint))
+    parcel_profile = virtual_temperature._nounit(parcel_profile, parcel_mixing_ratio)
+
+    # Limits of integration, using the top of the sounding where there is no EL
+    lfc_pressure, _ = _lfc_columns(pressure, temperature, dewpoint, parcel_profile,
+                                   which=which_lfc)
+    el_pressure, _ = _el_columns(pressure, temperature, dewpoint, parcel_profile,
+                                 which=which_el)
+    el_pressure = np.where(np.isnan(el_pressure), _column_top(pressure), el_pressure)
+
+    # Interleave the levels with the zero crossings of the difference between the parcel
+    # path and measured temperature profiles within the layers above the first
+    y = parcel_profile - temperature
+    x_cross, y_cross = _column_intersections(pressure, y, np.zeros_like(y), start=1)
+    num_points = 2 * pressure.shape[-1] - 1
+    x = np.empty(pressure.shape[:-1] + (num_points,))
+    x[..., ::2], x[..., 1::2] = pressure, x_cross
+    y_all = np.empty_like(x)
+    y_all[..., ::2], y_all[..., 1::2] = y, y_cross
+    log_x = np.log(x)
+
+    def integrate(mask):
+        # Trapezoid rule between each point within the limits and the previous such point,
+        # going from high to low pressure
+        prev = np.maximum.accumulate(np.where(mask, np.arange(num_points), -1), axis=-1)
+        prev = np.concatenate((np.full(prev.shape[:-1] + (1,), -1), prev[..., :-1]),
+                              axis=-1)
+        use = mask & (prev >= 0)
+        prev = np.maximum(prev, 0)
+        area = ((y_all + np.take_along_axis(y_all, prev, axis=-1)) / 2
+                * (np.take_along_axis(log_x, prev, axis=-1) - log_x))
+        return mpconsts.nounit.Rd * np.sum(np.where(use, area, 0), axis=-1)
+
+    lfc_pressure = lfc_pressure[..., np.newaxis]
+    cape = integrate(_less_or_close(x, lfc_pressure)
+                     & _greater_or_close(x, el_pressure[..., np.newaxis]))
+    cin = np.minimum(integrate(_greater_or_close(x, lfc_pressure)), 0)
+
+    # No CAPE or CIN without an LFC, and nothing at all for columns with no data
+    no_lfc = np.isnan(lfc_pressure[..., 0])
+    no_data = np.isnan(pressure[..., 0])
+    cape = np.where(no_data, np.nan, np.where(no_lfc, 0, cape))
+    cin = np.where(no_data, np.nan, np.where(no_lfc, 0, cin))
+    return cape, cin
+
+
+def _parcel_profile_with_lcl_columns_nounit(pressure, temperature, dewpoint):
+    """Calculate surface-based parcel profiles with the LCL on unitless column arrays."""
+    return [a.m for a in _parcel_profile_with_lcl_columns(
+        units.Quantity(pressure, 'Pa'), units.Quantity(temperature, 'K'),
+        units.Quantity(dewpoint, 'K'), -1)]
+
+
+def _most_unstable_columns(pressure, temperature, dewpoint, depth):
+    """Trim compacted columns to start from their most unstable parcel.
+
+    Follows `most_unstable_parcel` for a layer `depth` Pa deep above the first level,
+    without interpolating to the top of the layer.
+
+    """
+    # The top of the layer is the level nearest to the requested pressure
+    dist = np.abs(pressure - (pressure[..., :1] - depth))
+    top = np.argmin(np.where(np.isnan(dist), np.inf, dist), axis=-1, keepdims=True)
+    in_layer = (_less_or_close(pressure, pressure[..., :1])
+                & _greater_or_close(pressure, np.take_along_axis(pressure, top, axis=-1)))
+
+    theta_e = equivalent_potential_temperature(
+        units.Quantity(pressure, 'Pa'), units.Quantity(temperature, 'K'),
+        units.Quantity(dewpoint, 'K')).m_as('K')
+    idx = np.argmax(np.where(in_layer, theta_e, -np.inf), axis=-1, keepdims=True)
+    keep = np.arange(pressure.shape[-1]) >= idx
+    return _compact_columns(keep & ~np.isnan(pressure), pressure, temperature, dewpoint)
+
+
+def _mixed_layer_columns(pressure, temperature, dewpoint, depth):
+    """Replace the mixed layer of compacted columns with its mixed parcel.
+
+    Follows `mixed_parcel` and `mixed_layer` for a layer `depth` Pa deep above the first
+    level, interpolating to the top of the layer, and then removes the levels within the
+    layer as done in `mixed_layer_cape_cin`.
+
+    """
+    bottom = pressure[..., :1]
+    top = bottom - depth
+    inside = _greater_or_close(pressure, top)
+
+    # Last level within the layer, and how far the top of the layer is towards the next
+    # level, in log-pressure
+    last = np.sum(inside, axis=-1, keepdims=True) - 1
+    last_p = np.take_along_axis(pressure, last, axis=-1)
+    next_level = np.minimum(last + 1, pressure.shape[-1] - 1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        weight = ((np.log(top) - np.log(last_p))
+                  / (np.log(np.take_along_axis(pressure, next_level, axis=-1))
+                     - np.log(last_p)))
+    interp_top = ~np.isclose(last_p, top)
+    actual_depth = bottom - np.where(interp_top, top, last_p)
+    both_inside = inside[..., :-1] & inside[..., 1:]
+
+    def mix(values):
+        area = np.sum(np.where(both_inside, (values[..., :-1] + values[..., 1:]) / 2
+                               * (pressure[..., :-1] - pressure[..., 1:]), 0),
+                      axis=-1, keepdims=True)
+        last_value = np.take_along_axis(values, last, axis=-1)
+        top_value = last_value + weight * (np.take_along_axis(values, next_level, axis=-1)
+                                           - last_value)
+        area += np.where(interp_top, (last_value + top_value) / 2 * (last_p - top), 0)
+        return area / actual_depth
+
+    kappa = mpconsts.nounit.kappa
+    reference_pressure = mpconsts.P0.m_as('Pa')
+    theta = temperature * (reference_pressure / pressure) ** kappa
+    mean_temperature = mix(theta) * (bottom / reference_pressure) ** kappa
+    mean_dewpoint = globals()['dewpoint']._nounit(vapor_pressure._nounit(
+        bottom, mix(saturation_mixing_ratio._nounit(pressure, dewpoint))))
+
+    first = np.arange(pressure.shape[-1]) == 0
+    return _compact_columns(first | (pressure < top), pressure,
+                            np.where(first, mean_temperature, temperature),
+                            np.where(first, mean_dewpoint, dewpoint))
+
+
 @exporter.export
 @preprocess_and_wrap()
 @check_units('[pressure]', '[temperature]', '[temperature]')
@@ -3026,7 +3596,7 @@ def most_unstable_parcel(pressure, temperature, dewpoint, height=None, bottom=No
 @check_units('[temperature]', '[pressure]', '[temperature]')
 def isentropic_interpolation(levels, pressure, temperature, *args, vertical_dim=0,
                              temperature_out=False, max_iters=50, eps=1e-6,
-                             bottom_up_search=True, **kwargs):
+                             bottom_up_search=True, dtype=None, out=None, **kwargs):
     r"""Interpolate data in isobaric coordinates to isentropic coordinates.
 
     Parameters
@@ -3068,6 +3638,15 @@ def isentropic_interpolation(levels, pressure, temperature, *args, vertical_dim=
         Controls whether to search for levels bottom-up (starting at lower indices),
         or top-down (starting at higher indices). Defaults to True, which is bottom-up search.
 
+    dtype : data-type, optional
+        Floating point type to use when solving for pressure, e.g. `numpy.float32` to
+        reduce memory use for large grids. Defaults to the type of `out` if given, otherwise
+        `numpy.float64`.
+
+    out : `numpy.ndarray`, optional
+        Array in which to place the pressure (in hPa) on the isentropic levels, which allows
+        reusing memory across calls. Must have the shape of the output.
+
     See Also
     --------
     potential_temperature, isentropic_interpolation_as_dataset
@@ -3088,16 +3667,6 @@ def isentropic_interpolation(levels, pressure, temperature, *args, vertical_dim=
        Renamed ``theta_levels``, ``axis`` parameters to ``levels``, ``vertical_dim``
 
     """
-    # iteration function to be used later
-    # Calculates theta from linearly interpolated temperature and solves for pressure
-    def _isen_iter(iter_log_p, isentlevs_nd, ka, a, b, pok):
-        exner = pok * np.exp(-ka * iter_log_p)
-        t = a * iter_log_p + b
-        # Newton-Raphson iteration
-        f = isentlevs_nd - t * exner
-        fp = exner * (ka * t - a)
-        return iter_log_p - (f / fp)
-
     # Convert units
     pressure = pressure.to('hPa')
     temperature = temperature.to('kelvin')
@@ -3112,14 +3681,23 @@ def isentropic_interpolation(levels, pressure, temperature, *args, vertical_dim=
     # it has the same shape and is a no-op.
     if pressure.ndim == 1:
         pressure = pressure[slices]
+
+    # Sort input data so that pressure is decreasing, skipping this if that's already true
+    pressure_diffs = (None if np.ma.is_masked(pressure.m)
+                      else np.diff(np.asarray(pressure.m), axis=vertical_dim))
+    if pressure_diffs is not None and np.all(pressure_diffs < 0):
+        sorter = (slice(None),) * temperature.ndim
+    elif pressure_diffs is not None and np.all(pressure_diffs > 0):
+        sorter = tuple(slice(None, None, -1) if dim == vertical_dim else slice(None)
+                       for dim in range(temperature.ndim))
+    else:
+        sort_pressure = np.argsort(np.broadcast_to(pressure.m, temperature.shape),
+                                   axis=vertical_dim)
+        sort_pressure = np.swapaxes(np.swapaxes(sort_pressure, 0, vertical_dim)[::-1], 0,
+                                    vertical_dim)
+        sorter = broadcast_indices(sort_pressure, temperature.shape, vertical_dim)
     pressure = units.Quantity(np.broadcast_to(pressure.magnitude, temperature.shape),
                               pressure.units)
-
-    # Sort input data
-    sort_pressure = np.argsort(pressure.m, axis=vertical_dim)
-    sort_pressure = np.swapaxes(np.swapaxes(sort_pressure, 0, vertical_dim)[::-1], 0,
-                                vertical_dim)
-    sorter = broadcast_indices(sort_pressure, temperature.shape, vertical_dim)
     levs = pressure[sorter]
     tmpk = temperature[sorter]
 
@@ -3135,38 +3713,41 @@ def isentropic_interpolation(levels, pressure, temperature, *args, vertical_dim=
     ka = mpconsts.kappa.m_as('dimensionless')
 
     # calculate theta for each point
-    pres_theta = potential_temperature(levs, tmpk)
+    pres_theta = tmpk.m * (mpconsts.P0.m_as('hPa') / levs.m) ** ka
 
     # Raise error if input theta level is larger than pres_theta max
-    if np.max(pres_theta.m) < np.max(levels):
+    if np.max(pres_theta) < np.max(levels):
         raise ValueError('Input theta level out of data bounds')
 
     # Find log of pressure to implement assumption of linear temperature dependence on
     # ln(p)
-    log_p = np.log(levs.m)
+    if dtype is None:
+        dtype = np.float64 if out is None else out.dtype
+    log_p = np.log(levs.m).astype(dtype, copy=False)
+    tmpk_m = np.asarray(tmpk.m, dtype=dtype)
 
     # Calculations for interpolation routine
-    pok = mpconsts.P0 ** ka
+    pok = mpconsts.P0.m_as('hPa') ** ka
 
     # index values for each point for the pressure level nearest to the desired theta level
-    above, below, good = find_bounding_indices(pres_theta.m, levels, vertical_dim,
+    above, below, good = find_bounding_indices(pres_theta, levels, vertical_dim,
                                                from_below=bottom_up_search)
 
     # calculate constants for the interpolation
-    a = (tmpk.m[above] - tmpk.m[below]) / (log_p[above] - log_p[below])
-    b = tmpk.m[above] - a * log_p[above]
+    a = (tmpk_m[above] - tmpk_m[below]) / (log_p[above] - log_p[below])
+    b = tmpk_m[above] - a * log_p[above]
 
     # calculate first guess for interpolation
-    isentprs = 0.5 * (log_p[above] + log_p[below])
+    isentprs = np.add(log_p[above], log_p[below], out=out, dtype=dtype)
+    isentprs *= 0.5
 
     # Make sure we ignore any nans in the data for solving; checking a is enough since it
     # combines log_p and tmpk.
     good &= ~np.isnan(a)
 
-    # iterative interpolation using scipy.optimize.fixed_point and _isen_iter defined above
-    log_p_solved = so.fixed_point(_isen_iter, isentprs[good],
-                                  args=(isentlevs_nd[good], ka, a[good], b[good], pok.m),
-                                  xtol=eps, maxiter=max_iters)
+    # iterative interpolation using Newton's method on the points with good data
+    log_p_solved = _isentropic_newton(isentprs[good], isentlevs_nd[good].astype(dtype),
+                                      ka, a[good], b[good], pok, eps=eps, max_iters=max_iters)
 
     # get back pressure from log p
     isentprs[good] = np.exp(log_p_solved)
@@ -3183,13 +3764,62 @@ def isentropic_interpolation(levels, pressure, temperature, *args, vertical_dim=
 
     # do an interpolation for each additional argument
     if args:
-        others = interpolate_1d(isentlevels, pres_theta.m, *(arr[sorter] for arr in args),
+        others = interpolate_1d(isentlevels, pres_theta, *(arr[sorter] for arr in args),
                                 axis=vertical_dim, return_list_always=True)
         ret.extend(others)
 
     return ret
 
 
+def _isentropic_newton(log_p, theta, ka, a, b, pok, *, eps, max_iters):
+    r"""Solve for log pressure on isentropic surfaces using Newton's method.
+
+    Finds :math:`\ln p` where temperature, linear in :math:`\ln p` (:math:`T = a \ln p + b`),
+    gives potential temperature `theta`. This works in place on the first guess `log_p` and
+    only keeps iterating on points that have not converged, using the relative error
+    criterion of `scipy.optimize.fixed_point`.
+    """
+    # Once theta is matched to within rounding, stop since lower precision (e.g. float32)
+    # may never reach the tolerance
+    theta_tol = 4 * np.spacing(theta)
+
+    # Work on compacted copies of the points still being solved, indexed by `active`
+    active = np.arange(log_p.size)
+    iter_log_p = log_p
+    for _ in range(max_iters):
+        exner = np.multiply(-ka, iter_log_p)
+        np.exp(exner, out=exner)
+        exner *= pok
+        t = a * iter_log_p
+        t += b
+
+        # Newton-Raphson iteration
+        f = t * exner
+        np.subtract(theta, f, out=f)
+        fp = np.multiply(ka, t, out=t)
+        fp -= a
+        fp *= exner
+        step = np.divide(f, fp, out=fp)
+        new_log_p = iter_log_p - step
+
+        # Relative change (absolute when starting from 0)
+        err = np.abs(step, out=step)
+        np.divide(err, np.abs(iter_log_p), out=err, where=iter_log_p != 0)
+        done = (err < eps) | (np.abs(f) <= theta_tol) | np.isnan(err)
+
+        log_p[active] = new_log_p
+        if done.all():
+            return log_p
+
+        if done.any():
+            keep = ~done
+            active, new_log_p = active[keep], new_log_p[keep]
+            theta, theta_tol, a, b = theta[keep], theta_tol[keep], a[keep], b[keep]
+        iter_log_p = new_log_p
+
+    raise RuntimeError(f'Failed to converge after {max_iters} iterations.')
+
+
 @exporter.export
 def isentropic_interpolation_as_dataset(
     levels,
@@ -3324,9 +3954,10 @@ def isentropic_interpolation_as_dataset(
 
 
 @exporter.export
+@add_vertical_dim_from_xarray
 @preprocess_and_wrap()
 @check_units('[pressure]', '[temperature]', '[temperature]')
-def surface_based_cape_cin(pressure, temperature, dewpoint):
+def surface_based_cape_cin(pressure, temperature, dewpoint, vertical_dim=0):
     r"""Calculate surface-based CAPE and CIN.
 
     Calculate the convective available potential energy (CAPE) and convective inhibition (CIN)
@@ -3347,6 +3978,10 @@ def surface_based_cape_cin(pressure, temperature, dewpoint):
     dewpoint : `pint.Quantity`
         Dewpoint profile corresponding to the `pressure` profile
 
+    vertical_dim : int, optional
+        The axis corresponding to vertical when the profiles have more than one dimension,
+        defaults to 0. Automatically determined from xarray DataArray arguments.
+
     Returns
     -------
     `pint.Quantity`
@@ -3361,20 +3996,27 @@ def surface_based_cape_cin(pressure, temperature, dewpoint):
 
     Notes
     -----
-    Only functions on 1D profiles (not higher-dimension vertical cross sections or grids).
-    Since this function returns scalar values when given a profile, this will return Pint
-    Quantities even when given xarray DataArray profiles.
+    When given more than one dimension (e.g. a grid of columns), every column along
+    `vertical_dim` is calculated at once, using the lowest valid level of each column as
+    its surface. Since this function returns scalar values when given a profile, this will
+    return Pint Quantities even when given xarray DataArray profiles.
 
     """
+    if np.ndim(temperature) > 1:
+        cape, cin = _cape_cin_columns(*_parcel_profile_with_lcl_columns_nounit(
+            *_columns_last(pressure, temperature, dewpoint, vertical_dim=vertical_dim)))
+        return units.Quantity(cape, 'J/kg'), units.Quantity(cin, 'J/kg')
+
     pressure, temperature, dewpoint = _remove_nans(pressure, temperature, dewpoint)
     p, t, td, profile = parcel_profile_with_lcl(pressure, temperature, dewpoint)
     return cape_cin(p, t, td, profile)
 
 
 @exporter.export
+@add_vertical_dim_from_xarray
 @preprocess_and_wrap()
 @check_units('[pressure]', '[temperature]', '[temperature]')
-def most_unstable_cape_cin(pressure, temperature, dewpoint, **kwargs):
+def most_unstable_cape_cin(pressure, temperature, dewpoint, vertical_dim=0, **kwargs):
     r"""Calculate most unstable CAPE/CIN.
 
     Calculate the convective available potential energy (CAPE) and convective inhibition (CIN)
@@ -3394,6 +4036,10 @@ def most_unstable_cape_cin(pressure, temperature, dewpoint, **kwargs):
     dewpoint : `pint.Quantity`
         Dew point profile
 
+    vertical_dim : int, optional
+        The axis corresponding to vertical when the profiles have more than one dimension,
+        defaults to 0. Automatically determined from xarray DataArray arguments.
+
     kwargs
         Additional keyword arguments to pass to `most_unstable_parcel`
 
@@ -3435,11 +4081,22 @@ def most_unstable_cape_cin(pressure, temperature, dewpoint, **kwargs):
 
     Notes
     -----
-    Only functions on 1D profiles (not higher-dimension vertical cross sections or grids).
-    Since this function returns scalar values when given a profile, this will return Pint
-    Quantities even when given xarray DataArray profiles.
+    When given more than one dimension (e.g. a grid of columns), every column along
+    `vertical_dim` is calculated at once. The most unstable parcel is then searched for
+    within a `depth` (in pressure, default 300 hPa) above the lowest valid level of each
+    column, and no other keyword arguments are supported. Since this function returns scalar
+    values when given a profile, this will return Pint Quantities even when given xarray
+    DataArray profiles.
 
     """
+    if np.ndim(temperature) > 1:
+        depth = _column_layer_depth(kwargs, units.Quantity(300, 'hPa'))
+        cape, cin = _cape_cin_columns(*_parcel_profile_with_lcl_columns_nounit(
+            *_most_unstable_columns(
+                *_columns_last(pressure, temperature, dewpoint, vertical_dim=vertical_dim),
+                depth)))
+        return units.Quantity(cape, 'J/kg'), units.Quantity(cin, 'J/kg')
+
     pressure, temperature, dewpoint = _remove_nans(pressure, temperature, dewpoint)
     _, _, _, parcel_idx = most_unstable_parcel(pressure, temperature, dewpoint, **kwargs)
     p, t, td, mu_profile = parcel_profile_with_lcl(pressure[parcel_idx:],
@@ -3449,9 +4106,10 @@ def most_unstable_cape_cin(pressure, temperature, dewpoint, **kwargs):
 
 
 @exporter.export
+@add_vertical_dim_from_xarray
 @preprocess_and_wrap()
 @check_units('[pressure]', '[temperature]', '[temperature]')
-def mixed_layer_cape_cin(pressure, temperature, dewpoint, **kwargs):
+def mixed_layer_cape_cin(pressure, temperature, dewpoint, vertical_dim=0, **kwargs):
     r"""Calculate mixed-layer CAPE and CIN.
 
     Calculate the convective available potential energy (CAPE) and convective inhibition (CIN)
@@ -3472,6 +4130,10 @@ def mixed_layer_cape_cin(pressure, temperature, dewpoint, **kwargs):
     dewpoint : `pint.Quantity`
         Dewpoint profile
 
+    vertical_dim : int, optional
+        The axis corresponding to vertical when the profiles have more than one dimension,
+        defaults to 0. Automatically determined from xarray DataArray arguments.
+
     kwargs
         Additional keyword arguments to pass to `mixed_parcel`
 
@@ -3511,11 +4173,21 @@ def mixed_layer_cape_cin(pressure, temperature, dewpoint, **kwargs):
 
     Notes
     -----
-    Only functions on 1D profiles (not higher-dimension vertical cross sections or grids).
-    Since this function returns scalar values when given a profile, this will return Pint
-    Quantities even when given xarray DataArray profiles.
+    When given more than one dimension (e.g. a grid of columns), every column along
+    `vertical_dim` is calculated at once. Each column is then mixed over a `depth` (in
+    pressure, default 100 hPa) above its lowest valid level, and no other keyword arguments
+    are supported. Since this function returns scalar values when given a profile, this will
+    return Pint Quantities even when given xarray DataArray profiles.
 
     """
+    if np.ndim(temperature) > 1:
+        depth = _column_layer_depth(kwargs, units.Quantity(100, 'hPa'))
+        cape, cin = _cape_cin_columns(*_parcel_profile_with_lcl_columns_nounit(
+            *_mixed_layer_columns(
+                *_columns_last(pressure, temperature, dewpoint, vertical_dim=vertical_dim),
+                depth)))
+        return units.Quantity(cape, 'J/kg'), units.Quantity(cin, 'J/kg')
+
     depth = kwargs.get('depth', units.Quantity(100, 'hPa'))
     start_p = kwargs.get('parcel_start_pressure', pressure[0])
     parcel_pressure, parcel_temp, parcel_dewpoint = mixed_parcel(pressure, temperature,
@@ -3859,7 +4531,8 @@ def mixed_layer(pressure, *args, height=None, bottom=None, depth=None, interpola
 
 
 @exporter.export
-@preprocess_and_wrap(wrap_like='temperature', broadcast=('height', 'temperature'))
+@preprocess_and_wrap(wrap_like='temperature', broadcast=('height', 'temperature'),
+                     lazy='elementwise')
 @check_units('[length]', '[temperature]')
 def dry_static_energy(height, temperature):
     r"""Calculate the dry static energy of parcels.
@@ -4199,7 +4872,8 @@ def thickness_hydrostatic_from_relative_humidity(pressure, temperature, relative
 
 @exporter.export
 @add_vertical_dim_from_xarray
-@preprocess_and_wrap(wrap_like='height', broadcast=('height', 'potential_temperature'))
+@preprocess_and_wrap(wrap_like='height', broadcast=('height', 'potential_temperature'),
+                     lazy='vertical')
 @check_units('[length]', '[temperature]')
 def brunt_vaisala_frequency_squared(height, potential_temperature, vertical_dim=0):
     r"""Calculate the square of the Brunt-Vaisala frequency.
@@ -4253,7 +4927,8 @@ def brunt_vaisala_frequency_squared(height, potential_temperature, vertical_dim=
 
 @exporter.export
 @add_vertical_dim_from_xarray
-@preprocess_and_wrap(wrap_like='height', broadcast=('height', 'potential_temperature'))
+@preprocess_and_wrap(wrap_like='height', broadcast=('height', 'potential_temperature'),
+                     lazy='vertical')
 @check_units('[length]', '[temperature]')
 def brunt_vaisala_frequency(height, potential_temperature, vertical_dim=0):
     r"""Calculate the Brunt-Vaisala frequency.
@@ -4305,7 +4980,8 @@ def brunt_vaisala_frequency(height, potential_temperature, vertical_dim=0):
 
 @exporter.export
 @add_vertical_dim_from_xarray
-@preprocess_and_wrap(wrap_like='height', broadcast=('height', 'potential_temperature'))
+@preprocess_and_wrap(wrap_like='height', broadcast=('height', 'potential_temperature'),
+                     lazy='vertical')
 @check_units('[length]', '[temperature]')
 def brunt_vaisala_period(height, potential_temperature, vertical_dim=0):
     r"""Calculate the Brunt-Vaisala period.
@@ -4425,7 +5101,8 @@ def wet_bulb_temperature(pressure, temperature, dewpoint):
 
 @exporter.export
 @add_vertical_dim_from_xarray
-@preprocess_and_wrap(wrap_like='temperature', broadcast=('pressure', 'temperature'))
+@preprocess_and_wrap(wrap_like='temperature', broadcast=('pressure', 'temperature'),
+                     lazy='vertical')
 @check_units('[pressure]', '[temperature]')
 def static_stability(pressure, temperature, vertical_dim=0):
     r"""Calculate the static stability within a vertical profile.
@@ -4709,7 +5386,8 @@ def vertical_velocity(omega, pressure, temperature, mixing_ratio=0):
 
 
 @exporter.export
-@preprocess_and_wrap(wrap_like='dewpoint', broadcast=('dewpoint', 'pressure'))
+@preprocess_and_wrap(wrap_like='dewpoint', broadcast=('dewpoint', 'pressure'),
+                     lazy='elementwise')
 @process_units({'pressure': '[pressure]', 'dewpoint': '[temperature]'}, '[dimensionless]')
 def specific_humidity_from_dewpoint(pressure, dewpoint, *, phase='liquid'):
     r"""Calculate the specific humidity from the dewpoint temperature and pressure.
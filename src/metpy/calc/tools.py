@@ -2,12 +2,15 @@
 # Distributed under the terms of the BSD 3-Clause License.
 # SPDX-License-Identifier: BSD-3-Clause
 """Contains a collection of generally useful calculation tools."""
+from collections import namedtuple, OrderedDict
 import contextlib
 import functools
+import hashlib
 from inspect import Parameter, signature
 import itertools
 from operator import itemgetter
 import textwrap
+import threading
 
 import numpy as np
 
@@ -696,9 +699,10 @@ def find_bounding_indices(arr, values, axis, from_below=True):
     # Loop over all of the values and for each, see where the value would be found from a
     # linear search
     for level_index, value in enumerate(values):
-        # Look for changes in the value of the test for <= value in consecutive points
-        # Taking abs() because we only care if there is a flip, not which direction.
-        switches = np.abs(np.diff((arr <= value).astype(int), axis=axis))
+        # Look for changes in the value of the test for <= value in consecutive points.
+        # For booleans, diff gives whether there is a flip (not which direction), which is
+        # all we care about.
+        switches = np.diff(arr <= value, axis=axis)
 
         # Good points are those where it's not just 0's along the whole axis
         good_search = np.any(switches, axis=axis)
@@ -864,6 +868,128 @@ def lat_lon_grid_deltas(longitude, latitude, x_dim=-1, y_dim=-2, geod=None):
     return units.Quantity(dx, 'meter'), units.Quantity(dy, 'meter')
 
 
+_GridCacheInfo = namedtuple('GridCacheInfo', 'hits misses maxsize currsize')
+
+
+class _GridCache:
+    """Bounded LRU cache of grid metadata, keyed on the values of the coordinates."""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.hits = self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _token(coord):
+        """Summarize the values and units of a coordinate array for use in a key."""
+        if isinstance(coord, xr.DataArray):
+            coord = coord.metpy.unit_array
+        data = getattr(coord, 'magnitude', coord)
+        if not isinstance(data, np.ndarray) or isinstance(data, np.ma.MaskedArray):
+            return None
+        data = np.ascontiguousarray(data)
+        return (str(getattr(coord, 'units', '')), data.dtype.str, data.shape,
+                hashlib.blake2b(data, digest_size=16).digest())
+
+    def __call__(self, kind, compute, *coords, proj):
+        """Return the cached result of ``compute(*coords)``, calculating it if needed.
+
+        ``proj`` is a hashable description of the projection or ellipsoid used.
+        """
+        tokens = [self._token(coord) for coord in coords]
+        if self.maxsize <= 0 or any(token is None for token in tokens):
+            return compute(*coords)
+
+        key = (kind, proj, *tokens)
+        with self._lock:
+            if key in self._entries:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return self._copy(self._entries[key])
+            self.misses += 1
+
+        result = compute(*coords)
+        with self._lock:
+            self._entries[key] = result
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return self._copy(result)
+
+    @staticmethod
+    def _copy(result):
+        # Hand out copies so that callers modifying results in place don't poison the cache
+        return tuple(item.copy() for item in result)
+
+    def clear(self):
+        """Remove all entries and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def info(self):
+        """Return the statistics of the cache."""
+        with self._lock:
+            return _GridCacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+
+_grid_cache = _GridCache(maxsize=32)
+
+
+@exporter.export
+def grid_cache_info():
+    """Return statistics for the cache of grid deltas and map factors.
+
+    Grid deltas and map scale factors found from coordinates for grid calculations, such as
+    `vorticity` or `advection`, are kept in a cache keyed on the coordinate values and the
+    projection, so that repeated calculations on the same grid only find them once.
+
+    Returns
+    -------
+    namedtuple
+        Named tuple with the number of ``hits`` and ``misses``, the ``maxsize`` of the cache
+        and its ``currsize``.
+
+    See Also
+    --------
+    clear_grid_cache
+
+    """
+    return _grid_cache.info()
+
+
+@exporter.export
+def clear_grid_cache():
+    """Remove all entries from the cache of grid deltas and map factors.
+
+    Also resets the statistics reported by `grid_cache_info`.
+
+    See Also
+    --------
+    grid_cache_info
+
+    """
+    _grid_cache.clear()
+
+
+def _cached_nominal_grid_deltas(longitude, latitude, geod=None):
+    """Calculate nominal lat/lon grid deltas, reusing earlier results for the same grid."""
+    if geod is None:
+        geod = CRS('+proj=latlon').get_geod()
+    return _grid_cache('nominal_deltas',
+                       functools.partial(nominal_lat_lon_grid_deltas, geod=geod),
+                       longitude, latitude, proj=(geod.a, geod.f))
+
+
+def _cached_map_factors(proj, longitude, latitude):
+    """Calculate parallel and meridional map scale factors, reusing earlier results."""
+    def compute(longitude, latitude):
+        factors = proj.get_factors(longitude, latitude)
+        return factors.parallel_scale, factors.meridional_scale
+
+    return _grid_cache('map_factors', compute, longitude, latitude, proj=proj.srs)
+
+
 @preprocess_and_wrap()
 def nominal_lat_lon_grid_deltas(longitude, latitude, geod=None):
     """Calculate the nominal deltas along axes of a latitude/longitude grid."""
@@ -957,7 +1083,7 @@ def xarray_derivative_wrap(func):
             axis = f.metpy.find_axis_name(kwargs.get('axis', 0))
 
             # Initialize new kwargs with the axis number
-            new_kwargs = {'axis': f.get_axis_num(axis)}
+            new_kwargs = {'axis': f.get_axis_num(axis), 'out': kwargs.get('out')}
 
             if check_axis(f[axis], 'time'):
                 # Time coordinate, need to get time deltas
@@ -1104,7 +1230,7 @@ def parse_grid_arguments(func):
                 # TODO: de-duplicate .metpy.grid_deltas code
                 geod = None if crs is None else crs.get_geod()
                 bound_args.arguments['dx'], bound_args.arguments['dy'] = (
-                    nominal_lat_lon_grid_deltas(longitude, latitude, geod)
+                    _cached_nominal_grid_deltas(longitude, latitude, geod)
                 )
             elif 'dz' in bound_args.arguments:
                 # Handle advection case, allowing dx/dy to be None but dz to not be None
@@ -1160,9 +1286,7 @@ def parse_grid_arguments(func):
                     scale_lon, scale_lat = np.meshgrid(scale_lon, scale_lat)
                 elif scale_lat.ndim != 2 or scale_lon.ndim != 2:
                     raise ValueError('Latitude and longitude must be either 1D or 2D.')
-                factors = proj.get_factors(scale_lon, scale_lat)
-                p_scale = factors.parallel_scale
-                m_scale = factors.meridional_scale
+                p_scale, m_scale = _cached_map_factors(proj, scale_lon, scale_lat)
 
                 if grid_prototype is not None:
                     # Set the dims and coords using the original from the input lat/lon.
@@ -1194,7 +1318,7 @@ def parse_grid_arguments(func):
 
 @exporter.export
 @xarray_derivative_wrap
-def first_derivative(f, axis=None, x=None, delta=None):
+def first_derivative(f, axis=None, x=None, delta=None, out=None):
     """Calculate the first derivative of a grid of values.
 
     Works for both regularly-spaced data and grids with varying spacing.
@@ -1208,7 +1332,8 @@ def first_derivative(f, axis=None, x=None, delta=None):
 
     This uses 3 points to calculate the derivative, using forward or backward at the edges of
     the grid as appropriate, and centered elsewhere. The irregular spacing is handled
-    explicitly, using the formulation as specified by [Bowen2005]_.
+    explicitly, using the formulation as specified by [Bowen2005]_. When the spacing is
+    uniform, the simpler finite differences for that case are used instead.
 
     Parameters
     ----------
@@ -1226,6 +1351,9 @@ def first_derivative(f, axis=None, x=None, delta=None):
     delta : array-like, optional
         Spacing between the grid points in `f`. Should be one item less than the size
         of `f` along `axis`.
+    out : `numpy.ndarray`, optional
+        Array with the same shape as `f` in which to place the magnitude of the result,
+        which is then returned (wrapped with units if appropriate).
 
     Returns
     -------
@@ -1241,7 +1369,9 @@ def first_derivative(f, axis=None, x=None, delta=None):
     second_derivative
 
     """
-    n, axis, delta = _process_deriv_args(f, axis, x, delta)
+    n, axis, delta, spacing = _process_deriv_args(f, axis, x, delta)
+    if spacing is not None:
+        return _uniform_derivative(f, axis, spacing, 1, out)
     take = make_take(n, axis)
 
     # First handle centered case
@@ -1283,12 +1413,12 @@ def first_derivative(f, axis=None, x=None, delta=None):
              - combined_delta / (delta[delta_slice0] * delta[delta_slice1]) * f[slice1]
              + big_delta / (combined_delta * delta[delta_slice1]) * f[slice2])
 
-    return concatenate((left, center, right), axis=axis)
+    return _fill_out(concatenate((left, center, right), axis=axis), out)
 
 
 @exporter.export
 @xarray_derivative_wrap
-def second_derivative(f, axis=None, x=None, delta=None):
+def second_derivative(f, axis=None, x=None, delta=None, out=None):
     """Calculate the second derivative of a grid of values.
 
     Works for both regularly-spaced data and grids with varying spacing.
@@ -1302,7 +1432,8 @@ def second_derivative(f, axis=None, x=None, delta=None):
 
     This uses 3 points to calculate the derivative, using forward or backward at the edges of
     the grid as appropriate, and centered elsewhere. The irregular spacing is handled
-    explicitly, using the formulation as specified by [Bowen2005]_.
+    explicitly, using the formulation as specified by [Bowen2005]_. When the spacing is
+    uniform, the simpler finite differences for that case are used instead.
 
     Parameters
     ----------
@@ -1320,6 +1451,9 @@ def second_derivative(f, axis=None, x=None, delta=None):
     delta : array-like, optional
         Spacing between the grid points in `f`. There should be one item less than the size
         of `f` along `axis`.
+    out : `numpy.ndarray`, optional
+        Array with the same shape as `f` in which to place the magnitude of the result,
+        which is then returned (wrapped with units if appropriate).
 
     Returns
     -------
@@ -1335,7 +1469,9 @@ def second_derivative(f, axis=None, x=None, delta=None):
     first_derivative
 
     """
-    n, axis, delta = _process_deriv_args(f, axis, x, delta)
+    n, axis, delta, spacing = _process_deriv_args(f, axis, x, delta)
+    if spacing is not None:
+        return _uniform_derivative(f, axis, spacing, 2, out)
     take = make_take(n, axis)
 
     # First handle centered case
@@ -1374,7 +1510,7 @@ def second_derivative(f, axis=None, x=None, delta=None):
                  - f[slice1] / (delta[delta_slice0] * delta[delta_slice1])
                  + f[slice2] / (combined_delta * delta[delta_slice1]))
 
-    return concatenate((left, center, right), axis=axis)
+    return _fill_out(concatenate((left, center, right), axis=axis), out)
 
 
 @exporter.export
@@ -1733,7 +1869,11 @@ def _process_gradient_args(f, axes, coordinates, deltas):
 
 
 def _process_deriv_args(f, axis, x, delta):
-    """Handle common processing of arguments for derivative functions."""
+    """Handle common processing of arguments for derivative functions.
+
+    Besides the spacing ``delta`` broadcast against ``f``, also returns a single ``spacing``
+    when the grid is uniform and ``f`` is suitable for `_uniform_derivative`, else `None`.
+    """
     n = f.ndim
     axis = normalize_axis_index(axis if axis is not None else 0, n)
 
@@ -1745,6 +1885,7 @@ def _process_deriv_args(f, axis, x, delta):
             raise ValueError('Cannot specify both "x" and "delta".')
 
         delta = np.atleast_1d(delta)
+        spacing = _uniform_spacing(f, delta)
         if delta.size == 1:
             diff_size = list(f.shape)
             diff_size[axis] -= 1
@@ -1757,10 +1898,94 @@ def _process_deriv_args(f, axis, x, delta):
     elif x is not None:
         x = _broadcast_to_axis(x, axis, n)
         delta = np.diff(x, axis=axis)
+        spacing = _uniform_spacing(f, delta)
     else:
         raise ValueError('Must specify either "x" or "delta" for value positions.')
 
-    return n, axis, delta
+    return n, axis, delta, spacing
+
+
+def _uniform_spacing(f, delta):
+    """Find the single spacing of a uniform grid, if it can be used for `f`.
+
+    Spacings equal to within rounding count as uniform. Returns `None` for non-uniform
+    spacing, as well as for arrays other than plain numpy arrays (e.g. masked or dask) and for
+    units with an offset (e.g. degC), which are left to the general calculation.
+    """
+    f_mag = getattr(f, 'magnitude', f)
+    delta_mag = getattr(delta, 'magnitude', delta)
+    if (type(f_mag) is not np.ndarray or type(delta_mag) is not np.ndarray
+            or f_mag.dtype.kind not in 'fiu' or delta_mag.dtype.kind not in 'fiu'):
+        return None
+    if hasattr(f, 'units') and units.Quantity(0., f.units).to_base_units().magnitude != 0:
+        return None
+
+    spacing = delta_mag.flat[0]
+    if spacing == 0 or not np.all(np.abs(delta_mag - spacing) <= 1e-12 * np.abs(spacing)):
+        return None
+    return units.Quantity(spacing, delta.units) if hasattr(delta, 'units') else spacing
+
+
+def _uniform_derivative(f, axis, spacing, order, out=None):
+    """Calculate a first or second derivative on a uniform grid.
+
+    Uses the same 3 point differences as `first_derivative` and `second_derivative`, which
+    reduce to fixed weights for uniform spacing. The magnitudes are written directly into
+    ``out`` (allocated if not given) without any other full-size temporaries, and units are
+    attached once at the end.
+    """
+    f_units = getattr(f, 'units', None)
+    h_units = getattr(spacing, 'units', None)
+    f = getattr(f, 'magnitude', f)
+    h = getattr(spacing, 'magnitude', spacing)
+    if out is None:
+        dtype = np.result_type(f.dtype, np.asarray(h).dtype)
+        if not np.issubdtype(dtype, np.inexact):
+            dtype = np.float64
+        out = np.empty(f.shape, dtype=dtype)
+
+    take = make_take(f.ndim, axis)
+    size = f.shape[axis]
+    f0, f1, f2 = (f[take(slice(i, size - 2 + i))] for i in range(3))
+    center = out[take(slice(1, -1))]
+    # Calculate in the precision of the output, even for lower precision input
+    dtype = out.dtype
+    if order == 1:
+        np.subtract(f2, f0, out=center, dtype=dtype)
+        center /= 2 * h
+
+        # Forward and backward differences at the edges
+        left = out[take(slice(None, 1))]
+        np.multiply(f[take(slice(1, 2))], 4, out=left, dtype=dtype)
+        left -= np.multiply(f[take(slice(None, 1))], 3, dtype=dtype)
+        left -= f[take(slice(2, 3))]
+        left /= 2 * h
+
+        right = out[take(slice(-1, None))]
+        np.multiply(f[take(slice(-1, None))], 3, out=right, dtype=dtype)
+        right -= np.multiply(f[take(slice(-2, -1))], 4, dtype=dtype)
+        right += f[take(slice(-3, -2))]
+        right /= 2 * h
+    else:
+        np.subtract(f0, f1, out=center, dtype=dtype)
+        center -= f1
+        center += f2
+        center /= h * h
+
+        # The edges use the same three points as their neighbors
+        out[take(slice(None, 1))] = out[take(slice(1, 2))]
+        out[take(slice(-1, None))] = out[take(slice(-2, -1))]
+
+    return units.Quantity(out, (f_units or units.dimensionless)
+                          / (h_units or units.dimensionless) ** order)
+
+
+def _fill_out(result, out):
+    """Place the magnitude of a result in ``out``, if given, and return it like the result."""
+    if out is None:
+        return result
+    out[...] = getattr(result, 'magnitude', result)
+    return units.Quantity(out, result.units) if hasattr(result, 'units') else out
 
 
 @exporter.export
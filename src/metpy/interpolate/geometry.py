@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: BSD-3-Clause
 """Tools for working with geometric objects (points, triangles, polygons)."""
 
+import itertools
 import logging
 import math
 
@@ -253,6 +254,124 @@ def find_natural_neighbors(tri, grid_points):
     circumcenters: numpy.ndarray
         Circumcenter for each triangle in ``tri``.
 
+    """
+    grid_index, simplex, circumcenters = _natural_neighbor_pairs(tri, grid_points)
+
+    members = {key: [] for key in range(len(grid_points))}
+    for point, i in zip(grid_index.tolist(), simplex.tolist(), strict=True):
+        members[point].append(i)
+
+    return members, circumcenters
+
+
+def _circumcenters(pt0, pt1, pt2):
+    r"""Calculate circumcenters for arrays of triangles.
+
+    This is the array form of `circumcenter`; degenerate triangles give non-finite
+    values rather than raising.
+
+    Parameters
+    ----------
+    pt0: (N, 2) numpy.ndarray
+        Starting vertices of triangles
+    pt1: (N, 2) numpy.ndarray
+        Second vertices of triangles
+    pt2: (N, 2) numpy.ndarray
+        Final vertices of triangles
+
+    Returns
+    -------
+    cc: (N, 2) numpy.ndarray
+        circumcenter coordinates
+    d_div: (N, ) numpy.ndarray
+        Denominator of the calculation, zero for degenerate triangles
+
+    """
+    a_x, a_y = pt0[..., 0], pt0[..., 1]
+    b_x, b_y = pt1[..., 0], pt1[..., 1]
+    c_x, c_y = pt2[..., 0], pt2[..., 1]
+
+    bc_y_diff = b_y - c_y
+    ca_y_diff = c_y - a_y
+    ab_y_diff = a_y - b_y
+    cb_x_diff = c_x - b_x
+    ac_x_diff = a_x - c_x
+    ba_x_diff = b_x - a_x
+
+    d_div = (a_x * bc_y_diff + b_x * ca_y_diff + c_x * ab_y_diff)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        d_inv = 0.5 / d_div
+
+    a_mag = a_x**2 + a_y**2
+    b_mag = b_x**2 + b_y**2
+    c_mag = c_x**2 + c_y**2
+
+    with np.errstate(invalid='ignore'):
+        cx = (a_mag * bc_y_diff + b_mag * ca_y_diff + c_mag * ab_y_diff) * d_inv
+        cy = (a_mag * cb_x_diff + b_mag * ac_x_diff + c_mag * ba_x_diff) * d_inv
+
+    return np.stack([cx, cy], axis=-1), d_div
+
+
+def _circumcircle_radii(pt0, pt1, pt2):
+    r"""Calculate circumcircle radii for arrays of triangles.
+
+    This is the array form of `circumcircle_radius`.
+
+    Parameters
+    ----------
+    pt0: (N, 2) numpy.ndarray
+        Starting vertices of triangles
+    pt1: (N, 2) numpy.ndarray
+        Second vertices of triangles
+    pt2: (N, 2) numpy.ndarray
+        Final vertices of triangles
+
+    Returns
+    -------
+    r: (N, ) numpy.ndarray
+        circumcircle radii
+
+    """
+    def _dist(p0, p1):
+        return np.sqrt((p1[..., 0] - p0[..., 0])**2 + (p1[..., 1] - p0[..., 1])**2)
+
+    a = _dist(pt0, pt1)
+    b = _dist(pt1, pt2)
+    c = _dist(pt2, pt0)
+
+    t_area = np.abs(pt0[..., 0] * pt1[..., 1] - pt1[..., 0] * pt0[..., 1]
+                    + (pt1[..., 0] * pt2[..., 1] - pt2[..., 0] * pt1[..., 1])
+                    + (pt2[..., 0] * pt0[..., 1] - pt0[..., 0] * pt2[..., 1])) / 2
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(t_area > 0, (a * b * c) / (4 * t_area), np.nan)
+
+
+def _natural_neighbor_pairs(tri, grid_points):
+    r"""Find all pairs of grid points and their natural neighbor triangles.
+
+    Parameters
+    ----------
+    tri: `scipy.spatial.Delaunay`
+        A Delaunay Triangulation.
+    grid_points: (X, Y) numpy.ndarray
+        Locations of grids.
+
+    Returns
+    -------
+    grid_index: (K, ) numpy.ndarray
+        Index of the grid point for each pair, sorted in ascending order.
+    simplex: (K, ) numpy.ndarray
+        Simplex code in ``tri`` of the natural neighbor triangle for each pair. These
+        are in ascending order for each grid point.
+    circumcenters: numpy.ndarray
+        Circumcenter for each triangle in ``tri``.
+
+    See Also
+    --------
+    find_natural_neighbors
+
     """
     # Used for fast identification of points with a radius of another point
     tree = KDTree(grid_points)
@@ -260,23 +379,25 @@ def find_natural_neighbors(tri, grid_points):
     # Mask for points that are outside the triangulation
     in_triangulation = tri.find_simplex(tree.data) >= 0
 
-    circumcenters = []
-    members = {key: [] for key in range(len(tree.data))}
-    for i, indices in enumerate(tri.simplices):
-        # Find the circumcircle (center and radius) for the triangle.
-        triangle = tri.points[indices]
-        cc = circumcenter(*triangle)
-        r = circumcircle_radius(*triangle)
-        circumcenters.append(cc)
-
-        # Find all grid points within the circumcircle.
-        for point in tree.query_ball_point(cc, r):
-            # If this point is within the triangulation, add this triangle to its list of
-            # natural neighbors
-            if in_triangulation[point]:
-                members[point].append(i)
-
-    return members, np.array(circumcenters)
+    # Find the circumcircle (center and radius) for every triangle at once.
+    triangles = tri.points[tri.simplices]
+    circumcenters, _ = _circumcenters(triangles[:, 0], triangles[:, 1], triangles[:, 2])
+    radii = _circumcircle_radii(triangles[:, 0], triangles[:, 1], triangles[:, 2])
+
+    # Find all grid points within each circumcircle.
+    found = tree.query_ball_point(circumcenters, radii)
+    counts = np.fromiter(map(len, found), dtype=np.intp, count=len(found))
+    grid_index = np.fromiter(itertools.chain.from_iterable(found), dtype=np.intp,
+                             count=counts.sum())
+    simplex = np.repeat(np.arange(len(found)), counts)
+
+    # Only keep points within the triangulation, ordered by grid point
+    keep = in_triangulation[grid_index]
+    grid_index = grid_index[keep]
+    simplex = simplex[keep]
+    order = np.argsort(grid_index, kind='stable')
+
+    return grid_index[order], simplex[order], circumcenters
 
 
 def find_nn_triangles_point(tri, cur_tri, point):
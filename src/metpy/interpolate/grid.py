@@ -3,15 +3,24 @@
 # SPDX-License-Identifier: BSD-3-Clause
 """Tools and calculations for interpolating specifically to a grid."""
 
+import collections
+import functools
+import os
+
 import numpy as np
 
+from . import tools
 from .points import (interpolate_to_points, inverse_distance_to_points,
-                     natural_neighbor_to_points)
+                     natural_neighbor_to_points, ObjectiveAnalysis)
 from ..package_tools import Exporter
 from ..pandas import preprocess_pandas
+from ..units import units
 
 exporter = Exporter(globals())
 
+# Limit on the number of tiles handed to an executor at once, which bounds memory use
+_MAX_PENDING_TILES = 2 * (os.cpu_count() or 1)
+
 
 def generate_grid(horiz_dim, bbox):
     r"""Generate a meshgrid based on bounding box and x & y resolution.
@@ -130,6 +139,76 @@ def get_boundary_coords(x, y, spatial_pad=0):
     return {'west': west, 'south': south, 'east': east, 'north': north}
 
 
+def _grid_tiles(shape, tile_size):
+    """Yield slices that cover a 2D grid in blocks of ``tile_size`` points on a side."""
+    for row in range(0, shape[0], tile_size):
+        for col in range(0, shape[1], tile_size):
+            yield slice(row, row + tile_size), slice(col, col + tile_size)
+
+
+def _map_tiles(func, tile_args, executor):
+    """Apply ``func`` to each set of arguments in order, optionally using an executor."""
+    if executor is None:
+        for args in tile_args:
+            yield func(*args)
+        return
+
+    pending = collections.deque()
+    for args in tile_args:
+        pending.append(executor.submit(func, *args))
+        if len(pending) >= _MAX_PENDING_TILES:
+            yield pending.popleft().result()
+
+    while pending:
+        yield pending.popleft().result()
+
+
+def _inverse_distance_tile(points, values, tile_points, r, **kwargs):
+    """Calculate the inverse distance weighted analysis for a single tile."""
+    return ObjectiveAnalysis(points, tile_points, r, **kwargs)(values)
+
+
+def _inverse_distance_tiled(points, values, grid_x, grid_y, r, *, tile_size, executor=None,
+                            passes=1, **kwargs):
+    r"""Calculate an inverse distance weighted analysis to a grid one tile at a time.
+
+    Each tile only uses the observations within a halo around it. For multiple passes,
+    this halo needs to be ``passes`` times the search radius so that the analysis at those
+    observations is unaffected, which makes the result identical to analyzing the whole
+    grid at once.
+    """
+    if hasattr(values, 'units'):
+        org_units = values.units
+        values = values.magnitude
+    else:
+        org_units = None
+
+    points = np.asarray(points, dtype=float)
+    values = np.asarray(values)
+    halo = passes * r
+    tiles = list(_grid_tiles(grid_x.shape, tile_size))
+
+    def tile_args():
+        for tile in tiles:
+            tile_points = generate_grid_coords(grid_x[tile], grid_y[tile])
+            near = np.all((points >= tile_points.min(axis=0) - halo)
+                          & (points <= tile_points.max(axis=0) + halo), axis=1)
+            yield points[near], values[near], tile_points
+
+    # Avoid oversubscribing the CPUs with threaded neighbor searches within each worker
+    func = functools.partial(_inverse_distance_tile, r=r, passes=passes,
+                             workers=-1 if executor is None else 1, **kwargs)
+
+    img = np.empty(grid_x.shape + values.shape[1:])
+    for tile, tile_img in zip(tiles, _map_tiles(func, tile_args(), executor), strict=True):
+        img[tile] = tile_img.reshape(img[tile].shape)
+
+    if org_units:
+        img = units.Quantity(img, org_units)
+
+    return img
+
+
 @exporter.export
 def natural_neighbor_to_grid(xp, yp, variable, grid_x, grid_y):
     r"""Generate a natural neighbor interpolation of the given points to a regular grid.
@@ -170,7 +249,8 @@ def natural_neighbor_to_grid(xp, yp, variable, grid_x, grid_y):
 
 @exporter.export
 def inverse_distance_to_grid(xp, yp, variable, grid_x, grid_y, r, gamma=None, kappa=None,
-                             min_neighbors=3, kind='cressman'):
+                             min_neighbors=3, kind='cressman', passes=1, tile_size=None,
+                             executor=None):
     r"""Generate an inverse distance interpolation of the given points to a regular grid.
 
     Values are assigned to the given grid using inverse distance weighting based on either
@@ -193,7 +273,8 @@ def inverse_distance_to_grid(xp, yp, variable, grid_x, grid_y, r, gamma=None, ka
         Radius from grid center, within which observations
         are considered and weighted.
     gamma: float
-        Adjustable smoothing parameter for the barnes interpolation. Default None.
+        Adjustable smoothing parameter for the barnes interpolation. With multiple passes,
+        this only applies to the correction passes. Default None.
     kappa: float
         Response parameter for barnes interpolation. Default None.
     min_neighbors: int
@@ -202,6 +283,15 @@ def inverse_distance_to_grid(xp, yp, variable, grid_x, grid_y, r, gamma=None, ka
     kind: str
         Specify what inverse distance weighting interpolation to use.
         Options: 'cressman' or 'barnes'. Default 'cressman'
+    passes: int
+        Number of barnes passes to make, see `ObjectiveAnalysis`. Default 1.
+    tile_size: int
+        If given, analyze the grid in square tiles with this many points on a side, using
+        only the observations near each tile. This limits memory use for large grids
+        without changing the result. Default None, which analyzes the whole grid at once.
+    executor: `concurrent.futures.Executor`
+        Optional executor, such as a `~concurrent.futures.ProcessPoolExecutor`, used to
+        analyze tiles in parallel. Only used with ``tile_size``. Default None.
 
     Returns
     -------
@@ -215,9 +305,16 @@ def inverse_distance_to_grid(xp, yp, variable, grid_x, grid_y, r, gamma=None, ka
     """
     # Handle grid-to-points conversion, and use function from `interpolation`
     points_obs = list(zip(xp, yp, strict=False))
+    if tile_size is not None:
+        return _inverse_distance_tiled(points_obs, variable, grid_x, grid_y, r,
+                                       tile_size=tile_size, executor=executor, gamma=gamma,
+                                       kappa=kappa, min_neighbors=min_neighbors, kind=kind,
+                                       passes=passes)
+
     points_grid = generate_grid_coords(grid_x, grid_y)
     img = inverse_distance_to_points(points_obs, variable, points_grid, r, gamma=gamma,
-                                     kappa=kappa, min_neighbors=min_neighbors, kind=kind)
+                                     kappa=kappa, min_neighbors=min_neighbors, kind=kind,
+                                     passes=passes)
     return img.reshape(grid_x.shape)
 
 
@@ -226,7 +323,7 @@ def inverse_distance_to_grid(xp, yp, variable, grid_x, grid_y, r, gamma=None, ka
 def interpolate_to_grid(x, y, z, interp_type='linear', hres=50000,
                         minimum_neighbors=3, gamma=0.25, kappa_star=5.052,
                         search_radius=None, rbf_func='linear', rbf_smooth=0,
-                        boundary_coords=None):
+                        boundary_coords=None, passes=1, tile_size=None, executor=None):
     r"""Interpolate given (x,y), observation (z) pairs to a grid based on given parameters.
 
     Parameters
@@ -249,7 +346,8 @@ def interpolate_to_grid(x, y, z, interp_type='linear', hres=50000,
         Minimum number of neighbors needed to perform Barnes or Cressman interpolation for a
         point. Default is 3.
     gamma: float
-        Adjustable smoothing parameter for the barnes interpolation. Default 0.25.
+        Adjustable smoothing parameter for the barnes interpolation. With multiple passes,
+        this only applies to the correction passes. Default 0.25.
     kappa_star: float
         Response parameter for barnes interpolation, specified nondimensionally
         in terms of the Nyquist. Default 5.052
@@ -267,6 +365,17 @@ def interpolate_to_grid(x, y, z, interp_type='linear', hres=50000,
     boundary_coords: dict
         Optional dictionary containing coordinates of the study area boundary. Dictionary
         should be in format: {'west': west, 'south': south, 'east': east, 'north': north}
+    passes: int
+        Number of passes to make for barnes interpolation, see `ObjectiveAnalysis`.
+        Default 1.
+    tile_size: int
+        If given, interpolate to the grid in square tiles with this many points on a side,
+        using only the observations near each tile. This limits memory use for large grids
+        without changing the result. Only supported for Barnes and Cressman interpolation.
+        Default None, which interpolates to the whole grid at once.
+    executor: `concurrent.futures.Executor`
+        Optional executor, such as a `~concurrent.futures.ProcessPoolExecutor`, used to
+        interpolate tiles in parallel. Only used with ``tile_size``. Default None.
 
     Returns
     -------
@@ -297,11 +406,29 @@ def interpolate_to_grid(x, y, z, interp_type='linear', hres=50000,
 
     # Handle grid-to-points conversion, and use function from `interpolation`
     points_obs = np.array(list(zip(x, y, strict=False)))
+    if tile_size is not None:
+        if interp_type not in ('barnes', 'cressman'):
+            raise ValueError('Tiled interpolation is only supported for barnes and cressman '
+                             'interpolation.')
+
+        # Find the search radius and kappa from all the observations, not just a tile's
+        ave_spacing = tools.average_spacing(points_obs)
+        if search_radius is None:
+            search_radius = 5 * ave_spacing
+        kwargs = ({'gamma': gamma, 'kappa': tools.calc_kappa(ave_spacing, kappa_star)}
+                  if interp_type == 'barnes' else {})
+
+        img = _inverse_distance_tiled(points_obs, z, grid_x, grid_y, search_radius,
+                                      tile_size=tile_size, executor=executor,
+                                      min_neighbors=minimum_neighbors, kind=interp_type,
+                                      passes=passes, **kwargs)
+        return grid_x, grid_y, img
+
     points_grid = generate_grid_coords(grid_x, grid_y)
     img = interpolate_to_points(points_obs, z, points_grid, interp_type=interp_type,
                                 minimum_neighbors=minimum_neighbors, gamma=gamma,
                                 kappa_star=kappa_star, search_radius=search_radius,
-                                rbf_func=rbf_func, rbf_smooth=rbf_smooth)
+                                rbf_func=rbf_func, rbf_smooth=rbf_smooth, passes=passes)
 
     return grid_x, grid_y, img.reshape(grid_x.shape)
 
@@ -96,84 +96,155 @@ def interpolate_1d(x, xp, *args, axis=0, fill_value=np.nan, return_list_always=F
     xp and args must be the same shape.
 
     """
-    # Handle units
-    x, xp = _strip_matching_units(x, xp)
+    interpolator = VerticalInterpolator(x, xp, axis=axis, fill_value=fill_value)
+    ret = [interpolator(var) for var in args]
 
-    # Make x an array
-    x = np.asanyarray(x).reshape(-1)
+    if return_list_always or len(ret) > 1:
+        return ret
+    else:
+        return ret[0]
 
-    # Sort input data
-    sort_args = np.argsort(xp, axis=axis)
-    sort_x = np.argsort(x)
 
-    # The shape after all arrays are broadcast to each other
-    final_shape = np.broadcast_shapes(xp.shape, *(a.shape for a in args))
+@exporter.export
+class VerticalInterpolator:
+    r"""Interpolate any number of variables between the same sets of levels.
 
-    # indices for sorting
-    sorter = broadcast_indices(sort_args, final_shape, axis)
+    The sorting, bracketing indices, and weights used by `interpolate_1d` only depend on
+    the coordinates, so this calculates them once up front. Interpolating each variable then
+    only requires looking up the values on either side and a multiply-add, which makes
+    regridding many variables (or many times) with the same vertical coordinate much faster.
 
-    # sort xp -- need to make sure it's been manually broadcast due to our use of indices
-    # along all axes.
-    xp = np.broadcast_to(xp, final_shape)
-    xp = xp[sorter]
+    Parameters
+    ----------
+    x : array-like
+        1-D array of desired interpolated values.
 
-    # Ensure source arrays are also in sorted order
-    variables = [arr[sorter] for arr in args]
+    xp : array-like
+        The x-coordinates of the data points.
 
-    # Make x broadcast with xp
-    x_array = x[sort_x]
-    expand = [np.newaxis] * len(final_shape)
-    expand[axis] = slice(None)
-    x_array = x_array[tuple(expand)]
+    axis : int, optional
+        The axis to interpolate over. Defaults to 0.
 
-    # Calculate value above interpolated value
-    minv = np.apply_along_axis(np.searchsorted, axis, xp, x[sort_x])
-    minv2 = np.copy(minv)
+    fill_value: float, optional
+        Specify handling of interpolation points out of data bounds. If None, will return
+        ValueError if points are out of bounds. Defaults to nan.
 
-    # If fill_value is none and data is out of bounds, raise value error
-    if ((np.max(minv) == xp.shape[axis]) or (np.min(minv) == 0)) and fill_value is None:
-        raise ValueError('Interpolation point out of data bounds encountered')
+    log : bool, optional
+        Whether to interpolate on a logarithmic x-scale, like `log_interpolate_1d`.
+        Defaults to ``False``.
 
-    # Warn if interpolated values are outside data bounds, will make these the values
-    # at end of data range.
-    if np.max(minv) == xp.shape[axis]:
-        _warnings.warn('Interpolation point out of data bounds encountered')
-        minv2[minv == xp.shape[axis]] = xp.shape[axis] - 1
-    if np.min(minv) == 0:
-        minv2[minv == 0] = 1
+    Examples
+    --------
+     >>> import metpy.interpolate
+     >>> pressure = np.array([1000., 850., 700., 500.])
+     >>> interp = metpy.interpolate.VerticalInterpolator(np.array([925., 600.]), pressure,
+     ...                                                 log=True)
+     >>> interp(np.array([20., 12., 5., -10.]))
+     array([16.16234039, -1.87206832])
+     >>> interp(np.array([0., 1., 2., 3.]))
+     array([0.47970745, 2.45813789])
+
+    See Also
+    --------
+    interpolate_1d, log_interpolate_1d
 
-    # Get indices for broadcasting arrays
-    above = broadcast_indices(minv2, final_shape, axis)
-    below = broadcast_indices(minv2 - 1, final_shape, axis)
+    Notes
+    -----
+    Variables to interpolate must have the same shape as xp, or a shape that xp can be
+    broadcast to.
 
-    if np.any(x_array < xp[below]):
-        _warnings.warn('Interpolation point out of data bounds encountered')
+    """
 
-    # Create empty output list
-    ret = []
+    def __init__(self, x, xp, *, axis=0, fill_value=np.nan, log=False):
+        # Handle units
+        x, xp = _strip_matching_units(x, xp)
+        if log:
+            x = np.log(x)
+            xp = np.log(xp)
+
+        # Make x an array
+        x = np.asanyarray(x).reshape(-1)
+        xp = np.asanyarray(xp)
+        self.axis = axis
+        self.fill_value = fill_value
+        self._reverse = x[0] > x[-1]
+        num_levels = xp.shape[axis]
+
+        # Sort input data
+        sort_x = np.argsort(x)
+        xp, order = _sort_order(xp, axis)
+
+        # Make x broadcast with xp
+        x_array = x[sort_x]
+        expand = [np.newaxis] * xp.ndim
+        expand[axis] = slice(None)
+        x_array = x_array[tuple(expand)]
+
+        # Calculate value above interpolated value
+        minv = _bracket_index(xp, x[sort_x], axis)
+        minv2 = np.copy(minv)
+
+        # If fill_value is none and data is out of bounds, raise value error
+        if ((np.max(minv) == num_levels) or (np.min(minv) == 0)) and fill_value is None:
+            raise ValueError('Interpolation point out of data bounds encountered')
+
+        # Warn if interpolated values are outside data bounds, will make these the values
+        # at end of data range.
+        if np.max(minv) == num_levels:
+            _warnings.warn('Interpolation point out of data bounds encountered')
+            minv2[minv == num_levels] = num_levels - 1
+        if np.min(minv) == 0:
+            minv2[minv == 0] = 1
+
+        # Get indices for broadcasting arrays
+        xp_below = xp[broadcast_indices(minv2 - 1, xp.shape, axis)]
+        xp_above = xp[broadcast_indices(minv2, xp.shape, axis)]
+
+        if np.any(x_array < xp_below):
+            _warnings.warn('Interpolation point out of data bounds encountered')
+
+        # Points out of bounds get set to the fill value
+        self._out_of_bounds = (minv == num_levels) | (x_array < xp_below)
+        self._weights = (x_array - xp_below) / (xp_above - xp_below)
+
+        # Convert the indices in sorted order to ones into the original, unsorted data
+        if order is None:
+            self._below, self._above = minv2 - 1, minv2
+        elif isinstance(order, slice):
+            self._below, self._above = num_levels - minv2, num_levels - 1 - minv2
+        else:
+            self._below = np.take_along_axis(order, minv2 - 1, axis=axis)
+            self._above = np.take_along_axis(order, minv2, axis=axis)
+
+    def __call__(self, var):
+        """Interpolate a variable.
+
+        Parameters
+        ----------
+        var : array-like
+            The data to be interpolated, with the shape of xp (or one it broadcasts to).
+
+        Returns
+        -------
+        array-like
+            Interpolated values, with coordinates in the order given by x.
+
+        """
+        below = broadcast_indices(self._below, var.shape, self.axis)
+        above = broadcast_indices(self._above, var.shape, self.axis)
 
-    # Calculate interpolation for each variable
-    for var in variables:
         # Var needs to be on the *left* of the multiply to ensure that if it's a pint
         # Quantity, it gets to control the operation--at least until we make sure
         # masked arrays and pint play together better. See https://github.com/hgrecco/pint#633
-        var_interp = var[below] + (var[above] - var[below]) * ((x_array - xp[below])
-                                                               / (xp[above] - xp[below]))
+        var_interp = var[below] + (var[above] - var[below]) * self._weights
 
         # Set points out of bounds to fill value.
-        var_interp[minv == xp.shape[axis]] = fill_value
-        var_interp[x_array < xp[below]] = fill_value
+        var_interp[np.broadcast_to(self._out_of_bounds, var_interp.shape)] = self.fill_value
 
         # Check for input points in decreasing order and return output to match.
-        if x[0] > x[-1]:
-            var_interp = np.swapaxes(np.swapaxes(var_interp, 0, axis)[::-1], 0, axis)
-        # Output to list
-        ret.append(var_interp)
-
-    if return_list_always or len(ret) > 1:
-        return ret
-    else:
-        return ret[0]
+        if self._reverse:
+            var_interp = np.swapaxes(np.swapaxes(var_interp, 0, self.axis)[::-1], 0, self.axis)
+        return var_interp
 
 
 @exporter.export
@@ -229,6 +300,52 @@ def log_interpolate_1d(x, xp, *args, axis=0, fill_value=np.nan):
     return interpolate_1d(log_x, log_xp, *args, axis=axis, fill_value=fill_value)
 
 
+def _sort_order(xp, axis):
+    """Sort xp along an axis, returning the sorted values and order of the original indices.
+
+    The order is `None` when xp is already strictly increasing, and a reversing slice when
+    strictly decreasing, which is the common case of data on model or pressure levels.
+    """
+    # Masked values are sorted to the end and, as NaN, never count as below any target
+    values = _masked_to_nan(xp)
+    if not np.ma.is_masked(xp):
+        diffs = np.diff(values, axis=axis)
+        if np.all(diffs > 0):
+            return values, None
+        elif np.all(diffs < 0):
+            flip = [slice(None)] * xp.ndim
+            flip[axis] = slice(None, None, -1)
+            return values[tuple(flip)], flip[axis]
+
+    order = np.argsort(xp, axis=axis)
+    return np.take_along_axis(values, order, axis=axis), order
+
+
+def _masked_to_nan(xp):
+    """Return xp as a plain array, with any masked values replaced by NaN."""
+    values = np.asarray(xp)
+    if np.ma.is_masked(xp):
+        dtype = values.dtype if values.dtype.kind == 'f' else np.float64
+        values = np.ma.filled(np.ma.asarray(xp, dtype=dtype), np.nan)
+    return values
+
+
+def _bracket_index(xp, x, axis):
+    """Find the index of the first value in xp along axis at or above each value in x.
+
+    This is equivalent to `numpy.searchsorted` along every slice of sorted xp, but works on
+    all slices at once by counting the values below each target.
+    """
+    # Masked values must not count as below a target, whatever their underlying data
+    xp = _masked_to_nan(xp)
+    counts = []
+    for val in x:
+        # searchsorted puts nan at the end, after all valid values
+        below = ~np.isnan(xp) if np.isnan(val) else xp < val
+        counts.append(np.count_nonzero(below, axis=axis))
+    return np.stack(counts, axis=axis)
+
+
 def _strip_matching_units(*args):
     """Ensure arguments have same units and return with units stripped.
 
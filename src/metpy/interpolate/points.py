@@ -4,10 +4,13 @@
 """Interpolate data valid at one set of points to another in multiple dimensions."""
 
 import functools
+import itertools
 import logging
+import math
 
 import numpy as np
 from scipy.interpolate import griddata, Rbf
+from scipy.sparse import csr_array
 from scipy.spatial import ConvexHull, Delaunay, KDTree, QhullError
 
 from . import geometry, tools
@@ -194,19 +197,14 @@ def natural_neighbor_to_points(points, values, xi):
     natural_neighbor_to_grid
 
     """
-    tri = Delaunay(points)
-    members, circumcenters = geometry.find_natural_neighbors(tri, xi)
-
     if hasattr(values, 'units'):
         org_units = values.units
         values = values.magnitude
     else:
         org_units = None
 
-    img = np.asarray([natural_neighbor_point(*np.array(points).transpose(),
-                                             values, xi[grid], tri, neighbors, circumcenters)
-                      if len(neighbors) > 0 else np.nan
-                      for grid, neighbors in members.items()])
+    img = _natural_neighbor_interpolation(np.asarray(points, dtype=float), np.asarray(values),
+                                          np.asarray(xi, dtype=float))
 
     if org_units:
         img = units.Quantity(img, org_units)
@@ -214,9 +212,277 @@ def natural_neighbor_to_points(points, values, xi):
     return img
 
 
+def _natural_neighbor_interpolation(points, values, xi):
+    r"""Calculate natural neighbor interpolation for all points at once.
+
+    This computes the same weights as `natural_neighbor_point`, but for all of the
+    interpolation points in array form. For every pair of interpolation point and natural
+    neighbor triangle, each vertex gets the area of the piece of the triangle's Voronoi
+    region that the new point would steal. Pieces of the same Voronoi region join along the
+    shared edges of neighboring triangles, so these only need to be split at the edge
+    midpoints, while the outer edges of the region use the circumcenter of the
+    interpolation point and that edge. All areas are measured from the midpoint between
+    the interpolation point and the vertex, which lies on the new Voronoi edge.
+
+    Parameters
+    ----------
+    points: (N, 2) numpy.ndarray
+        Coordinates of the data points.
+    values: (N, ) numpy.ndarray
+        Values of the data points.
+    xi: (M, 2) numpy.ndarray
+        Points to interpolate the data onto.
+
+    Returns
+    -------
+    img: (M, ) numpy.ndarray
+        Interpolated values for each point in `xi`
+
+    """
+    def cross(a, b):
+        return a[..., 0] * b[..., 1] - a[..., 1] * b[..., 0]
+
+    tri = Delaunay(points)
+    grid_index, simplex, circumcenters = geometry._natural_neighbor_pairs(tri, xi)
+
+    # Duplicate points are left out of the triangulation; use the value from the first
+    _, first, inverse = np.unique(points, axis=0, return_index=True, return_inverse=True)
+    values = values[first[inverse.ravel()]]
+
+    # Points on top of an observation just take its value; the areas there are degenerate
+    dist, nearest = KDTree(points).query(xi)
+    on_point = dist == 0
+
+    # Orient the triangles counter-clockwise, along with their neighbors across each edge
+    # (neighbors[k] is opposite vertex k, so lies across the edge from k + 1 to k + 2).
+    simplices = tri.simplices
+    neighbors = np.roll(tri.neighbors, -2, axis=1)
+    corners = points[simplices]
+    flip = cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0]) < 0
+    simplices = np.where(flip[:, None], simplices[:, ::-1], simplices)
+    neighbors = np.where(flip[:, None], neighbors[:, [1, 0, 2]], neighbors)
+
+    # Edges whose neighboring triangle is also a natural neighbor are inside the region
+    ntri = len(simplices)
+    pair_keys = grid_index * ntri + simplex
+    edge_neighbors = neighbors[simplex]
+    inner = np.isin(grid_index[:, None] * ntri + edge_neighbors, pair_keys)
+    inner &= edge_neighbors >= 0
+
+    # Split each edge from vertex k to k + 1 at its midpoint, or at its circumcenter with the
+    # interpolation point along the outer edge.
+    grid = xi[grid_index][:, None]
+    verts = points[simplices[simplex]]
+    nverts = np.roll(verts, -1, axis=1)
+    edge_pts = 0.5 * (verts + nverts)
+    outer_cc, d_div = geometry._circumcenters(grid, verts, nverts)
+    edge_pts = np.where(inner[..., None], edge_pts, outer_cc)
+
+    # Any interpolation point collinear with an outer edge can't be handled
+    bad = np.zeros(len(xi), dtype=bool)
+    bad[grid_index] = ((d_div == 0) & ~inner).any(axis=1)
+    bad &= ~on_point
+    if bad.any():
+        log.warning('Error during processing of a grid. Interpolation will continue but be '
+                    'mindful of errors in output. Unable to calculate natural neighbor '
+                    'weights for %d points.', np.count_nonzero(bad))
+
+    # Area for vertex k from the edge before it, through the circumcenter, to the edge after
+    ref = 0.5 * (grid + verts)
+    center = circumcenters[simplex][:, None]
+    before = np.roll(edge_pts, 1, axis=1) - ref
+    after = edge_pts - ref
+    center = center - ref
+    with np.errstate(invalid='ignore'):
+        areas = 0.5 * (cross(after, center) + cross(center, before))
+
+    # Sum the weighted areas up for each point
+    area_values = areas * values[simplices[simplex]]
+    total_area = np.bincount(grid_index, weights=areas.sum(axis=1), minlength=len(xi))
+    total = np.bincount(grid_index, weights=area_values.sum(axis=1), minlength=len(xi))
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        img = total / total_area
+    img[bad | (total_area == 0)] = np.nan
+    img[on_point] = values[nearest[on_point]]
+    return img
+
+
+@exporter.export
+class ObjectiveAnalysis:
+    r"""Apply inverse distance weighting between a fixed set of observations and points.
+
+    The neighbor search and the weights used by `inverse_distance_to_points` only depend on
+    the locations of the observations and the interpolation points, so this calculates them
+    once up front and stores them as a sparse matrix. Analyzing each variable (or each time)
+    then only requires a sparse matrix-vector product, which makes repeated analyses with
+    the same station network much faster.
+
+    Parameters
+    ----------
+    points: array-like, (N, 2)
+        Coordinates of the data points.
+    xi: array-like, (M, 2)
+        Points to interpolate the data onto.
+    r: float
+        Radius from grid center, within which observations are considered and weighted.
+    gamma: float
+        Adjustable smoothing parameter for the barnes interpolation. With multiple passes,
+        this only applies to the correction passes. Default None.
+    kappa: float
+        Response parameter for barnes interpolation. Default None.
+    min_neighbors: int
+        Minimum number of neighbors needed to perform barnes or cressman interpolation
+        for a point. Default is 3.
+    kind: str
+        Specify what inverse distance weighting interpolation to use.
+        Options: 'cressman' or 'barnes'. Default 'cressman'
+    passes: int
+        Number of barnes passes to make. Each pass after the first analyzes the residuals
+        of the previous passes at the data points and adds them to the result. Default 1.
+    workers: int
+        Number of workers to use for the neighbor search. -1, the default, uses all
+        available CPUs.
+
+    Attributes
+    ----------
+    tree: `scipy.spatial.KDTree`
+        Tree of the data points.
+    weights: `scipy.sparse.csr_array`, (M, N)
+        Normalized weights for each of the data points at each interpolation point, for the
+        first pass.
+
+    Examples
+    --------
+     >>> import metpy.interpolate
+     >>> points = np.array([[0., 0.], [1., 0.], [0., 1.], [1., 1.]])
+     >>> analysis = metpy.interpolate.ObjectiveAnalysis(points, [[0.5, 0.5], [0.25, 0.]], 1,
+     ...                                                min_neighbors=1)
+     >>> analysis(np.array([1., 2., 3., 4.]))
+     array([2.5       , 1.24089069])
+     >>> analysis(np.array([0., 1., 0., 1.]))
+     array([0.5       , 0.24089069])
+
+    See Also
+    --------
+    inverse_distance_to_points, inverse_distance_to_grid
+
+    Notes
+    -----
+    Variables to analyze must have the data points along their first dimension; any
+    other dimensions, e.g. time, are analyzed all at once.
+
+    Multiple passes follow [Koch1983]_: the first pass uses ``kappa``, and each later pass
+    uses ``gamma * kappa`` to add in the remaining differences between the observations and
+    the analysis interpolated to the observation locations. Those analyzed values use the
+    same neighbor search and weights, precomputed between the data points themselves.
+
+    """
+
+    def __init__(self, points, xi, r, *, gamma=None, kappa=None, min_neighbors=3,
+                 kind='cressman', passes=1, workers=-1):
+        if kind == 'cressman':
+            if passes > 1:
+                raise ValueError('Multiple passes are only supported for barnes '
+                                 'interpolation.')
+            weight_funcs = [functools.partial(tools.cressman_weights, r=r)]
+        elif kind == 'barnes':
+            gamma = 1 if gamma is None else gamma
+            if passes > 1:
+                weight_funcs = [functools.partial(tools.barnes_weights, kappa=kappa, gamma=1),
+                                functools.partial(tools.barnes_weights, kappa=kappa,
+                                                  gamma=gamma)]
+            else:
+                weight_funcs = [functools.partial(tools.barnes_weights, kappa=kappa,
+                                                  gamma=gamma)]
+        else:
+            raise ValueError(f'{kind} interpolation not supported.')
+
+        self.passes = passes
+        self.tree = KDTree(points)
+        self._grid_weights, self._valid = self._calc_weights(xi, r, weight_funcs,
+                                                             min_neighbors, workers)
+        self.weights = self._grid_weights[0]
+
+        # Successive passes need the analysis at the observations too. Each observation is
+        # its own neighbor, so always use whatever neighbors there are to get a residual.
+        if passes > 1:
+            self._obs_weights, _ = self._calc_weights(self.tree.data, r, weight_funcs, 1,
+                                                      workers)
+
+    def _calc_weights(self, xi, r, weight_funcs, min_neighbors, workers):
+        """Calculate sparse weight matrices from the data points to each point in `xi`."""
+        xi = np.asarray(xi, dtype=float).reshape(-1, 2)
+        indices = self.tree.query_ball_point(xi, r=r, workers=workers)
+
+        # Flatten the neighbor lists into the layout of a sparse matrix
+        counts = np.fromiter(map(len, indices), dtype=np.intp, count=len(indices))
+        cols = np.fromiter(itertools.chain.from_iterable(indices), dtype=np.intp,
+                           count=counts.sum())
+        rows = np.repeat(np.arange(len(xi)), counts)
+        indptr = np.r_[0, np.cumsum(counts)]
+
+        # Normalize the weights for each point, leaving out points without enough neighbors
+        grid = xi[rows]
+        obs = self.tree.data[cols]
+        sq_dist = geometry.dist_2(grid[:, 0], grid[:, 1], obs[:, 0], obs[:, 1])
+        valid = counts >= min_neighbors
+
+        matrices = []
+        for weight_func in weight_funcs:
+            weights = weight_func(sq_dist)
+            total_weights = np.bincount(rows, weights=weights, minlength=len(xi))
+            with np.errstate(divide='ignore', invalid='ignore'):
+                weights = np.where(valid[rows], weights / total_weights[rows], 0)
+            matrices.append(csr_array((weights, cols, indptr),
+                                      shape=(len(xi), self.tree.n)))
+
+        return matrices, valid
+
+    def __call__(self, values):
+        r"""Analyze values at the data points to the interpolation points.
+
+        Parameters
+        ----------
+        values: array-like, (N, ...)
+            Values of the data points.
+
+        Returns
+        -------
+        img: numpy.ndarray, (M, ...)
+            Array representing the interpolated values for each interpolation point
+
+        """
+        if hasattr(values, 'units'):
+            org_units = values.units
+            values = values.magnitude
+        else:
+            org_units = None
+
+        values = np.asarray(values)
+        flat_values = values.reshape(len(values), math.prod(values.shape[1:]))
+        img = self.weights @ flat_values
+
+        if self.passes > 1:
+            analysis = self._obs_weights[0] @ flat_values
+            for i in range(1, self.passes):
+                residual = flat_values - analysis
+                img += self._grid_weights[1] @ residual
+                if i < self.passes - 1:
+                    analysis += self._obs_weights[1] @ residual
+
+        img = img.reshape((-1,) + values.shape[1:])
+        img[~self._valid] = np.nan
+
+        if org_units:
+            img = units.Quantity(img, org_units)
+
+        return img
+
+
 @exporter.export
 def inverse_distance_to_points(points, values, xi, r, gamma=None, kappa=None, min_neighbors=3,
-                               kind='cressman'):
+                               kind='cressman', passes=1):
     r"""Generate an inverse distance weighting interpolation to the given points.
 
     Values are assigned to the given interpolation points based on either [Cressman1959]_ or
@@ -233,7 +499,8 @@ def inverse_distance_to_points(points, values, xi, r, gamma=None, kappa=None, mi
     r: float
         Radius from grid center, within which observations are considered and weighted.
     gamma: float
-        Adjustable smoothing parameter for the barnes interpolation. Default None.
+        Adjustable smoothing parameter for the barnes interpolation. With multiple passes,
+        this only applies to the correction passes. Default None.
     kappa: float
         Response parameter for barnes interpolation. Default None.
     min_neighbors: int
@@ -242,6 +509,8 @@ def inverse_distance_to_points(points, values, xi, r, gamma=None, kappa=None, mi
     kind: str
         Specify what inverse distance weighting interpolation to use.
         Options: 'cressman' or 'barnes'. Default 'cressman'
+    passes: int
+        Number of barnes passes to make, see `ObjectiveAnalysis`. Default 1.
 
     Returns
     -------
@@ -250,39 +519,17 @@ def inverse_distance_to_points(points, values, xi, r, gamma=None, kappa=None, mi
 
     See Also
     --------
-    inverse_distance_to_grid
+    inverse_distance_to_grid, ObjectiveAnalysis
 
     """
-    if kind == 'cressman':
-        interp_func = functools.partial(cressman_point, radius=r)
-    elif kind == 'barnes':
-        interp_func = functools.partial(barnes_point, kappa=kappa, gamma=gamma)
-    else:
-        raise ValueError(f'{kind} interpolation not supported.')
-
-    obs_tree = KDTree(points)
-    indices = obs_tree.query_ball_point(xi, r=r)
-
-    if hasattr(values, 'units'):
-        org_units = values.units
-        values = values.magnitude
-    else:
-        org_units = None
-
-    img = np.asarray([interp_func(geometry.dist_2(*grid, *obs_tree.data[matches].T),
-                                  values[matches]) if len(matches) >= min_neighbors else np.nan
-                      for matches, grid in zip(indices, xi, strict=False)])
-
-    if org_units:
-        img = units.Quantity(img, org_units)
-
-    return img
+    return ObjectiveAnalysis(points, xi, r, gamma=gamma, kappa=kappa,
+                             min_neighbors=min_neighbors, kind=kind, passes=passes)(values)
 
 
 @exporter.export
 def interpolate_to_points(points, values, xi, interp_type='linear', minimum_neighbors=3,
                           gamma=0.25, kappa_star=5.052, search_radius=None, rbf_func='linear',
-                          rbf_smooth=0):
+                          rbf_smooth=0, passes=1):
     r"""Interpolate unstructured point data to the given points.
 
     This function interpolates the given `values` valid at ``points`` to the points `xi`.
@@ -314,7 +561,8 @@ def interpolate_to_points(points, values, xi, interp_type='linear', minimum_neig
         Minimum number of neighbors needed to perform Barnes or Cressman interpolation for a
         point. Default is 3.
     gamma: float
-        Adjustable smoothing parameter for the barnes interpolation. Default 0.25.
+        Adjustable smoothing parameter for the barnes interpolation. With multiple passes,
+        this only applies to the correction passes. Default 0.25.
     kappa_star: float
         Response parameter for barnes interpolation, specified non-dimensionally
         in terms of the Nyquist. Default 5.052.
@@ -329,6 +577,9 @@ def interpolate_to_points(points, values, xi, interp_type='linear', minimum_neig
         information.
     rbf_smooth: float
         Smoothing value applied to rbf interpolation.  Higher values result in more smoothing.
+    passes: int
+        Number of passes to make for barnes interpolation, see `ObjectiveAnalysis`.
+        Default 1.
 
     Returns
     -------
@@ -379,7 +630,7 @@ def interpolate_to_points(points, values, xi, interp_type='linear', minimum_neig
             kappa = tools.calc_kappa(ave_spacing, kappa_star)
             return inverse_distance_to_points(points, values, xi, search_radius, gamma, kappa,
                                               min_neighbors=minimum_neighbors,
-                                              kind=interp_type)
+                                              kind=interp_type, passes=passes)
 
     # If this is radial basis function, make the interpolator and apply it
     elif interp_type == 'rbf':
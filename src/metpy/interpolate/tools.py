@@ -4,7 +4,7 @@
 """Assorted tools in support of interpolation functionality."""
 
 import numpy as np
-from scipy.spatial.distance import cdist
+from scipy.spatial import KDTree
 
 from ..package_tools import Exporter
 
@@ -42,10 +42,9 @@ def average_spacing(points):
         The average distance to the nearest neighbor across all points
 
     """
-    dist_matrix = cdist(points, points)
-    diag = np.arange(len(dist_matrix))
-    dist_matrix[diag, diag] = np.nan
-    return np.nanmin(dist_matrix, axis=0).mean()
+    # The closest point to each point is itself, so look for the second closest
+    dist, _ = KDTree(points).query(points, k=2, workers=-1)
+    return dist[:, 1].mean()
 
 
 @exporter.export
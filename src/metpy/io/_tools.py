@@ -7,8 +7,9 @@ import bz2
 from collections import namedtuple
 import contextlib
 import gzip
-from io import BytesIO, UnsupportedOperation
+from io import BufferedReader, BytesIO, FileIO, UnsupportedOperation
 import logging
+import mmap
 from struct import Struct
 import zlib
 
@@ -215,10 +216,28 @@ class IOBuffer:
         self.reset()
 
     @classmethod
-    def fromfile(cls, fobj):
-        """Initialize the IOBuffer with the contents of the file object."""
+    def fromfile(cls, fobj, *, use_mmap=False):
+        """Initialize the IOBuffer with the contents of the file object.
+
+        If `use_mmap` is True and `fobj` is a regular, uncompressed file on disk, the
+        contents are memory-mapped rather than read, so that only the parts of the file
+        that are accessed are paged into memory.
+        """
+        if use_mmap and isinstance(fobj, BufferedReader | FileIO):
+            with contextlib.suppress(AttributeError, OSError, UnsupportedOperation,
+                                     ValueError):
+                if fobj.tell() == 0:
+                    buf = cls.__new__(cls)
+                    buf._data = mmap.mmap(fobj.fileno(), 0, access=mmap.ACCESS_READ)
+                    buf.reset()
+                    return buf
         return cls(fobj.read())
 
+    def close(self):
+        """Release the memory-mapped file, if any, holding the contents."""
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+
     def reset(self):
         """Reset buffer back to initial state."""
         self._offset = 0
@@ -603,8 +603,10 @@ class GempakFile:
         """Instantiate GempakFile object from file."""
         fobj = open_as_needed(file)
 
+        # Memory-map uncompressed files on disk so that only the headers and any grids
+        # or stations that are requested get read
         with contextlib.closing(fobj):
-            self._buffer = IOBuffer.fromfile(fobj)
+            self._buffer = IOBuffer.fromfile(fobj, use_mmap=True)
 
         # Save file start position as pointers use this as reference
         self._start = self._buffer.set_mark()
@@ -740,6 +742,23 @@ class GempakFile:
                     else:
                         self.parameters[n][attr] += self._buffer.read_binary(*fmt)
 
+    def close(self):
+        """Close the underlying file.
+
+        Files on disk are memory-mapped and read as data are requested, so the file stays
+        open until this is called (or the object is used as a context manager). No data can
+        be read afterwards.
+        """
+        self._buffer.close()
+
+    def __enter__(self):
+        """Use the file as a context manager, closing it on exit."""
+        return self
+
+    def __exit__(self, *args):
+        """Close the file when leaving the context."""
+        self.close()
+
     def _swap_bytes(self, binary):
         """Swap between little and big endian."""
         self.swapped_bytes = (struct.pack('@i', 1) != binary)
@@ -819,6 +838,22 @@ class GempakFile:
             # Shift right the low 32 bits
             return (i & 0xffffffff) >> -shift
 
+    @staticmethod
+    def _unpack_bits(words, bits, count):
+        """Unpack integers of a given bit width packed into a sequence of 32-bit words.
+
+        Values are packed from the most significant bit of each word and can span word
+        boundaries.
+        """
+        words = np.asarray(words).astype(np.uint32).astype(np.uint64)
+        # Pair each word with the following one so that any value can be pulled out of
+        # a single 64-bit integer
+        pairs = (words << np.uint64(32)) | np.append(words[1:], np.uint64(0))
+        start = np.arange(count, dtype=np.uint64) * np.uint64(bits)
+        shift = np.uint64(64 - bits) - start % np.uint64(32)
+        mask = np.uint64(2**bits - 1)
+        return ((pairs[start // np.uint64(32)] >> shift) & mask).astype(np.int64)
+
     @staticmethod
     def _decode_strip(b):
         """Decode bytes to string and strip whitespace."""
@@ -1066,50 +1101,28 @@ class GempakGrid(GempakFile):
 
             imiss = 2**self.grid_meta_int.bits - 1
             lendat = self.data_header_length - part.header_length - 8
-            packed_buffer_fmt = f'{self.prefmt}{lendat}i'
-            packed_buffer = self._buffer.read_struct(struct.Struct(packed_buffer_fmt))
-            grid = np.zeros((self.ky, self.kx), dtype=np.float32)
+            packed_buffer = self._buffer.read_array(lendat, f'{self.prefmt}i4')
 
             if lendat > 1:
-                iword = 0
-                ibit = 1
-                first = True
-                for j in range(self.ky):
-                    line = False
-                    for i in range(self.kx):
-                        jshft = self.grid_meta_int.bits + ibit - 33
-                        idat = self._fortran_ishift(packed_buffer[iword], jshft)
-                        idat &= imiss
-
-                        if jshft > 0:
-                            jshft -= 32
-                            idat2 = self._fortran_ishift(packed_buffer[iword + 1], jshft)
-                            idat |= idat2
-
-                        ibit += self.grid_meta_int.bits
-                        if ibit > 32:
-                            ibit -= 32
-                            iword += 1
-
-                        if (self.grid_meta_int.missing_flag and idat == imiss):
-                            grid[j, i] = self.prod_desc.missing_float
-                        else:
-                            if first:
-                                grid[j, i] = self.grid_meta_real.reference
-                                psav = self.grid_meta_real.reference
-                                plin = self.grid_meta_real.reference
-                                line = True
-                                first = False
-                            else:
-                                if not line:
-                                    grid[j, i] = plin + (self.grid_meta_real.diffmin
-                                                         + idat * self.grid_meta_real.scale)
-                                    line = True
-                                    plin = grid[j, i]
-                                else:
-                                    grid[j, i] = psav + (self.grid_meta_real.diffmin
-                                                         + idat * self.grid_meta_real.scale)
-                                psav = grid[j, i]
+                idat = self._unpack_bits(packed_buffer, self.grid_meta_int.bits,
+                                         self.ky * self.kx).reshape(self.ky, self.kx)
+                valid = ~((idat == imiss) & bool(self.grid_meta_int.missing_flag))
+                diffs = np.where(valid, self.grid_meta_real.diffmin
+                                 + idat * self.grid_meta_real.scale, 0)
+
+                # Each row starts from the first valid point in the previous row with valid
+                # points, with the very first valid point given by the reference value.
+                # The remaining points are differences from the prior valid point in the row.
+                has_valid = valid.any(axis=1)
+                row_first = np.argmax(valid, axis=1)
+                rows = np.arange(self.ky)
+                row_diffs = np.where(has_valid, diffs[rows, row_first], 0)
+                if has_valid.any():
+                    row_diffs[np.argmax(has_valid)] = 0
+                diffs[rows, row_first] = 0
+                grid = (self.grid_meta_real.reference + np.cumsum(row_diffs)[:, None]
+                        + np.cumsum(diffs, axis=1))
+                grid = np.where(valid, grid, self.prod_desc.missing_float).astype(np.float32)
             else:
                 grid = None
 
@@ -1127,34 +1140,16 @@ class GempakGrid(GempakFile):
             # grid_start = self._buffer.set_mark()
 
             lendat = self.data_header_length - part.header_length - 6
-            packed_buffer_fmt = f'{self.prefmt}{lendat}i'
+            packed_buffer = self._buffer.read_array(lendat, f'{self.prefmt}i4')
 
-            grid = np.zeros(self.grid_meta_int.kxky, dtype=np.float32)
-            packed_buffer = self._buffer.read_struct(struct.Struct(packed_buffer_fmt))
             if lendat > 1:
                 imax = 2**self.grid_meta_int.bits - 1
-                ibit = 1
-                iword = 0
-                for cell in range(self.grid_meta_int.kxky):
-                    jshft = self.grid_meta_int.bits + ibit - 33
-                    idat = self._fortran_ishift(packed_buffer[iword], jshft)
-                    idat &= imax
-
-                    if jshft > 0:
-                        jshft -= 32
-                        idat2 = self._fortran_ishift(packed_buffer[iword + 1], jshft)
-                        idat |= idat2
-
-                    if (idat == imax) and self.grid_meta_int.missing_flag:
-                        grid[cell] = self.prod_desc.missing_float
-                    else:
-                        grid[cell] = (self.grid_meta_real.reference
-                                      + (idat * self.grid_meta_real.scale))
-
-                    ibit += self.grid_meta_int.bits
-                    if ibit > 32:
-                        ibit -= 32
-                        iword += 1
+                idat = self._unpack_bits(packed_buffer, self.grid_meta_int.bits,
+                                         self.grid_meta_int.kxky)
+                grid = (self.grid_meta_real.reference
+                        + idat * self.grid_meta_real.scale).astype(np.float32)
+                if self.grid_meta_int.missing_flag:
+                    grid[idat == imax] = self.prod_desc.missing_float
             else:
                 grid = None
 
@@ -6,6 +6,8 @@
 from collections import namedtuple
 import contextlib
 from datetime import datetime, timezone
+import itertools
+import re
 import warnings
 
 import numpy as np
@@ -61,6 +63,67 @@ col_units = {'station_id': None,
              'current_wx3_symbol': None}
 
 
+class _MetarColumns:
+    """Accumulate decoded METAR reports into typed column arrays.
+
+    Values are stored into preallocated NumPy arrays (grown as needed) rather than keeping a
+    `Metar` per report, and text fields with few distinct values are stored as codes so that
+    they can be handed to pandas as categoricals.
+    """
+
+    dtypes = {'station_id': object, 'latitude': np.float64, 'longitude': np.float64,
+              'elevation': np.float64, 'date_time': 'datetime64[ns]',
+              'wind_direction': np.float64, 'wind_speed': np.float64,
+              'wind_gust': np.float64, 'visibility': np.float64, 'current_wx1': np.int16,
+              'current_wx2': np.int16, 'current_wx3': np.int16, 'skyc1': np.int16,
+              'skylev1': np.float64, 'skyc2': np.int16, 'skylev2': np.float64,
+              'skyc3': np.int16, 'skylev3': np.float64, 'skyc4': np.int16,
+              'skylev4': np.float64, 'cloudcover': np.int64, 'temperature': np.float64,
+              'dewpoint': np.float64, 'altimeter': np.float64,
+              'current_wx1_symbol': np.int64, 'current_wx2_symbol': np.int64,
+              'current_wx3_symbol': np.int64, 'remarks': object}
+
+    categorical = ('current_wx1', 'current_wx2', 'current_wx3', 'skyc1', 'skyc2', 'skyc3',
+                   'skyc4')
+
+    def __init__(self, size=1024):
+        self._size = 0
+        self._columns = {name: np.empty(size, dtype=dtype)
+                         for name, dtype in self.dtypes.items()}
+        self._categories = {name: {} for name in self.categorical}
+
+    def __len__(self):
+        """Return the number of reports accumulated."""
+        return self._size
+
+    def append(self, metar):
+        """Add the values from a single `Metar`."""
+        ind = self._size
+        if ind == len(self._columns['station_id']):
+            for name, col in self._columns.items():
+                self._columns[name] = np.concatenate((col, np.empty_like(col)))
+
+        for name, value in zip(Metar._fields, metar, strict=True):
+            if name in self._categories:
+                # Missing values (nan) get the code -1, which pandas treats as missing
+                value = (self._categories[name].setdefault(value, len(self._categories[name]))
+                         if isinstance(value, str) else -1)
+            elif name == 'date_time' and not isinstance(value, datetime):
+                value = np.datetime64('NaT')
+            self._columns[name][ind] = value
+        self._size += 1
+
+    def to_dataframe(self):
+        """Create a `pandas.DataFrame` from the accumulated columns."""
+        data = {}
+        for name, col in self._columns.items():
+            col = col[:self._size]
+            if name in self._categories:
+                col = pd.Categorical.from_codes(col, categories=list(self._categories[name]))
+            data[name] = col
+        return pd.DataFrame(data)
+
+
 def _tree_repr_(self):
     """Produce string representation of a TreeNodex object."""
     rep = self.__class__.__name__ + '('
@@ -77,6 +140,118 @@ def _tree_repr_(self):
 # Monkey patch to improve debugging
 TreeNode.__repr__ = _tree_repr_
 
+# Conversion factors used when decoding, so that Pint is not needed for every report
+_KNOTS_PER_MPS = units.Quantity(1, 'm/s').m_as('knots')
+_METERS_PER_MILE = units.Quantity(1, 'mile').m_as('meter')
+_INHG_PER_HPA = units.Quantity(1, 'hPa').m_as('inHg')
+
+# Counter used to generate unique names for the groups making up the atomic matches
+_atomic_counter = itertools.count()
+
+
+def _atomic(pattern):
+    """Match `pattern` without allowing backtracking into it (like a PEG expression)."""
+    name = f'_a{next(_atomic_counter)}'
+    return f'(?=(?P<{name}>{pattern}))(?P={name})'
+
+
+def _opt(*parts):
+    return _atomic(f'(?:{"".join(parts)})?')
+
+
+def _star(*parts):
+    return _atomic(f'(?:{"".join(parts)})*')
+
+
+def _plus(*parts):
+    return _atomic(f'(?:{"".join(parts)})+')
+
+
+def _choice(*alternatives):
+    return _atomic(f'(?:{"|".join(alternatives)})')
+
+
+def _build_metar_regex():
+    r"""Build a regular expression equivalent to the METAR grammar.
+
+    This mirrors the rules in ``_metar_parser/metar_parser.peg`` one-to-one. Every
+    repetition, optional, and ordered choice is made atomic so that the regular expression
+    commits to the same (greedy, non-backtracking) match that the PEG parser does. Named
+    groups capture the text of the rules used by `parse_metar`.
+    """
+    def sep():
+        return _plus(' ')
+
+    def auto():
+        return _opt(_plus(sep(), _choice('AUTO', 'COR')))
+
+    def wx():
+        return (_opt('[-+]', _opt(' ')) + _opt('VC')
+                + _plus(_choice('MI', 'BC', 'PR', 'DR', 'BL', 'SH', 'TS', 'FZ', 'DZ', 'RA',
+                                'SN', 'SG', 'PL', 'GR', 'GS', 'UP', 'BR', 'FG', 'FU', 'VA',
+                                'DU', 'SA', 'HZ', 'PO', 'SQ', 'FC', 'SS', 'DS', 'IC', 'PY')))
+
+    def temp():
+        return _opt('[M]') + _opt(d) + _opt(d)
+
+    d = r'\d'
+    cover = _choice(_choice('FEW', 'SCT', 'BKN', 'OVC', 'VV', '///') + _opt(_star(d))
+                    + _opt(_choice('TCU', 'CB', '//' + _opt('/'))),
+                    _choice('CLR', 'SKC', 'NSC', 'NCD'), wx(), '//')
+
+    metar = _opt('COR ') + _opt(_choice('METAR', 'SPECI')) + auto()
+    siteid = _opt(sep()) + '[0-9A-Z]' * 4
+    date_time = sep() + _plus(d) + 'Z'
+    wind = _opt(_opt(sep()), f'(?P<wind_dir>{_opt(_choice(d * 3, "VAR", "VRB", "///"))})',
+                f'(?P<wind_spd>{_opt(_choice(d + d + _opt(d), "//"))})',
+                f'(?P<gust>{_opt("G", _plus(d))})', _choice('KT', 'MPS'),
+                _opt(sep(), d * 3, 'V', d * 3))
+    vis = _opt(sep(), _choice(d * 4 + _opt('NDV'),
+                              d + _opt(_choice(d, _opt(' ', d) + '/' + d + _opt(d))) + 'SM',
+                              'M' + d + '/' + d + 'SM', 'CAVOK', '////'),
+               _opt(sep(), d * 4, _opt('[NSEW]'), _opt('[NSEW]')))
+    run = _star(sep(), 'R', _opt('[LRC]'), d * 2, _opt('[LRC]'), '/', _opt(d * 4, 'V'),
+                _opt('["M/ P]'), d * 4, _opt('FT'), _opt(_opt('/'), '[UDN]'))
+    curwx = _opt(_choice(sep() + '//', sep() + 'NSW', _star(sep(), wx())))
+    skyc = _opt(_star(sep(), cover))
+    temp_dewp = _opt(sep(), _opt('//'), f'(?P<temp>{temp()})', '/', f'(?P<dewp>{temp()})',
+                     _opt('//'))
+    altim = _opt(_opt(sep()), '["Q/ A]', d * 4, _opt('='))
+    remarks = _opt(_opt(sep()), _choice('RMK', _star('NOSIG')), '.*')
+    end = _opt(_opt(sep()), '=')
+
+    return re.compile(
+        f'{metar}(?P<siteid>{siteid})(?P<datetime>{date_time}){auto()}(?P<wind>{wind})'
+        f'(?P<vis>{vis}){run}(?P<curwx>{curwx})(?P<skyc>{skyc})(?P<temp_dewp>{temp_dewp})'
+        f'(?P<altim>{altim})(?P<remarks>{remarks}){end}', re.DOTALL)
+
+
+_metar_regex = _build_metar_regex()
+
+
+class _MatchNode:
+    """Stand in for the parts of the PEG parse tree used by `parse_metar`."""
+
+    def __init__(self, match, group=0):
+        self._match = match
+        self.text = match.group(group) or ''
+
+    def __getattr__(self, name):
+        # Only called for missing attributes, so cache the child node for repeated access
+        node = _MatchNode(self._match, name)
+        setattr(self, name, node)
+        return node
+
+
+def _parse_tree(metar_text):
+    """Decode a METAR, using the regular expression and only falling back to the parser.
+
+    The full (Canopy-generated) parser is only needed for reports the regular expression
+    does not match, where it raises `ParseError` with a useful message.
+    """
+    match = _metar_regex.fullmatch(metar_text)
+    return parse(metar_text) if match is None else _MatchNode(match)
+
 
 @exporter.export
 def parse_metar_to_dataframe(metar_text, *, year=None, month=None):
@@ -167,8 +342,9 @@ def parse_metar(metar_text, year, month, station_metadata=station_info):
     # Decode the data using the parser (built using Canopy) the parser utilizes a grammar
     # file which follows the format structure dictated by the WMO Handbook, but has the
     # flexibility to decode the METAR text when there are missing or incorrectly
-    # encoded values
-    tree = parse(metar_text)
+    # encoded values. Most reports are handled by an equivalent regular expression, which
+    # is much faster.
+    tree = _parse_tree(metar_text)
 
     # Station ID which is used to find the latitude, longitude, and elevation
     station_id = tree.siteid.text.strip()
@@ -206,7 +382,7 @@ def parse_metar(metar_text, year, month, station_metadata=station_info):
             wind_spd = float(tree.wind.wind_spd.text)
             if 'MPS' in tree.wind.text:
                 wind_units = 'm/s'
-                wind_spd = units.Quantity(wind_spd, wind_units).m_as('knots')
+                wind_spd *= _KNOTS_PER_MPS
             if (tree.wind.wind_dir.text == 'VRB') or (tree.wind.wind_dir.text == 'VAR'):
                 wind_dir = np.nan
             else:
@@ -218,8 +394,9 @@ def parse_metar(metar_text, year, month, station_metadata=station_info):
 
     # Parse out the wind gust field
     if 'G' in tree.wind.text:
-        wind_gust = units.Quantity(float(tree.wind.gust.text.strip()[1:]),
-                                   wind_units).m_as('knots')
+        wind_gust = float(tree.wind.gust.text.strip()[1:])
+        if wind_units == 'm/s':
+            wind_gust *= _KNOTS_PER_MPS
     else:
         wind_gust = np.nan
 
@@ -243,7 +420,7 @@ def parse_metar(metar_text, year, month, station_metadata=station_info):
                 visibility += int(num) / int(denom)
             else:  # Should be getting all cases of whole number without fraction
                 visibility += int(vis_str)
-            visibility = units.Quantity(visibility, 'miles').m_as('meter')
+            visibility *= _METERS_PER_MILE
         # CAVOK means vis is "at least 10km" and no significant clouds or weather
         elif 'CAVOK' in tree.vis.text:
             visibility = 10000
@@ -323,7 +500,7 @@ def parse_metar(metar_text, year, month, station_metadata=station_info):
     # Set the altimeter value and sea level pressure
     if tree.altim.text:
         val = float(tree.altim.text.strip()[1:5])
-        altim = val / 100 if val > 1100 else units.Quantity(val, 'hPa').m_as('inHg')
+        altim = val / 100 if val > 1100 else val * _INHG_PER_HPA
     else:
         altim = np.nan
 
@@ -360,37 +537,104 @@ def parse_metar_file(filename, *, year=None, month=None):
     `pandas.DataFrame`
 
     """
-    # Function to merge METARs
-    def full_metars(x, prefix='     '):
-        tmp = []
-        for i in x:
-            # Skip any blank lines
-            if not i.strip():
-                continue
-            # No prefix signals a new report, so yield
-            if not i.startswith(prefix) and tmp:
-                yield ' '.join(tmp)
-                tmp = []
-            tmp.append(i.strip())
-
-        # Handle any leftovers
-        if tmp:
-            yield ' '.join(tmp)
-
     # Open the file
     with contextlib.closing(open_as_needed(filename, 'rt')) as myfile:
         # Merge multi-line METARs into a single report--drop reports that are too short to
         # be a METAR with a robust amount of data.
-        return _metars_to_dataframe(filter(lambda m: len(m) > 25, full_metars(myfile)),
+        return _metars_to_dataframe(filter(lambda m: len(m) > 25, _full_metars(myfile)),
                                     year=year, month=month)
 
 
+@exporter.export
+def iter_metar_file(filename, *, chunksize=10000, year=None, month=None, output=None):
+    """Parse a text file containing METAR reports in batches.
+
+    This decodes the file incrementally, so that only one batch of reports is held in memory
+    at a time, which allows processing large archives of reports.
+
+    Parameters
+    ----------
+    filename : str or file-like object
+        If str, the name of the file to be opened. If `filename` is a file-like object,
+        this will be read from directly and needs to be opened in text mode (i.e. ``read()``
+        needs to return a string, not bytes).
+    chunksize : int, optional
+        Number of reports to decode into each batch. Reports that fail to decode or are
+        duplicates are dropped, so batches may have fewer rows. Defaults to 10000.
+    year : int, optional
+        Year in which observation was taken, defaults to current year. Keyword-only argument.
+    month : int, optional
+        Month in which observation was taken, defaults to current month. Keyword-only argument.
+    output : str, optional
+        Name for files to write each batch to, which is formatted with the (0-based) batch
+        number, e.g. ``'metars_{:03d}.parquet'``. Names ending in ``.feather`` are written
+        in Feather format, otherwise Parquet is used. Both require `pyarrow`. Defaults to
+        `None`, which does not write any files.
+
+    Yields
+    ------
+    `pandas.DataFrame`
+        The decoded reports for each batch, with the same columns as from
+        `parse_metar_file`.
+
+    See Also
+    --------
+    parse_metar_file
+
+    Notes
+    -----
+    Duplicate reports are only removed within each batch.
+
+    """
+    # Use the same date for every batch, regardless of how long processing takes
+    if year is None or month is None:
+        now = datetime.now(timezone.utc)
+        year = now.year if year is None else year
+        month = now.month if month is None else month
+
+    with contextlib.closing(open_as_needed(filename, 'rt')) as myfile:
+        metars = filter(lambda m: len(m) > 25, _full_metars(myfile))
+        for batch_num in itertools.count():
+            batch = list(itertools.islice(metars, chunksize))
+            if not batch:
+                break
+
+            df = _metars_to_dataframe(batch, year=year, month=month)
+            if output is not None:
+                fname = output.format(batch_num)
+                if fname.endswith('.feather'):
+                    # Feather does not support storing a non-default index
+                    df.reset_index(drop=True).to_feather(fname)
+                else:
+                    df.to_parquet(fname)
+            yield df
+
+
+def _full_metars(lines, prefix='     '):
+    """Merge multi-line METARs from a text product into single reports."""
+    tmp = []
+    for line in lines:
+        # Skip any blank lines
+        if not line.strip():
+            continue
+        # No prefix signals a new report, so yield
+        if not line.startswith(prefix) and tmp:
+            yield ' '.join(tmp)
+            tmp = []
+        tmp.append(line.strip())
+
+    # Handle any leftovers
+    if tmp:
+        yield ' '.join(tmp)
+
+
 def _metars_to_dataframe(metar_iter, *, year=None, month=None):
     """Turn an iterable of METAR reports into a DataFrame.
 
     Notes
     -----
-    The output has the following columns:
+    The output has the following columns, where the current weather and cloud type columns
+    are categoricals:
 
     * 'station_id': Station Identifier (ex. KLOT)
     * 'latitude': Latitude of the observation, measured in degrees
@@ -438,14 +682,14 @@ def _metars_to_dataframe(metar_iter, *, year=None, month=None):
         month = now.month if month is None else month
 
     # Try to parse each METAR that is given
-    metars = []
+    metars = _MetarColumns()
     for metar in metar_iter:
         with contextlib.suppress(ParseError):
-            # Parse the string of text and assign to values within the named tuple
+            # Parse the string of text and store the values in the typed columns
             metars.append(parse_metar(metar, year=year, month=month))
 
-    # Take the list of Metar objects and turn it into a DataFrame with appropriate columns
-    df = pd.DataFrame(metars)
+    # Turn the accumulated columns into a DataFrame with appropriate columns
+    df = metars.to_dataframe()
     df.set_index('station_id', inplace=True, drop=False)
     df.rename(columns={'skyc1': 'low_cloud_type', 'skylev1': 'low_cloud_level',
                        'skyc2': 'medium_cloud_type', 'skylev2': 'medium_cloud_level',
@@ -5,8 +5,11 @@
 
 import bz2
 from collections import defaultdict, namedtuple, OrderedDict
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 import contextlib
 from datetime import datetime, timezone
+import functools
 import logging
 import pathlib
 import re
@@ -47,28 +50,69 @@ def az_rate(val):
     return val * 90. / 2**16
 
 
-def bzip_blocks_decompress_all(data):
-    """Decompress all the bzip2-ed blocks.
-
-    Returns the decompressed data as a `bytearray`.
-    """
-    frames = bytearray()
+def _bzip_block_bounds(data):
+    """Yield the start and end offsets of each of the size-prefixed bzip2-ed blocks."""
     offset = 0
     while offset < len(data):
         block_cmp_bytes = abs(int.from_bytes(data[offset:offset + 4], 'big', signed=True))
         offset += 4
+        yield offset, offset + block_cmp_bytes
+        offset += block_cmp_bytes
+
+
+def bzip_blocks_decompress_all(data, workers=None):
+    """Decompress all the bzip2-ed blocks.
+
+    Parameters
+    ----------
+    data : bytes
+        The compressed data, consisting of blocks each prefixed by their size
+    workers : int, optional
+        If given, the number of threads to use for decompressing the blocks, which are
+        independent of each other. Defaults to decompressing the blocks one at a time.
+
+    Returns the decompressed data as a `bytearray`.
+    """
+    def decompress(bounds):
         try:
-            frames += bz2.decompress(data[offset:offset + block_cmp_bytes])
-            offset += block_cmp_bytes
-        except OSError as e:
-            # If we've decompressed any frames, this is an error mid-stream, so warn, stop
-            # trying to decompress and let processing proceed
-            if frames:
-                logging.warning('Error decompressing bz2 block stream at offset: %d',
-                                offset - 4)
-                break
-            # Otherwise, this isn't a bzip2 stream, so bail
-            raise ValueError('Not a bz2 stream.') from e
+            return bz2.decompress(data[bounds[0]:bounds[1]])
+        except (OSError, ValueError) as e:
+            return e
+
+    # Always decompress the leading blocks up front, until we have some data, so that we
+    # bail quickly if this is not a bzip2 stream
+    blocks = _bzip_block_bounds(data)
+    frames = bytearray()
+    while not frames:
+        bounds = next(blocks, None)
+        if bounds is None:
+            return frames
+        frame = decompress(bounds)
+        if isinstance(frame, OSError):
+            raise ValueError('Not a bz2 stream.') from frame
+        if isinstance(frame, Exception):
+            raise frame
+        frames += frame
+
+    # The remaining blocks are independent, and bz2 releases the GIL, so these can be
+    # decompressed by a pool of threads; results are still gathered in order.
+    blocks = list(blocks)
+    if workers is not None and workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(decompress, blocks))
+    else:
+        results = map(decompress, blocks)
+
+    for bounds, result in zip(blocks, results, strict=False):
+        if isinstance(result, OSError):
+            # This is an error mid-stream, so warn, stop trying to decompress and let
+            # processing proceed
+            logging.warning('Error decompressing bz2 block stream at offset: %d',
+                            bounds[0] - 4)
+            break
+        if isinstance(result, Exception):
+            raise result
+        frames += result
     return frames
 
 
@@ -100,6 +144,101 @@ def remap_status(val):
     return status | bad
 
 
+def _scale_moment(vals, scale, offset, missing, range_fold):
+    """Convert raw Level 2 moment values to physical values.
+
+    Values of 0 are flagged with `missing` and values of 1 with `range_fold`. For a stack
+    of radials, `scale` and `offset` can be arrays with one value per radial.
+    """
+    scaled_vals = (vals - np.asarray(offset)[..., None]) / np.asarray(scale)[..., None]
+    scaled_vals[vals == 0] = missing
+    scaled_vals[vals == 1] = range_fold
+    return scaled_vals
+
+
+class _Level2Moments(Mapping):
+    """Hold the moment data for a radial, scaling the raw values only when accessed.
+
+    Behaves like a `dict` mapping moment name to a tuple of (header, data). The raw
+    values are kept as views into the decompressed data buffer until first access.
+    """
+
+    def __init__(self, missing, range_fold):
+        self._raw = {}
+        self._scaled = {}
+        self._flags = (missing, range_fold)
+
+    def add_raw(self, name, hdr, vals):
+        """Store the header and raw (unscaled) values for a moment."""
+        self._raw[name] = (hdr, vals)
+        self._scaled.pop(name, None)
+
+    def raw(self, name):
+        """Return the header and raw (unscaled) values for a moment."""
+        return self._raw[name]
+
+    def __getitem__(self, name):
+        if name not in self._scaled:
+            hdr, vals = self._raw[name]
+            self._scaled[name] = (hdr, _scale_moment(vals, hdr.scale, hdr.offset,
+                                                     *self._flags))
+        return self._scaled[name]
+
+    def __iter__(self):
+        return iter(self._raw)
+
+    def __len__(self):
+        return len(self._raw)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+class _Level2Sweep(list):
+    """Hold the radials of a single sweep."""
+
+    def moment_array(self, name):
+        """Return the data for a moment from all radials in the sweep as a single array.
+
+        Parameters
+        ----------
+        name : str or bytes
+            The name of the moment, e.g. ``'REF'``
+
+        Returns
+        -------
+        `numpy.ndarray`
+            Scaled moment data with shape (number of radials, number of gates). Radials
+            without the moment, or with fewer gates, are padded with NaN.
+
+        """
+        # Legacy (message 1) radials use str names, while message 31 uses bytes
+        keys = ((name, name.encode('ascii')) if isinstance(name, str)
+                else (name, name.decode('ascii')))
+        found = [next((radial[-1].raw(key) for key in keys if key in radial[-1]),
+                      (None, None)) for radial in self]
+        hdrs = [hdr for hdr, _ in found if hdr is not None]
+        if not hdrs:
+            raise KeyError(f'Moment {name!r} not found in sweep.')
+
+        # Stack the raw values, leaving 0 (missing) in any padding
+        gates = [0 if vals is None else vals.size for _, vals in found]
+        raw = np.zeros((len(self), max(gates)),
+                       dtype=np.result_type(*(vals for _, vals in found if vals is not None)))
+        if min(gates) == max(gates):
+            np.stack([vals for _, vals in found], out=raw)
+        else:
+            for row, (_, vals) in zip(raw, found, strict=True):
+                if vals is not None:
+                    row[:vals.size] = vals
+
+        # Scale everything in one pass, with per-radial scale and offset
+        scales = np.array([hdrs[0].scale if hdr is None else hdr.scale for hdr, _ in found])
+        offsets = np.array([hdrs[0].offset if hdr is None else hdr.offset
+                            for hdr, _ in found])
+        return _scale_moment(raw, scales, offsets, Level2File.MISSING, Level2File.RANGE_FOLD)
+
+
 START_ELEVATION = 0x1
 END_ELEVATION = 0x2
 START_VOLUME = 0x4
@@ -124,8 +263,10 @@ class Level2File:
         The date and time of the data
     vol_hdr : `collections.namedtuple`
         The unpacked volume header
-    sweeps : list[tuple]
-        Data for each of the sweeps found in the file
+    sweeps : list[list[tuple]]
+        Data for each of the sweeps found in the file. Moment data for each radial are
+        scaled when first accessed, and each sweep has a ``moment_array(name)`` method to
+        get the data for a moment from all of its radials as a single 2D array.
     rda_status : `collections.namedtuple`, optional
         Unpacked RDA status information, if found
     maintenance_data : `collections.namedtuple`, optional
@@ -155,7 +296,8 @@ class Level2File:
     MISSING = float('nan')
     RANGE_FOLD = float('nan')  # TODO: Need to separate from missing
 
-    def __init__(self, filename, *, has_volume_header=True):
+    def __init__(self, filename, *, has_volume_header=True, workers=None, sweeps=None,
+                 moments=None):
         r"""Create instance of `Level2File`.
 
         Parameters
@@ -165,8 +307,23 @@ class Level2File:
             recognized with the extension '.gz', as are bzip2-ed files with
             the extension `.bz2` If `filename` is a file-like object,
             this will be read from directly.
+        has_volume_header : bool, optional
+            Whether the data start with a volume header. Set to False for e.g. the
+            real-time chunks. Defaults to True.
+        workers : int, optional
+            Number of threads to use for decompressing the internal bzip2-ed blocks.
+            Defaults to decompressing the blocks one at a time.
+        sweeps : Sequence[int], optional
+            Indices (starting from 0) of the sweeps for which to decode radials. Other
+            sweeps are left empty in `sweeps`, so that indices still line up. Defaults to
+            decoding all sweeps.
+        moments : Sequence[str], optional
+            Names of the moments (e.g. ``'REF'``, ``'VEL'``) to decode for each radial.
+            Defaults to decoding all moments.
 
         """
+        self._set_filters(sweeps, moments)
+
         fobj = open_as_needed(filename)
 
         with contextlib.closing(fobj):
@@ -185,7 +342,8 @@ class Level2File:
         # See if we need to apply bz2 decompression
         start = self._buffer.set_mark()
         try:
-            self._buffer = IOBuffer(self._buffer.read_func(bzip_blocks_decompress_all))
+            self._buffer = IOBuffer(self._buffer.read_func(
+                functools.partial(bzip_blocks_decompress_all, workers=workers)))
         except ValueError:
             self._buffer.jump_to(start)
 
@@ -212,6 +370,16 @@ class Level2File:
         self._msg_buf = {}
         self.sweeps = []
         self.rda_status = []
+        self._read_messages()
+
+        # Check if we have any message segments still in the buffer
+        if self._msg_buf:
+            log.warning('Remaining buffered message segments for message type(s): %s',
+                        ' '.join(f'{typ} ({len(rem)})' for typ, rem in self._msg_buf.items()))
+
+        del self._msg_buf
+
+    def _read_messages(self):
         while not self._buffer.at_end():
             # Clear old file book marks and set the start of message for
             # easy jumping to the end
@@ -260,13 +428,6 @@ class Level2File:
             # the message was legacy with fixed block size or not.
             self._buffer.jump_to(msg_start, msg_bytes)
 
-        # Check if we have any message segments still in the buffer
-        if self._msg_buf:
-            log.warning('Remaining buffered message segments for message type(s): %s',
-                        ' '.join(f'{typ} ({len(rem)})' for typ, rem in self._msg_buf.items()))
-
-        del self._msg_buf
-
     msg1_fmt = NamedStruct([('time_ms', 'L'), ('date', 'H'),
                             ('unamb_range', 'H', scaler(0.1)), ('az_angle', 'H', angle),
                             ('az_num', 'H'), ('rad_status', 'H', remap_status),
@@ -290,7 +451,9 @@ class Level2File:
     def _decode_msg1(self, msg_hdr):
         msg_start = self._buffer.set_mark()
         hdr = self._buffer.read_struct(self.msg1_fmt)
-        data_dict = {}
+        if self._skip_sweep(hdr):
+            return
+        data_dict = _Level2Moments(self.MISSING, self.RANGE_FOLD)
 
         # Process all data pointers:
         read_info = []
@@ -314,17 +477,13 @@ class Level2File:
                                                  hdr.doppler_num_gates, 2.0, 129.0)))
 
         for ptr, data_hdr in read_info:
-            # Jump and read
+            if not self._want_moment(data_hdr.name):
+                continue
+
+            # Jump and read, leaving scaling and flagging until the data are accessed
             self._buffer.jump_to(msg_start, ptr)
             vals = self._buffer.read_array(data_hdr.num_gates, 'B')
-
-            # Scale and flag data
-            scaled_vals = (vals - data_hdr.offset) / data_hdr.scale
-            scaled_vals[vals == 0] = self.MISSING
-            scaled_vals[vals == 1] = self.RANGE_FOLD
-
-            # Store
-            data_dict[data_hdr.name] = (data_hdr, scaled_vals)
+            data_dict.add_raw(data_hdr.name, data_hdr, vals)
 
         self._add_sweep(hdr)
         self.sweeps[-1].append((hdr, data_dict))
@@ -614,12 +773,16 @@ class Level2File:
         data_hdr = self._buffer.read_struct(self.msg31_data_hdr_fmt)
         if data_hdr.compression:
             log.warning('Compressed message 31 not supported!')
+        if self._skip_sweep(data_hdr):
+            return
 
         # Read all the block pointers. While the ICD specifies that at least the vol, el, rad
         # constant blocks as well as REF moment block are present, it says "the pointers are
         # not order or location dependent."
-        radial = self.Radial(data_hdr, None, None, None, {})
+        radial = self.Radial(data_hdr, None, None, None,
+                             _Level2Moments(self.MISSING, self.RANGE_FOLD))
         block_count = 0
+        skipped = False
         for ptr in self._buffer.read_binary(data_hdr.num_data_blks, '>L'):
             if ptr:
                 block_count += 1
@@ -640,14 +803,14 @@ class Level2File:
                         rad_consts = self._buffer.read_struct(self.rad_const_fmt_v1)
                     radial = radial._replace(radial_consts=rad_consts)
                 elif info.startswith(b'D'):
+                    if not self._want_moment(info[1:4].strip()):
+                        skipped = True
+                        continue
                     hdr = self._buffer.read_struct(self.data_block_fmt)
-                    # TODO: The correctness of this code is not tested
+                    # Keep a view of the raw values; these are only scaled when accessed
                     vals = self._buffer.read_array(count=hdr.num_gates,
                                                    dtype=f'>u{hdr.data_size // 8}')
-                    scaled_vals = (vals - hdr.offset) / hdr.scale
-                    scaled_vals[vals == 0] = self.MISSING
-                    scaled_vals[vals == 1] = self.RANGE_FOLD
-                    radial.moments[hdr.name.strip()] = (hdr, scaled_vals)
+                    radial.moments.add_raw(hdr.name.strip(), hdr, vals)
                 else:
                     log.warning('Unknown Message 31 block type: %s', str(info[:4]))
 
@@ -658,7 +821,8 @@ class Level2File:
             log.warning('Incorrect number of blocks detected -- Got %d'
                         ' instead of %d', block_count, data_hdr.num_data_blks)
 
-        if data_hdr.rad_length != self._buffer.offset_from(msg_start):
+        # Skipped moments leave the buffer short of the end, which isn't padding
+        if not skipped and data_hdr.rad_length != self._buffer.offset_from(msg_start):
             log.info('Padding detected in message. Length encoded as %d but offset when '
                      'done is %d', data_hdr.rad_length, self._buffer.offset_from(msg_start))
 
@@ -685,13 +849,33 @@ class Level2File:
             log.warning('Missed start of volume!')
 
         if hdr.rad_status & START_ELEVATION:
-            self.sweeps.append([])
+            self.sweeps.append(_Level2Sweep())
 
         if len(self.sweeps) != hdr.el_num:
             log.warning('Missed elevation -- Have %d but data on %d.'
                         ' Compensating...', len(self.sweeps), hdr.el_num)
             while len(self.sweeps) < hdr.el_num:
-                self.sweeps.append([])
+                self.sweeps.append(_Level2Sweep())
+
+    def _set_filters(self, sweeps, moments):
+        self._sweep_filter = None if sweeps is None else {int(i) for i in sweeps}
+        self._moment_filter = None if moments is None else {
+            name.decode('ascii') if isinstance(name, bytes) else name for name in moments}
+
+    def _skip_sweep(self, hdr):
+        """Check whether a radial's sweep was not requested, keeping track of the sweep."""
+        if self._sweep_filter is None or hdr.el_num - 1 in self._sweep_filter:
+            return False
+        self._add_sweep(hdr)
+        return True
+
+    def _want_moment(self, name):
+        """Check whether a moment, given by name as str or bytes, was requested."""
+        if self._moment_filter is None:
+            return True
+        if isinstance(name, bytes | bytearray):
+            name = name.decode('ascii')
+        return name.strip() in self._moment_filter
 
     def _check_size(self, msg_hdr, size):
         hdr_size = msg_hdr.size_hw * 2 - self.msg_hdr_fmt.size
@@ -700,6 +884,105 @@ class Level2File:
                         msg_hdr.msg_type, size, hdr_size)
 
 
+@exporter.export
+class Level2Stream(Level2File):
+    r"""Incrementally decode NEXRAD Level 2 data as real-time chunks arrive.
+
+    Real-time Level 2 data are distributed as a series of chunks, each holding part of a
+    volume. Rather than re-reading the whole volume each time a chunk arrives, chunks can
+    be added one at a time using `add_chunk`; their radials are appended to `sweeps`, and
+    sweeps are marked complete as soon as their end of elevation radial is seen.
+
+    Attributes
+    ----------
+    completed_sweeps : list[int]
+        Indices into `sweeps` for those sweeps that have been completed
+    volume_complete : bool
+        Whether the end of the volume has been seen
+
+    The volume header attributes (`stid`, `dt`, and `vol_hdr`) are `None` until a chunk
+    with the volume header is added.
+
+    See Also
+    --------
+    Level2File
+
+    """
+
+    def __init__(self, *, workers=None, sweeps=None, moments=None):
+        r"""Create instance of `Level2Stream`.
+
+        Parameters
+        ----------
+        workers : int, optional
+            Number of threads to use for decompressing the internal bzip2-ed blocks.
+            Defaults to decompressing the blocks one at a time.
+        sweeps : Sequence[int], optional
+            Indices (starting from 0) of the sweeps for which to decode radials. Defaults
+            to decoding all sweeps.
+        moments : Sequence[str], optional
+            Names of the moments (e.g. ``'REF'``, ``'VEL'``) to decode for each radial.
+            Defaults to decoding all moments.
+
+        """
+        self._set_filters(sweeps, moments)
+        self._workers = workers
+        self.vol_hdr = None
+        self.dt = None
+        self.stid = None
+        self._msg_buf = {}
+        self.sweeps = []
+        self.rda_status = []
+        self.completed_sweeps = []
+        self.volume_complete = False
+
+    def add_chunk(self, chunk):
+        """Decode a chunk of data and add its radials to the sweeps.
+
+        Parameters
+        ----------
+        chunk : bytes or str or file-like object
+            The chunk's data, or a file name or file-like object to read it from. A
+            chunk starting a volume can include the volume header.
+
+        Returns
+        -------
+        list[int]
+            Indices of the sweeps completed by this chunk
+
+        """
+        if isinstance(chunk, bytes | bytearray | memoryview):
+            self._buffer = IOBuffer(bytes(chunk))
+        else:
+            fobj = open_as_needed(chunk)
+            with contextlib.closing(fobj):
+                self._buffer = IOBuffer.fromfile(fobj)
+
+        # The chunk starting a volume has the volume header
+        if self._buffer.get_next(4) in (b'AR2V', b'ARCH'):
+            self._read_volume_header()
+
+        # See if we need to apply bz2 decompression
+        start = self._buffer.set_mark()
+        try:
+            self._buffer = IOBuffer(self._buffer.read_func(
+                functools.partial(bzip_blocks_decompress_all, workers=self._workers)))
+        except ValueError:
+            self._buffer.jump_to(start)
+
+        num_completed = len(self.completed_sweeps)
+        self._read_messages()
+        return self.completed_sweeps[num_completed:]
+
+    def _add_sweep(self, hdr):
+        super()._add_sweep(hdr)
+        current = len(self.sweeps) - 1
+        if hdr.rad_status & END_ELEVATION and current not in self.completed_sweeps:
+            self.completed_sweeps.append(current)
+        if hdr.rad_status & END_VOLUME:
+            self.volume_complete = True
+
+
 def reduce_lists(d):
     """Replace single item lists in a dictionary with the single item."""
     for field in d:
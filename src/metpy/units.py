@@ -16,6 +16,7 @@ units : :class: `pint.UnitRegistry()`
 
 """
 import contextlib
+import contextvars
 import functools
 from inspect import Parameter, signature
 import logging
@@ -286,6 +287,116 @@ def _check_units_outer_helper(func, *args, **kwargs):
     return sig, dims, defaults
 
 
+def _unit_marker(val):
+    """Summarize what matters about an argument's units for checking and conversion."""
+    if isinstance(val, pint.Quantity):
+        # Use the units container directly since building a `pint.Unit` is comparatively slow
+        return val._units
+    return _NOT_QUANTITY if val is not None else None
+
+
+# Marker for arguments given without units, and the maximum number of sets of argument units
+# remembered by each decorated function
+_NOT_QUANTITY = object()
+_UNIT_CACHE_SIZE = 256
+
+# Whether the units of arguments are trusted, which skips checking them
+_trusted_inputs = contextvars.ContextVar('trusted_inputs', default=False)
+
+
+@exporter.export
+@contextlib.contextmanager
+def trusted_inputs():
+    """Skip checking the units of arguments to calculations within a block of code.
+
+    Functions in `metpy.calc` check that their arguments have appropriate units on every
+    call. While this is fast when the same units are seen repeatedly, batch processing that
+    makes many calls with inputs already known to be correct can skip the checks entirely by
+    running within this context. Arguments are still converted as needed, but given
+    incorrect units, calculations will fail in confusing ways or return wrong answers.
+
+    Examples
+    --------
+    >>> import metpy.calc as mpcalc
+    >>> from metpy.units import trusted_inputs, units
+    >>> with trusted_inputs():
+    ...     mpcalc.saturation_mixing_ratio(1000 * units.hPa, 20 * units.degC)
+    <Quantity(0.014868263804532659, 'dimensionless')>
+
+    """
+    token = _trusted_inputs.set(True)
+    try:
+        yield
+    finally:
+        _trusted_inputs.reset(token)
+
+
+@functools.lru_cache(maxsize=_UNIT_CACHE_SIZE)
+def _linear_conversion(src, dest):
+    """Find the scale and offset converting magnitudes between two units.
+
+    Returns `None` if the conversion is not linear (e.g. logarithmic units).
+    """
+    offset = units.convert(0., src, dest)
+    scale = units.convert(1., src, dest) - offset
+    if not np.isclose(units.convert(10., src, dest), 10. * scale + offset, rtol=1e-12):
+        return None
+    return scale, offset
+
+
+def _convert_magnitude(value, conversion):
+    """Convert a magnitude with a scale and offset from `_linear_conversion`."""
+    scale, offset = conversion
+    if scale != 1:
+        value = value * scale
+    if offset != 0:
+        value = value + offset
+    return value
+
+
+class _UnitChecker:
+    """Check the units of arguments to a function, remembering units already checked."""
+
+    def __init__(self, func, *args, **kwargs):
+        self.func = func
+        self.sig, self.dims, self.defaults = _check_units_outer_helper(func, *args, **kwargs)
+        params = self.sig.parameters.values()
+        self._positional = [param.name for param in params
+                            if param.kind in (Parameter.POSITIONAL_ONLY,
+                                              Parameter.POSITIONAL_OR_KEYWORD)]
+        self._var_positional = next(
+            (param.name for param in params if param.kind == Parameter.VAR_POSITIONAL), None)
+        self._checked = set()
+
+    @staticmethod
+    def key(args, kwargs):
+        """Get a hashable summary of how arguments, and their units, are passed."""
+        return (tuple(_unit_marker(arg) for arg in args),
+                tuple((name, _unit_marker(val)) for name, val in kwargs.items()))
+
+    def names(self, args, kwargs):
+        """Get the parameter names the given arguments bind to, in order."""
+        self.sig.bind(*args, **kwargs)
+        return ([self._positional[i] if i < len(self._positional) else self._var_positional
+                 for i in range(len(args))] + list(kwargs))
+
+    def check(self, key, args, kwargs):
+        """Check the units of arguments, unless the same units have passed already."""
+        if key not in self._checked:
+            _check_units_inner_helper(self.func, self.sig, self.defaults, self.dims,
+                                      *args, **kwargs)
+
+            # Arguments without units needing dimensions pass only when equal to the default
+            # value, so only remember results that do not depend on the values
+            markers = list(key[0]) + [marker for _, marker in key[1]]
+            if not any(marker is _NOT_QUANTITY and self.dims.get(name, ('', ''))[1] != ''
+                       for name, marker in zip(self.names(args, kwargs), markers,
+                                               strict=True)):
+                if len(self._checked) >= _UNIT_CACHE_SIZE:
+                    self._checked.clear()
+                self._checked.add(key)
+
+
 def _check_units_inner_helper(func, sig, defaults, dims, *args, **kwargs):
     """Check bound arguments for unit correctness."""
     # Match all passed in value to their proper arguments so we can check units
@@ -327,13 +438,18 @@ def _check_units_inner_helper(func, sig, defaults, dims, *args, **kwargs):
 
 
 def check_units(*units_by_pos, **units_by_name):
-    """Create a decorator to check units of function arguments."""
+    """Create a decorator to check units of function arguments.
+
+    Checks are skipped for units that have already been seen together in previous calls,
+    as well as within `trusted_inputs`.
+    """
     def dec(func):
-        sig, dims, defaults = _check_units_outer_helper(func, *units_by_pos, **units_by_name)
+        checker = _UnitChecker(func, *units_by_pos, **units_by_name)
 
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            _check_units_inner_helper(func, sig, defaults, dims, *args, **kwargs)
+            if not _trusted_inputs.get():
+                checker.check(checker.key(args, kwargs), args, kwargs)
             return func(*args, **kwargs)
 
         return wrapper
@@ -346,22 +462,31 @@ def process_units(
     output_to=None,
     ignore_inputs_for_output=None
 ):
-    """Wrap a non-Quantity-using function in base units to fully handle units."""
+    """Wrap a non-Quantity-using function in base units to fully handle units.
+
+    How arguments bind to parameters and the conversions needed for their units are worked
+    out once for each combination of argument units seen, so that repeated calls only
+    need to scale the magnitudes.
+    """
     def dec(func):
-        sig, dims, defaults = _check_units_outer_helper(func, **input_dimensionalities)
+        checker = _UnitChecker(func, **input_dimensionalities)
+        dims = checker.dims
+        plans = {}
+
+        # Determine unit(s) with which to wrap output
+        if isinstance(output_dimensionalities, tuple):
+            multiple_output = True
+            outputs = output_dimensionalities
+        else:
+            multiple_output = False
+            outputs = (output_dimensionalities,)
 
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            bound_args = _check_units_inner_helper(func, sig, defaults, dims, *args, **kwargs)
+        def make_plan(args, kwargs):
+            """Find the conversions to apply to the arguments and results of a call."""
+            arg_units = [val.units if isinstance(val, units.Quantity) else None
+                         for val in (*args, *kwargs.values())]
+            given_units = dict(zip(checker.names(args, kwargs), arg_units, strict=True))
 
-            # Determine unit(s) with which to wrap output (first, since we mutate the bound
-            # args)
-            if isinstance(output_dimensionalities, tuple):
-                multiple_output = True
-                outputs = output_dimensionalities
-            else:
-                multiple_output = False
-                outputs = (output_dimensionalities,)
             output_control = []
             for i, output in enumerate(outputs):
                 convert_to = (
@@ -377,36 +502,76 @@ def process_units(
                                 or name not in ignore_inputs_for_output
                             )
                         ):
-                            try:
-                                convert_to = bound_args.arguments[name].units
-                            except AttributeError:
-                                # We don't have units, so given prior check, is dimensionless
-                                convert_to = ''
+                            # Without units, given prior check, is dimensionless
+                            convert_to = given_units.get(name, '') or ''
                             break
 
-                output_control.append((_base_unit_of_dimensionality[output], convert_to))
+                base = units.Unit(_base_unit_of_dimensionality[output])
+                if convert_to is None:
+                    output_control.append((base, None, None))
+                else:
+                    convert_to = units.Unit(convert_to)
+                    output_control.append((base, convert_to,
+                                           _linear_conversion(base, convert_to)))
+
+            # Convert all inputs to base units, assuming dimensionality is fine based on
+            # above
+            input_control = []
+            for given in arg_units:
+                if given is None:
+                    input_control.append(None)
+                else:
+                    base = (1 * given).to_base_units().units
+                    input_control.append(_linear_conversion(given, base) or False)
+
+            return input_control, output_control
+
+        def convert_input(val, conversion):
+            if conversion is None:
+                return val
+            if conversion is False:
+                return val.to_base_units().m
+            return _convert_magnitude(val.m, conversion)
+
+        def wrap_output(result, control):
+            base, convert_to, conversion = control
+            if convert_to is None:
+                return units.Quantity(result, base)
+            if conversion is None:
+                return units.Quantity(result, base).to(convert_to)
+            return units.Quantity(_convert_magnitude(result, conversion), convert_to)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = checker.key(args, kwargs)
+            if not _trusted_inputs.get():
+                checker.check(key, args, kwargs)
 
-            # Convert all inputs as specified, assuming dimensionality is fine based on above
-            _mutate_arguments(bound_args, units.Quantity, lambda val, _: val.to_base_units().m)
+            plan = plans.get(key)
+            if plan is None:
+                if len(plans) >= _UNIT_CACHE_SIZE:
+                    plans.clear()
+                plan = plans[key] = make_plan(args, kwargs)
+            input_control, output_control = plan
 
             # Evaluate inner calculation
-            result = func(*bound_args.args, **bound_args.kwargs)
+            num_args = len(args)
+            result = func(
+                *(convert_input(val, conversion)
+                  for val, conversion in zip(args, input_control, strict=False)),
+                **{name: convert_input(val, conversion)
+                   for (name, val), conversion in zip(kwargs.items(),
+                                                      input_control[num_args:],
+                                                      strict=True)}
+            )
 
             # Wrap output
             if multiple_output:
-                wrapped_result = []
-                for this_result, this_output_control in zip(result, output_control,
-                                                            strict=False):
-                    q = units.Quantity(this_result, this_output_control[0])
-                    if this_output_control[1] is not None:
-                        q = q.to(this_output_control[1])
-                    wrapped_result.append(q)
-                return tuple(wrapped_result)
-            else:
-                q = units.Quantity(result, output_control[0][0])
-                if output_control[0][1] is not None:
-                    q = q.to(output_control[0][1])
-                return q
+                return tuple(wrap_output(this_result, this_output_control)
+                             for this_result, this_output_control in zip(result,
+                                                                         output_control,
+                                                                         strict=False))
+            return wrap_output(result, output_control[0])
 
         # Attach the unwrapped func for internal use
         wrapper._nounit = func
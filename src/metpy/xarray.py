@@ -17,10 +17,11 @@ See Also: :doc:`xarray with MetPy Tutorial </tutorials/xarray_tutorial>`.
 """
 import contextlib
 import functools
-from inspect import signature
+from inspect import BoundArguments, signature
 from itertools import chain
 import logging
 import re
+import warnings
 
 import numpy as np
 from pyproj import CRS, Proj
@@ -528,9 +529,9 @@ class MetPyDataArrayAccessor:
                     and hasattr(self, 'latitude') and self.latitude.squeeze().ndim == 1)
         ):
             # Calculate dx and dy on ellipsoid (on equator and 0 deg meridian, respectively)
-            from .calc.tools import nominal_lat_lon_grid_deltas
+            from .calc.tools import _cached_nominal_grid_deltas
             crs = getattr(self, 'pyproj_crs', CRS('+proj=latlon'))
-            dx, dy = nominal_lat_lon_grid_deltas(
+            dx, dy = _cached_nominal_grid_deltas(
                 self.longitude.metpy.unit_array,
                 self.latitude.metpy.unit_array,
                 crs.get_geod()
@@ -1246,7 +1247,8 @@ def _build_y_x(da, tolerance):
                          'correspond to your CRS coordinate.')
 
 
-def preprocess_and_wrap(broadcast=None, wrap_like=None, match_unit=False, to_magnitude=False):
+def preprocess_and_wrap(broadcast=None, wrap_like=None, match_unit=False, to_magnitude=False,
+                        lazy=None):
     """Return decorator to wrap array calculations for type flexibility.
 
     Assuming you have a calculation that works internally with `pint.Quantity` or
@@ -1262,8 +1264,9 @@ def preprocess_and_wrap(broadcast=None, wrap_like=None, match_unit=False, to_mag
     wrap_like : str or array-like or tuple of str or tuple of array-like or None
         Wrap the calculation output following a particular input argument (if str) or data
         object (if array-like). If tuple, will assume output is in the form of a tuple,
-        and wrap iteratively according to the str or array-like contained within. If None,
-        will not wrap output.
+        and wrap iteratively according to the str or array-like contained within. If the
+        output is a dict, each of its values (or each item of tuple values) is wrapped. If
+        None, will not wrap output.
     match_unit : bool
         If true, force the unit of the final output to be that of wrapping object (as
         determined by wrap_like), no matter the original calculation output. Defaults to
@@ -1271,7 +1274,17 @@ def preprocess_and_wrap(broadcast=None, wrap_like=None, match_unit=False, to_mag
     to_magnitude : bool
         If true, downcast xarray and Pint arguments to their magnitude. If false, downcast
         xarray arguments to Quantity, and do not change other array-like arguments.
+    lazy : {None, 'elementwise', 'vertical'}
+        How the calculation can be applied to dask-backed `xarray.DataArray` arguments
+        without loading them into memory. With ``'elementwise'``, each output point depends
+        only on the inputs at the same point, so the calculation is mapped over the chunks
+        as-is. With ``'vertical'``, the calculation operates on whole columns along the
+        dimension given by ``vertical_dim``, which is kept in a single chunk. If None (the
+        default), dask-backed arguments are handled like any other array.
     """
+    if lazy not in (None, 'elementwise', 'vertical'):
+        raise ValueError(f'Unknown lazy mode {lazy!r}.')
+
     def decorator(func):
         sig = signature(func)
         if broadcast is not None:
@@ -1319,6 +1332,10 @@ def preprocess_and_wrap(broadcast=None, wrap_like=None, match_unit=False, to_mag
                         match[i] = bound_args.arguments[arg]
                 match = tuple(match)
 
+            # Map the calculation over the chunks of dask-backed inputs to keep them lazy
+            if lazy is not None and _can_apply_chunked(bound_args, match):
+                return _apply_chunked(func, bound_args, match, lazy, match_unit)
+
             # Cast all DataArrays to Pint Quantities
             _mutate_arguments(bound_args, xr.DataArray, lambda arg, _: arg.metpy.unit_array)
 
@@ -1340,12 +1357,100 @@ def preprocess_and_wrap(broadcast=None, wrap_like=None, match_unit=False, to_mag
 
                 if isinstance(match, tuple):
                     return tuple(wrapping(*args) for args in zip(result, match, strict=False))
+                elif isinstance(result, dict):
+                    return {key: tuple(wrapping(item, match) for item in value)
+                            if isinstance(value, tuple) else wrapping(value, match)
+                            for key, value in result.items()}
                 else:
                     return wrapping(result, match)
         return wrapper
     return decorator
 
 
+def _can_apply_chunked(bound_args, match):
+    """Determine whether a wrapped calculation can be mapped over dask chunks."""
+    matches = match if isinstance(match, tuple) else (match,)
+    if not all(isinstance(m, xr.DataArray) for m in matches):
+        return False
+
+    # Only DataArrays are aligned with the chunks; other arrays must be scalars
+    is_chunked = False
+    for arg in bound_args.arguments.values():
+        if isinstance(arg, xr.DataArray):
+            is_chunked = is_chunked or arg.chunks is not None
+        elif isinstance(arg, tuple) or np.ndim(arg) > 0:
+            return False
+    return is_chunked
+
+
+def _apply_chunked(func, bound_args, match, lazy, match_unit):
+    """Apply a calculation to dask-backed DataArrays one chunk at a time.
+
+    The calculation is evaluated once on a small sample to find the units and dtypes of its
+    outputs, then mapped over the chunks using `xarray.apply_ufunc`. The results are
+    DataArrays holding `pint.Quantity`-wrapped dask arrays, the same as calculations give
+    for in-memory input.
+    """
+    names = [name for name, arg in bound_args.arguments.items()
+             if isinstance(arg, xr.DataArray)]
+    # Results of earlier lazy calculations hold Quantities, which dask can't map over
+    arrays = [bound_args.arguments[name].metpy.dequantify() for name in names]
+    arg_units = [arg.metpy.units for arg in arrays]
+    matches = match if isinstance(match, tuple) else (match,)
+
+    core_dims = [[] for _ in arrays]
+    out_core_dims = []
+    if lazy == 'vertical':
+        column_like = next((arg for arg in arrays if arg.ndim > 1), arrays[0])
+        vertical_dim = bound_args.arguments.get('vertical_dim', 0)
+        vertical_name = column_like.dims[vertical_dim]
+        core_dims = [[vertical_name] if vertical_name in arg.dims else [] for arg in arrays]
+        out_core_dims = [vertical_name]
+        if 'vertical_dim' in bound_args.arguments:
+            bound_args.arguments['vertical_dim'] = -1
+
+    def calculate(*magnitudes):
+        arguments = dict(bound_args.arguments)
+        for name, magnitude, unit in zip(names, magnitudes, arg_units, strict=True):
+            arguments[name] = units.Quantity(magnitude, unit)
+        bound = BoundArguments(bound_args.signature, arguments)
+        return func(*bound.args, **bound.kwargs)
+
+    # Find units and dtypes of the outputs from a single point (or column)
+    with warnings.catch_warnings(), np.errstate(all='ignore'):
+        warnings.simplefilter('ignore')
+        sample = calculate(*(np.ones([arg.sizes[dim] for dim in dims], dtype=arg.dtype)
+                             for arg, dims in zip(arrays, core_dims, strict=True)))
+    samples = sample if isinstance(match, tuple) else (sample,)
+    out_units = [m.metpy.units if match_unit else units.Quantity(s).units
+                 for s, m in zip(samples, matches, strict=False)]
+    out_dtypes = [np.asarray(units.Quantity(s).m).dtype for s in samples]
+
+    def calculate_magnitudes(*magnitudes):
+        results = calculate(*magnitudes)
+        results = results if isinstance(match, tuple) else (results,)
+        results = tuple(units.Quantity(r).m_as(u)
+                        for r, u in zip(results, out_units, strict=False))
+        return results if isinstance(match, tuple) else results[0]
+
+    results = xr.apply_ufunc(
+        calculate_magnitudes, *arrays, input_core_dims=core_dims,
+        output_core_dims=[out_core_dims] * len(out_units),
+        dask='parallelized', output_dtypes=out_dtypes,
+        dask_gufunc_kwargs={'allow_rechunk': True})
+    results = results if isinstance(match, tuple) else (results,)
+
+    wrapped = []
+    for result, unit, like in zip(results, out_units, matches, strict=False):
+        if set(result.dims) == set(like.dims):
+            result = xr.DataArray(result.transpose(*like.dims).data, coords=like.coords,
+                                  dims=like.dims)
+        # Wrap in a Quantity, like the results for in-memory input
+        wrapped.append(xr.DataArray(units.Quantity(result.data, unit), coords=result.coords,
+                                    dims=result.dims))
+    return tuple(wrapped) if isinstance(match, tuple) else wrapped[0]
+
+
 def _wrap_output_like_matching_units(result, match):
     """Convert result to be like match with matching units for output wrapper."""
     output_xarray = isinstance(match, xr.DataArray)
@@ -1531,10 +1636,10 @@ def add_vertical_dim_from_xarray(func):
         bound_args = signature(func).bind(*args, **kwargs)
         bound_args.apply_defaults()
 
-        # Fill in vertical_dim
+        # Fill in vertical_dim (which can only be the first dimension of a 1D array)
         if 'vertical_dim' in bound_args.arguments:
             a = next(dataarray_arguments(bound_args), None)
-            if a is not None:
+            if a is not None and a.ndim > 1:
                 try:
                     bound_args.arguments['vertical_dim'] = a.metpy.find_axis_number('vertical')
                 except AttributeError:
@@ -16,7 +16,8 @@ from metpy.calc import (add_height_to_pressure, add_pressure_to_height,
                         smooth_gaussian, smooth_n_point, smooth_rectangular, smooth_window,
                         wind_components, wind_direction, wind_speed, windchill, zoom_xarray)
 from metpy.cbook import get_test_data
-from metpy.testing import assert_almost_equal, assert_array_almost_equal, assert_array_equal
+from metpy.testing import (assert_almost_equal, assert_array_almost_equal, assert_array_equal,
+                           needs_module)
 from metpy.units import units
 
 
@@ -761,6 +762,67 @@ def test_smooth_circular(array_type):
     assert_array_almost_equal(smoothed, truth, 4)
 
 
+box_window = np.ones((5, 7))
+binomial_window = np.outer([1, 4, 6, 4, 1], [1, 2, 1])
+circle_window = np.hypot(*np.mgrid[-4:5, -4:5]) <= 4
+
+
+@pytest.mark.parametrize('method, window', [('separable', box_window),
+                                            ('separable', binomial_window),
+                                            ('summed_area', box_window),
+                                            ('fft', box_window),
+                                            ('fft', binomial_window),
+                                            ('fft', circle_window)])
+def test_smooth_window_methods(method, window):
+    """Test that smooth_window methods match the direct calculation."""
+    rng = np.random.default_rng(20261018)
+    data = rng.normal(5000, 10, (2, 30, 40))
+    data[0, 10, 12] = np.nan
+
+    truth = smooth_window(data, window, passes=3, method='direct')
+    smoothed = smooth_window(data, window, passes=3, method=method)
+
+    assert_array_almost_equal(smoothed, truth, 8)
+
+
+@pytest.mark.parametrize('method, window, match', [
+    ('separable', circle_window, 'not separable'),
+    ('separable', np.eye(3), 'not separable'),
+    ('summed_area', binomial_window, 'equal weights'),
+    ('summed_area', circle_window, 'equal weights')])
+def test_smooth_window_bad_window(method, window, match):
+    """Test smooth_window with a window that does not suit the method."""
+    with pytest.raises(ValueError, match=match):
+        smooth_window(np.zeros((10, 10)), window, method=method)
+
+
+def test_smooth_window_bad_method():
+    """Test smooth_window with an unknown method."""
+    with pytest.raises(ValueError, match='Unknown'):
+        smooth_window(np.zeros((10, 10)), np.eye(3), method='magic')
+
+
+@needs_module('dask')
+@pytest.mark.parametrize('smoother', [lambda a: smooth_gaussian(a, 6),
+                                      lambda a: smooth_n_point(a, 9, 3),
+                                      lambda a: smooth_window(a, np.ones((5, 3)), passes=2,
+                                                              method='separable'),
+                                      lambda a: smooth_circular(a, 3, 2, method='direct')])
+def test_smooth_chunked(smoother):
+    """Test that smoothing dask arrays stays lazy and matches smoothing in memory."""
+    rng = np.random.default_rng(20261018)
+    data = xr.DataArray(rng.normal(5000, 10, (2, 3, 40, 50)), dims=('time', 'z', 'y', 'x'),
+                        attrs={'units': 'm'})
+    chunked = data.chunk({'time': 1, 'z': 2, 'y': 15, 'x': 20})
+
+    truth = smoother(data)
+    smoothed = smoother(chunked)
+
+    assert smoothed.chunks is not None
+    assert smoothed.metpy.units == units.m
+    assert_array_equal(smoothed.compute().metpy.unit_array, truth.metpy.unit_array)
+
+
 def test_smooth_window_with_bad_window():
     """Test smooth_window with a bad window size."""
     temperature = [37, 32, 34, 29, 28, 24, 26, 24, 27, 30] * units.degF
@@ -12,9 +12,10 @@ from pyproj import CRS, Geod
 import pytest
 import xarray as xr
 
-from metpy.calc import (angle_to_direction, azimuth_range_to_lat_lon, find_bounding_indices,
-                        find_intersections, find_peaks, first_derivative, geospatial_gradient,
-                        get_layer, get_layer_heights, gradient, laplacian, lat_lon_grid_deltas,
+from metpy.calc import (angle_to_direction, azimuth_range_to_lat_lon, clear_grid_cache,
+                        find_bounding_indices, find_intersections, find_peaks,
+                        first_derivative, geospatial_gradient, get_layer, get_layer_heights,
+                        gradient, grid_cache_info, laplacian, lat_lon_grid_deltas,
                         nearest_intersection_idx, parse_angle, peak_persistence,
                         pressure_to_height_std, reduce_point_density, resample_nn_1d,
                         second_derivative, vector_derivative)
@@ -682,6 +683,47 @@ def test_second_derivative_scalar_delta():
     assert_array_almost_equal(df_dx, np.array([0., 0., 0.]), 6)
 
 
+@pytest.mark.parametrize('spacing', [{'delta': 0.5 * units.km},
+                                     {'delta': np.full(5, 500.) * units.m},
+                                     {'x': np.array([-1., 1., 3., 5., 7., 9.]) * units.km}])
+def test_derivatives_uniform_out(spacing):
+    """Test the derivatives on a uniform grid, writing into a given array."""
+    x = np.array([0, 0.5, 1, 1.5, 2, 2.5]) * units.km
+    if 'x' in spacing:
+        x = spacing['x']
+    f = np.tile(x.m_as('km')**2 - 3 * x.m_as('km'), (2, 1)).astype(np.float32) * units.K
+
+    out = np.empty((2, 6))
+    df_dx = first_derivative(f, axis=-1, out=out, **spacing)
+    assert df_dx.magnitude is out
+    assert_array_almost_equal(df_dx, np.tile(2 * x.m_as('km') - 3, (2, 1)) * units('K/km'),
+                              5)
+
+    d2f_dx2 = second_derivative(f, axis=-1, **spacing)
+    assert d2f_dx2.dtype == np.float64
+    assert_array_almost_equal(d2f_dx2, np.full((2, 6), 2) * units('K/km**2'), 5)
+
+
+@pytest.mark.parametrize('func', [first_derivative, second_derivative])
+def test_derivatives_float32_dtype(func):
+    """Test that float32 input gives the same dtype on uniform and non-uniform grids."""
+    f = np.arange(6., dtype=np.float32) ** 2 * units.K
+    uniform = np.array([0, 1, 2, 3, 4, 5], dtype=np.float32) * units.m
+    nonuniform = np.array([0, 1, 2, 3.5, 4, 5], dtype=np.float32) * units.m
+
+    assert func(f, x=uniform).dtype == np.float32
+    assert func(f, x=nonuniform).dtype == np.float32
+
+
+def test_first_derivative_out_nonuniform(deriv_2d_data):
+    """Test first_derivative writing into a given array with non-uniform spacing."""
+    out = np.empty_like(deriv_2d_data.f)
+    df_dx = first_derivative(deriv_2d_data.f, x=deriv_2d_data.x, axis=1, out=out)
+    assert df_dx.magnitude is out
+    assert_array_almost_equal(df_dx, first_derivative(deriv_2d_data.f, x=deriv_2d_data.x,
+                                                      axis=1), 10)
+
+
 def test_laplacian(deriv_1d_data):
     """Test laplacian with simple 1D data."""
     laplac = laplacian(deriv_1d_data.values, coordinates=(deriv_1d_data.x,))
@@ -1524,6 +1566,40 @@ def test_nominal_grid_deltas():
     assert_array_almost_equal(dy, [762882.89244795, 762882.89244795] * units.m)
 
 
+def test_grid_cache():
+    """Test reusing grid deltas and map factors found from the same coordinates."""
+    @parse_grid_arguments
+    @preprocess_and_wrap()
+    def return_the_kwargs(f, dx=None, dy=None, x_dim=-1, y_dim=-2, parallel_scale=None,
+                          meridional_scale=None, latitude=None):
+        return {'dx': dx, 'dy': dy, 'parallel_scale': parallel_scale,
+                'meridional_scale': meridional_scale}
+
+    data = xr.DataArray(np.zeros((3, 4)), dims=('lat', 'lon'),
+                        coords={'lat': ('lat', [25., 35., 45.], {'units': 'degrees_north'}),
+                                'lon': ('lon', [-105., -100., -95., -90.],
+                                        {'units': 'degrees_east'})})
+
+    clear_grid_cache()
+    truth = return_the_kwargs(data)
+    assert grid_cache_info()[:2] == (0, 2)
+    assert grid_cache_info().currsize == 2
+
+    # Modifying the results must not change what comes back next time
+    truth['dx'][...] = 0 * units.m
+    result = return_the_kwargs(data)
+    assert grid_cache_info()[:2] == (2, 2)
+    assert_array_almost_equal(result['dx'], 556597.45396637 * units.m)
+    assert_array_equal(result['parallel_scale'], truth['parallel_scale'])
+
+    # Different coordinate values are a different grid
+    return_the_kwargs(data.assign_coords(lat=data.lat + 1))
+    assert grid_cache_info()[:2] == (2, 4)
+
+    clear_grid_cache()
+    assert grid_cache_info() == (0, 0, 32, 0)
+
+
 def test_nominal_grid_deltas_trivial_nd():
     """Test that we can pass arrays with only one real dimension."""
     lat = np.array([25., 35., 45.]).reshape(1, 1, -1, 1) * units.degree
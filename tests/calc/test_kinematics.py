@@ -10,11 +10,11 @@ import xarray as xr
 from metpy.calc import (absolute_vorticity, advection, ageostrophic_wind, coriolis_parameter,
                         curvature_vorticity, divergence, first_derivative, frontogenesis,
                         geospatial_laplacian, geostrophic_wind, inertial_advective_wind,
-                        lat_lon_grid_deltas, montgomery_streamfunction, potential_temperature,
-                        potential_vorticity_baroclinic, potential_vorticity_barotropic,
-                        q_vector, shear_vorticity, shearing_deformation, static_stability,
-                        storm_relative_helicity, stretching_deformation, total_deformation,
-                        vorticity, wind_components)
+                        kinematics_bundle, lat_lon_grid_deltas, montgomery_streamfunction,
+                        potential_temperature, potential_vorticity_baroclinic,
+                        potential_vorticity_barotropic, q_vector, shear_vorticity,
+                        shearing_deformation, static_stability, storm_relative_helicity,
+                        stretching_deformation, total_deformation, vorticity, wind_components)
 from metpy.constants import g, Re
 from metpy.testing import (assert_almost_equal, assert_array_almost_equal, assert_array_equal,
                            get_test_data)
@@ -1967,3 +1967,39 @@ def test_geospatial_laplacian_geographic(geog_data):
              - (v * my / mx) * first_derivative(mx, delta=dy, axis=0))
 
     assert_array_almost_equal(laplac, truth)
+
+
+def test_kinematics_bundle(basic_dataset):
+    """Test that kinematics_bundle matches the individual kinematics functions."""
+    d = basic_dataset
+    theta = potential_temperature(500 * units.hPa, d.temperature)
+    truth = {
+        'vorticity': vorticity(d.u, d.v),
+        'absolute_vorticity': absolute_vorticity(d.u, d.v),
+        'divergence': divergence(d.u, d.v),
+        'shearing_deformation': shearing_deformation(d.u, d.v),
+        'stretching_deformation': stretching_deformation(d.u, d.v),
+        'total_deformation': total_deformation(d.u, d.v),
+        'frontogenesis': frontogenesis(theta, d.u, d.v),
+        'q_vector': q_vector(d.u, d.v, d.temperature, 500 * units.hPa)
+    }
+
+    result = kinematics_bundle(d.u, d.v, outputs=list(truth), potential_temperature=theta,
+                               temperature=d.temperature, pressure=500 * units.hPa)
+
+    assert list(result) == list(truth)
+    for name, value in truth.items():
+        if not isinstance(value, tuple):
+            result[name], value = (result[name],), (value,)
+        for res, true in zip(result[name], value, strict=True):
+            assert isinstance(res, xr.DataArray)
+            assert res.dims == true.dims
+            assert_array_equal(res.metpy.unit_array, true.metpy.unit_array)
+
+
+def test_kinematics_bundle_bad_outputs(basic_dataset):
+    """Test kinematics_bundle with unknown outputs or missing inputs."""
+    with pytest.raises(ValueError, match='Unknown kinematics outputs: magic'):
+        kinematics_bundle(basic_dataset.u, basic_dataset.v, outputs=['vorticity', 'magic'])
+    with pytest.raises(ValueError, match='`temperature` is required'):
+        kinematics_bundle(basic_dataset.u, basic_dataset.v, outputs='q_vector')
@@ -41,7 +41,8 @@ from metpy.calc import (brunt_vaisala_frequency, brunt_vaisala_frequency_squared
                         wet_bulb_temperature)
 from metpy.calc.thermo import _find_append_zero_crossings
 from metpy.constants import Cp_d, g, kappa, Lf, Ls, Lv, Rd, T0
-from metpy.testing import assert_almost_equal, assert_array_almost_equal, assert_nan
+from metpy.testing import (assert_almost_equal, assert_array_almost_equal, assert_nan,
+                           needs_module)
 from metpy.units import is_quantity, masked_array, units
 
 
@@ -248,6 +249,42 @@ def test_moist_lapse_starting_points(start, direction):
     assert_almost_equal(temp, truth, 4)
 
 
+@pytest.mark.parametrize('vertical_dim', (0, 1, -1))
+def test_moist_lapse_grid(vertical_dim):
+    """Test moist_lapse integrating many columns at once."""
+    pressure = units.Quantity([1000., 925., 850., 700., 500., 300., 200., 100.], 'hPa')
+    start = units.Quantity([[20., 5.], [30., -10.]], 'degC')
+    grid_pressure = np.moveaxis(np.broadcast_to(pressure.m[:, None, None], (8, 2, 2)), 0,
+                                vertical_dim) * pressure.units
+    temp = moist_lapse(grid_pressure, start, vertical_dim=vertical_dim)
+
+    truth = moist_lapse(pressure, start.flatten()).reshape(2, 2, 8)
+    assert_array_almost_equal(np.moveaxis(temp, vertical_dim, -1), truth, 3)
+
+
+def test_moist_lapse_grid_reference_pressure():
+    """Test moist_lapse on columns with differing reference pressures."""
+    pressure = units.Quantity([[1000., 925., 850., 700., 600.],
+                               [950., 900., 850., 700., 500.]], 'hPa')
+    temp = moist_lapse(pressure, units.Quantity([14.07345674, 0.], 'degC'),
+                       units.Quantity([850., 700.], 'hPa'), vertical_dim=1)
+
+    truth = units.Quantity([[20.0804315, 17.23238477, 14.07345674, 6.47393223, -0.00554555],
+                            moist_lapse(pressure[1], units.Quantity(0., 'degC'),
+                                        units.Quantity(700., 'hPa')).m_as('degC')], 'degC')
+    assert_array_almost_equal(temp, truth, 3)
+
+
+def test_moist_lapse_grid_nan():
+    """Test moist_lapse on columns when given nans."""
+    pressure = units.Quantity([[1000., 850., 700.], [1000., np.nan, 700.]], 'hPa').T
+    temp = moist_lapse(pressure, units.Quantity([np.nan, 20.], 'degC'))
+    assert np.all(np.isnan(temp[:, 0]))
+    assert np.isnan(temp[1, 1])
+    assert_almost_equal(temp[2, 1], moist_lapse(pressure[2, 1], units.Quantity(20., 'degC'),
+                                                pressure[0, 1]), 3)
+
+
 def test_parcel_profile():
     """Test parcel profile calculation."""
     levels = np.array([1000., 900., 800., 700., 600., 500., 400.]) * units.mbar
@@ -259,6 +296,52 @@ def test_parcel_profile():
     assert_array_almost_equal(prof, true_prof, 2)
 
 
+def test_parcel_profile_grid():
+    """Test parcel profile calculation for many columns at once."""
+    levels = np.array([1000., 900., 800., 700., 600., 500., 400.]) * units.mbar
+    temperature = np.array([30., 20., 10.]) * units.degC
+    dewpoint = np.array([20., 20., -5.]) * units.degC
+    pressure = np.broadcast_to(levels.m[:, None], (7, 3)) * levels.units
+
+    prof = parcel_profile(pressure, temperature, dewpoint)
+    assert prof.units == temperature.units
+    for i in range(3):
+        assert_array_almost_equal(prof[:, i],
+                                  parcel_profile(levels, temperature[i], dewpoint[i]), 3)
+
+
+def test_parcel_profile_grid_xarray():
+    """Test parcel profile calculation on a grid of xarray DataArrays."""
+    levels = np.array([1000., 900., 800., 700., 600., 500., 400.])
+    pressure = xr.DataArray(levels, dims='isobaric',
+                            attrs={'units': 'hPa'}).expand_dims(x=2).transpose()
+    temperature = xr.DataArray([30., 15.], dims='x', attrs={'units': 'degC'})
+    dewpoint = xr.DataArray([20., 0.], dims='x', attrs={'units': 'degC'})
+
+    prof = parcel_profile(pressure, temperature, dewpoint)
+    assert isinstance(prof, xr.DataArray)
+    assert prof.dims == ('isobaric', 'x')
+    assert_array_almost_equal(
+        prof.isel(x=1).metpy.unit_array,
+        parcel_profile(levels * units.hPa, 15. * units.degC, 0. * units.degC), 3)
+
+
+def test_parcel_profile_with_lcl_grid():
+    """Test parcel profile with lcl calculation for many columns at once."""
+    p = np.array([1004., 1000., 943., 928., 925., 850., 839., 749., 700., 699.]) * units.hPa
+    t = np.array([24.2, 24., 20.2, 21.6, 21.4, 20.4, 20.2, 14.4, 13.2, 13.]) * units.degC
+    td = np.array([21.9, 22.1, 19.2, 20.5, 20.4, 18.4, 17.4, 8.4, -2.8, -3.0]) * units.degC
+    temperature = np.stack([t, t + 2 * units.delta_degC, t], axis=-1)
+    dewpoint = np.stack([td, td - 10 * units.delta_degC, t], axis=-1)
+
+    results = parcel_profile_with_lcl(p, temperature, dewpoint)
+    for i in range(3):
+        truths = parcel_profile_with_lcl(p, temperature[:, i], dewpoint[:, i])
+        for result, truth in zip(results, truths, strict=True):
+            assert result.shape == (11, 3)
+            assert_array_almost_equal(result[:, i], truth, 3)
+
+
 def test_parcel_profile_lcl():
     """Test parcel profile with lcl calculation."""
     p = np.array([1004., 1000., 943., 928., 925., 850., 839., 749., 700., 699.]) * units.hPa
@@ -1487,6 +1570,41 @@ def test_isentropic_pressure_4d():
     assert_almost_equal(isentprs[1][:, 1, ], truerh, 3)
 
 
+def test_isentropic_pressure_float32():
+    """Test calculation of isentropic pressure in single precision."""
+    lev = [100000., 95000., 90000., 85000.] * units.Pa
+    tmp = np.ones((4, 5, 5))
+    tmp[0, :] = 296.
+    tmp[1, :] = 292.
+    tmp[2, :] = 290
+    tmp[3, :] = 288.
+    tmpk = tmp * units.kelvin
+    isentlev = [296., 297., 300.] * units.kelvin
+    isentprs = isentropic_interpolation(isentlev, lev, tmpk, dtype=np.float32)
+    assert isentprs[0].dtype == np.float32
+    assert_almost_equal(isentprs[0][0], 1000. * units.hPa, 2)
+    assert_almost_equal(isentprs[0][1], 936.213 * units.hPa, 2)
+    assert_almost_equal(isentprs[0][2], 879.50375588 * units.hPa, 2)
+
+
+def test_isentropic_pressure_out():
+    """Test calculation of isentropic pressure into a preallocated array."""
+    lev = [85000., 90000., 95000., 100000.] * units.Pa
+    tmp = np.ones((4, 5, 5))
+    tmp[0, :] = 288.
+    tmp[1, :] = 290.
+    tmp[2, :] = 292.
+    tmp[3, :] = 296.
+    tmpk = tmp * units.kelvin
+    isentlev = [296., 297., 300.] * units.kelvin
+    out = np.empty((3, 5, 5))
+    isentprs = isentropic_interpolation(isentlev, lev, tmpk, out=out)
+    assert np.shares_memory(isentprs[0].m, out)
+    assert_almost_equal(isentprs[0][0], 1000. * units.hPa, 3)
+    assert_almost_equal(isentprs[0][1], 936.213 * units.hPa, 3)
+    assert_almost_equal(isentprs[0][2], 879.50375588 * units.hPa, 3)
+
+
 @pytest.fixture
 def xarray_isentropic_data():
     """Generate test xarray dataset for interpolation functions."""
@@ -1753,6 +1871,97 @@ def test_mixed_layer_cape_cin_bottom_pressure(multiple_intersections):
     assert_almost_equal(mlcin_middle, -47.43 * units('joule / kilogram'), 2)
 
 
+@pytest.fixture()
+def multiple_intersections_grid(multiple_intersections):
+    """Create a grid of columns varying the profile with multiple LFCs and ELs."""
+    levels, temperatures, dewpoints = multiple_intersections
+    shifts = units.Quantity(np.array([[-3., -2., -1.], [0., 1., 2.]]), 'delta_degC')
+    temperature = temperatures[:, None, None] + shifts
+    dewpoint = dewpoints[:, None, None] + shifts - units.Quantity([0., 1., 2.], 'delta_degC')
+    dewpoint[20, 1, 1] = units.Quantity(np.nan, 'degC')
+    return levels, temperature, dewpoint
+
+
+@pytest.mark.parametrize('which_lfc', ['top', 'bottom'])
+@pytest.mark.parametrize('which_el', ['top', 'bottom'])
+def test_cape_cin_grid(multiple_intersections_grid, which_lfc, which_el):
+    """Test CAPE and CIN calculation for many columns at once against single columns."""
+    pressure, temperature, dewpoint = multiple_intersections_grid
+    profile = parcel_profile(np.broadcast_to(pressure[:, None, None], temperature.shape),
+                             temperature[0], dewpoint[0])
+    cape, cin = cape_cin(pressure, temperature, dewpoint, profile, which_lfc=which_lfc,
+                         which_el=which_el)
+    assert cape.shape == cin.shape == (2, 3)
+    for i, j in np.ndindex(2, 3):
+        truth = cape_cin(pressure, temperature[:, i, j], dewpoint[:, i, j],
+                         profile[:, i, j], which_lfc=which_lfc, which_el=which_el)
+        assert_almost_equal(cape[i, j], truth[0], 0)
+        assert_almost_equal(cin[i, j], truth[1], 0)
+
+
+@pytest.mark.parametrize('which', ['top', 'bottom'])
+def test_lfc_el_grid(multiple_intersections_grid, which):
+    """Test LFC and EL calculation for many columns at once against single columns."""
+    pressure, temperature, dewpoint = multiple_intersections_grid
+    lfc_p, lfc_t = lfc(pressure, temperature, dewpoint, which=which)
+    el_p, el_t = el(pressure, temperature, dewpoint, which=which)
+    for i, j in np.ndindex(2, 3):
+        for result, truth in zip(
+                (lfc_p, lfc_t, el_p, el_t),
+                lfc(pressure, temperature[:, i, j], dewpoint[:, i, j], which=which)
+                + el(pressure, temperature[:, i, j], dewpoint[:, i, j], which=which),
+                strict=True):
+            assert_almost_equal(result[i, j], truth, 1)
+
+
+@pytest.mark.parametrize('func', [surface_based_cape_cin, mixed_layer_cape_cin,
+                                  most_unstable_cape_cin])
+@pytest.mark.parametrize('vertical_dim', [0, -1])
+def test_parcel_cape_cin_grid(multiple_intersections_grid, func, vertical_dim):
+    """Test the parcel CAPE and CIN calculations for many columns at once."""
+    pressure, temperature, dewpoint = multiple_intersections_grid
+    cape, cin = func(pressure, np.moveaxis(temperature, 0, vertical_dim),
+                     np.moveaxis(dewpoint, 0, vertical_dim), vertical_dim=vertical_dim)
+    for i, j in np.ndindex(2, 3):
+        truth = func(pressure, temperature[:, i, j], dewpoint[:, i, j])
+        assert_almost_equal(cape[i, j], truth[0], 0)
+        assert_almost_equal(cin[i, j], truth[1], 0)
+
+
+def test_mixed_layer_cape_cin_grid_depth(multiple_intersections_grid):
+    """Test the mixed layer CAPE and CIN for many columns with a given layer depth."""
+    pressure, temperature, dewpoint = multiple_intersections_grid
+    cape, cin = mixed_layer_cape_cin(pressure, temperature, dewpoint, depth=50 * units.hPa)
+    truth = mixed_layer_cape_cin(pressure, temperature[:, 1, 2], dewpoint[:, 1, 2],
+                                 depth=50 * units.hPa)
+    assert_almost_equal(cape[1, 2], truth[0], 0)
+    assert_almost_equal(cin[1, 2], truth[1], 0)
+
+
+def test_surface_based_cape_cin_grid_xarray(multiple_intersections_grid):
+    """Test the surface-based CAPE and CIN for many columns with xarray."""
+    pressure, temperature, dewpoint = multiple_intersections_grid
+    data = xr.Dataset(
+        {
+            'temperature': (('isobaric', 'y', 'x'), temperature),
+            'dewpoint': (('isobaric', 'y', 'x'), dewpoint)
+        },
+        coords={'isobaric': (('isobaric',), pressure.m, {'units': 'hPa'})}
+    )
+    cape, cin = surface_based_cape_cin(data['isobaric'], data['temperature'],
+                                       data['dewpoint'])
+    truth_cape, truth_cin = surface_based_cape_cin(pressure, temperature, dewpoint)
+    assert_array_almost_equal(cape, truth_cape, 6)
+    assert_array_almost_equal(cin, truth_cin, 6)
+
+
+def test_cape_cin_grid_invalid_which(multiple_intersections_grid):
+    """Test that options needing the full set of intersections are rejected for grids."""
+    pressure, temperature, dewpoint = multiple_intersections_grid
+    with pytest.raises(ValueError, match='multiple columns'):
+        lfc(pressure, temperature, dewpoint, which='wide')
+
+
 def test_dcape():
     """Test the calculation of DCAPE."""
     pressure = [1008., 1000., 950., 900., 850., 800., 750., 700., 650., 600.,
@@ -2018,6 +2227,43 @@ def test_static_stability_cross_section():
     assert_almost_equal(sigma, truth, 6)
 
 
+@needs_module('dask')
+def test_static_stability_dask():
+    """Test static stability on dask-backed DataArrays stays lazy with whole columns."""
+    pressure = xr.DataArray([850., 700., 500.], dims=('isobaric',),
+                            attrs={'units': 'hPa'})
+    temperature = xr.DataArray([[17., 11., -10.], [16., 10., -11.], [11., 6., -12.]],
+                               dims=('x', 'isobaric'),
+                               coords={'isobaric': pressure, 'x': [0, 1, 2]},
+                               attrs={'units': 'degC'})
+    sigma = static_stability(temperature.isobaric, temperature.chunk({'x': 1, 'isobaric': 1}))
+    assert sigma.chunks is not None
+    truth = static_stability(temperature.isobaric, temperature)
+    assert_array_almost_equal(sigma.metpy.quantify().metpy.unit_array,
+                              truth.metpy.unit_array, 6)
+
+
+@needs_module('dask')
+def test_thermo_dask_elementwise():
+    """Test chaining elementwise thermo calculations on dask-backed DataArrays."""
+    pressure = xr.DataArray([1000., 850., 700.], dims=('isobaric',), attrs={'units': 'hPa'})
+    temperature = xr.DataArray([[20., 10., 0.], [25., 15., 5.]], dims=('y', 'isobaric'),
+                               coords={'isobaric': pressure}, attrs={'units': 'degC'})
+    mixing = xr.DataArray([[10., 5., 2.], [12., 6., 3.]], dims=('y', 'isobaric'),
+                          coords={'isobaric': pressure}, attrs={'units': 'g/kg'})
+    lazy_theta = potential_temperature(temperature.isobaric, temperature.chunk({'y': 1}))
+    lazy_td = dewpoint(vapor_pressure(temperature.isobaric, mixing.chunk({'y': 1})))
+    assert lazy_theta.chunksizes['y'] == (1, 1)
+    assert lazy_td.chunksizes['y'] == (1, 1)
+
+    theta = potential_temperature(temperature.isobaric, temperature)
+    td = dewpoint(vapor_pressure(temperature.isobaric, mixing))
+    assert_array_almost_equal(lazy_theta.metpy.quantify().metpy.unit_array,
+                              theta.metpy.unit_array, 5)
+    assert_array_almost_equal(lazy_td.metpy.quantify().metpy.unit_array,
+                              td.metpy.unit_array, 5)
+
+
 def test_dewpoint_specific_humidity():
     """Test dewpoint from specific humidity."""
     p = 1013.25 * units.mbar
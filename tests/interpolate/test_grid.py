@@ -3,7 +3,7 @@
 # SPDX-License-Identifier: BSD-3-Clause
 """Test the `grid` module."""
 
-
+from concurrent.futures import ThreadPoolExecutor
 import logging
 
 import numpy as np
@@ -279,12 +279,53 @@ def test_interpolate_to_grid(method, assume_units, test_coords, boundary_coords)
     # in the grid generation (desired value was 10) See #2319.
     hres = 10.121
     xg, yg, img = interpolate_to_grid(xp, yp, z, hres=hres, interp_type=method, **extra_kw)
+    if method == 'natural_neighbor':
+        # The stored results have NaN where the grid lands on an observation
+        truth[(xg == xp[6]) & (yg == yp[6])] = z[6]
 
     assert np.all(np.diff(xg, axis=-1) <= hres)
     assert np.all(np.diff(yg, axis=0) <= hres)
     assert_array_almost_equal(truth, img)
 
 
+@pytest.mark.parametrize('method, passes', [('cressman', 1), ('barnes', 1), ('barnes', 3)])
+def test_interpolate_to_grid_tiled(method, passes, test_coords):
+    r"""Test that interpolating to a grid in tiles matches doing it all at once."""
+    xp, yp = test_coords
+    z = units.Quantity(np.array([0.064, 4.489, 6.241, 0.1, 2.704, 2.809, 9.604, 1.156,
+                                 0.225, 3.364]), 'mbar')
+
+    kwargs = {'hres': 2, 'interp_type': method, 'search_radius': 30, 'minimum_neighbors': 1,
+              'passes': passes}
+    _, _, truth = interpolate_to_grid(xp, yp, z, **kwargs)
+    with ThreadPoolExecutor(2) as executor:
+        xg, yg, img = interpolate_to_grid(xp, yp, z, tile_size=7, executor=executor, **kwargs)
+
+    assert img.shape == xg.shape == yg.shape
+    assert_array_almost_equal(truth, img)
+
+
+def test_interpolate_to_grid_tiled_invalid(test_data):
+    r"""Test that tiled interpolation is rejected for global methods."""
+    xp, yp, z = test_data
+    with pytest.raises(ValueError):
+        interpolate_to_grid(xp, yp, z, hres=10, interp_type='linear', tile_size=5)
+
+
+def test_inverse_distance_to_grid_tiled(test_data, test_grid):
+    r"""Test that inverse distance interpolation to a grid in tiles matches."""
+    xp, yp, z = test_data
+    xg, yg = test_grid
+
+    img = inverse_distance_to_grid(xp, yp, z, xg, yg, 40, kappa=100, kind='barnes',
+                                   tile_size=16)
+
+    with get_test_data('barnes_r40_k100.npz') as fobj:
+        truth = np.load(fobj)['img']
+
+    assert_array_almost_equal(truth, img)
+
+
 def test_interpolate_to_isosurface_from_below():
     r"""Test interpolation to level function."""
     pv = np.array([[[1.75, 1.875, 2., 2.125, 2.25],
@@ -7,7 +7,8 @@ import numpy as np
 import pytest
 import xarray as xr
 
-from metpy.interpolate import interpolate_1d, interpolate_nans_1d, log_interpolate_1d
+from metpy.interpolate import (interpolate_1d, interpolate_nans_1d, log_interpolate_1d,
+                               VerticalInterpolator)
 from metpy.testing import assert_array_almost_equal
 from metpy.units import units
 
@@ -195,6 +196,43 @@ def test_interpolate_masked_units():
     assert_array_almost_equal(y_interp, y_interp_truth, 7)
 
 
+def test_interpolate_masked_level():
+    """Test interpolating with a masked level in the middle of xp."""
+    xp = np.ma.masked_values([1000., 900., -9999., 700., 600.], -9999.)
+    y = np.array([10., 9., 8., 7., 6.])
+    assert_array_almost_equal(interpolate_1d([850., 650.], xp, y), np.array([8.5, 6.5]), 7)
+
+
+def test_log_interpolate_masked_level():
+    """Test log interpolating with a masked fill value in the middle of xp."""
+    xp = np.ma.masked_values([1000., 900., 9.96921e36, 700., 600.], 9.96921e36)
+    y = np.array([10., 9., 8., 7., 6.])
+    assert_array_almost_equal(log_interpolate_1d([850., 650.], xp, y),
+                              np.array([8.5451243, 6.51924979]), 7)
+
+
+@pytest.mark.parametrize('order', ['increasing', 'decreasing', 'unsorted'])
+def test_interpolate_3d_order(order):
+    """Test interpolating 3D data with levels in different orders along the axis."""
+    xp = np.linspace(1., 10., 10)[:, np.newaxis, np.newaxis] + np.arange(12).reshape(3, 4)
+    y = 2 * xp + 1
+    if order == 'decreasing':
+        xp, y = xp[::-1], y[::-1]
+    elif order == 'unsorted':
+        shuffle = np.random.default_rng(42).permutation(10)
+        xp, y = xp[shuffle], y[shuffle]
+
+    x_interp = np.array([5.5, 12.25, 13.5])
+    with pytest.warns(UserWarning, match='out of data bounds'):
+        y_interp = interpolate_1d(x_interp, xp, y, axis=0)
+
+    # Each column covers [1 + offset, 10 + offset]
+    offset = np.arange(12).reshape(3, 4)
+    x_3d = x_interp[:, np.newaxis, np.newaxis]
+    truth = np.where((x_3d >= 1 + offset) & (x_3d <= 10 + offset), 2 * x_3d + 1, np.nan)
+    assert_array_almost_equal(y_interp, truth, 7)
+
+
 def test_interpolate_broadcast():
     """Test interpolate_1d with input levels needing broadcasting."""
     p = units.Quantity([850, 700, 500], 'hPa')
@@ -203,3 +241,64 @@ def test_interpolate_broadcast():
     t_level = interpolate_1d(units.Quantity(700, 'hPa'), p[:, None, None], t)
     assert_array_almost_equal(t_level,
                               units.Quantity(np.arange(20., 40.).reshape(1, 4, 5), 'degC'), 7)
+
+
+@pytest.mark.parametrize('order', ['increasing', 'decreasing', 'unsorted'])
+def test_vertical_interpolator(order):
+    """Test that the interpolator matches interpolate_1d for multiple variables."""
+    rng = np.random.default_rng(20)
+    xp = np.cumsum(rng.uniform(0.5, 1.5, size=(8, 3, 4)), axis=0)
+    if order == 'decreasing':
+        xp = xp[::-1]
+    elif order == 'unsorted':
+        xp = xp[rng.permutation(8)]
+    temps = [rng.normal(size=(8, 3, 4)) for _ in range(3)]
+    x = np.array([3., 2., 5.])
+
+    interp = VerticalInterpolator(x, xp)
+    for temp, truth in zip(temps, interpolate_1d(x, xp, *temps), strict=True):
+        assert_array_almost_equal(interp(temp), truth, 12)
+
+
+def test_vertical_interpolator_log_units():
+    """Test the interpolator with log scaling and units."""
+    p = units.Quantity([1000., 850., 700., 500.], 'hPa')
+    t = units.Quantity([20., 12., 5., -10.], 'degC')
+    p_interp = units.Quantity([92500., 60000.], 'Pa')
+
+    interp = VerticalInterpolator(p_interp, p, log=True)
+    assert_array_almost_equal(interp(t), log_interpolate_1d(p_interp, p, t), 10)
+    assert_array_almost_equal(interp(t), units.Quantity([16.16234039, -1.87206832], 'degC'),
+                              7)
+
+
+def test_vertical_interpolator_broadcast():
+    """Test the interpolator with levels that broadcast against the variables."""
+    p = units.Quantity([850, 700, 500], 'hPa')
+    t = units.Quantity(np.arange(60).reshape(3, 4, 5), 'degC')
+
+    interp = VerticalInterpolator(units.Quantity([700, 600], 'hPa'), p[:, None, None])
+    assert_array_almost_equal(interp(t), interpolate_1d(units.Quantity([700, 600], 'hPa'),
+                                                        p[:, None, None], t), 10)
+    assert interp(t[..., :2]).shape == (2, 4, 2)
+
+
+def test_vertical_interpolator_out_of_bounds():
+    """Test the interpolator's handling of points outside the data."""
+    x = np.array([1., 2., 3., 4.])
+    with pytest.raises(ValueError):
+        VerticalInterpolator(np.array([0.5, 2.5]), x, fill_value=None)
+
+    with pytest.warns(Warning):
+        interp = VerticalInterpolator(np.array([2.5, 5.]), x, fill_value=-999)
+    assert_array_almost_equal(interp(x * 2), np.array([5., -999.]), 7)
+
+
+@pytest.mark.parametrize('fill', [-9999., 9.96921e36])
+def test_vertical_interpolator_masked_xp(fill):
+    """Test the interpolator with a masked level in the middle of the column."""
+    xp = np.ma.masked_values([1000., 900., fill, 700., 600.], fill)
+    temp = np.array([10., 9., 8., 7., 6.])
+
+    interp = VerticalInterpolator(np.array([850., 650.]), xp)
+    assert_array_almost_equal(interp(temp), np.array([8.5, 6.5]), 7)
@@ -12,7 +12,7 @@ from scipy.spatial import cKDTree, Delaunay
 
 from metpy.cbook import get_test_data
 from metpy.interpolate import (interpolate_to_points, inverse_distance_to_points,
-                               natural_neighbor_to_points)
+                               natural_neighbor_to_points, ObjectiveAnalysis)
 from metpy.interpolate.geometry import dist_2, find_natural_neighbors
 from metpy.interpolate.points import barnes_point, cressman_point, natural_neighbor_point
 from metpy.testing import assert_almost_equal, assert_array_almost_equal
@@ -109,6 +109,48 @@ def test_natural_neighbor_to_points(test_data, test_points):
     assert_array_almost_equal(truth, img)
 
 
+def test_natural_neighbor_to_points_matches_point():
+    r"""Test natural neighbor interpolation matches the single point calculation."""
+    rng = np.random.default_rng(20261018)
+    obs_points = rng.uniform(0, 100, (50, 2))
+    z = rng.normal(size=50)
+    xi = rng.uniform(-10, 110, (200, 2))
+
+    img = natural_neighbor_to_points(obs_points, z, xi)
+
+    tri = Delaunay(obs_points)
+    members, circumcenters = find_natural_neighbors(tri, xi)
+    truth = [natural_neighbor_point(*obs_points.T, z, xi[i], tri, neighbors, circumcenters)
+             if neighbors else np.nan for i, neighbors in members.items()]
+
+    assert_array_almost_equal(truth, img)
+
+
+def test_natural_neighbor_to_points_linear():
+    r"""Test natural neighbor interpolation reproduces a linear field on a lattice."""
+    x, y = np.meshgrid(np.arange(0, 20, 4.), np.arange(0, 20, 4.))
+    obs_points = np.stack([x.ravel(), y.ravel()], axis=1)
+    z = 2 * obs_points[:, 0] + obs_points[:, 1]
+    xi = np.array([[2, 2], [5, 10], [12, 13.4], [3, 5], [18, 18]])
+
+    img = natural_neighbor_to_points(obs_points, z, xi)
+
+    assert_array_almost_equal(img, [6, 20, 37.4, 11, np.nan])
+
+
+def test_natural_neighbor_to_points_on_obs(caplog):
+    r"""Test natural neighbor interpolation to points that coincide with observations."""
+    obs_points = np.array([[50, 50], [20, 30], [80, 20], [10, 80], [90, 90], [60, 10]])
+    z = np.arange(6.)
+    xi = np.array([[50, 50], [20, 30], [45, 40]])
+
+    img = natural_neighbor_to_points(obs_points, z, xi)
+
+    assert_array_almost_equal(img[:2], [0, 1])
+    assert np.isfinite(img[2])
+    assert 'Unable to calculate natural neighbor weights' not in caplog.text
+
+
 def test_inverse_distance_to_points_invalid(test_data, test_points):
     """Test that inverse_distance_to_points raises when given an invalid method."""
     xp, yp, z = test_data
@@ -138,6 +180,70 @@ def test_inverse_distance_to_points(method, assume_units, test_data, test_points
     assert_array_almost_equal(truth, img)
 
 
+@pytest.mark.parametrize('method', ['cressman', 'barnes'])
+def test_objective_analysis(method, test_data, test_points):
+    r"""Test reusing an objective analysis for several variables at once."""
+    xp, yp, z = test_data
+    obs_points = np.vstack([xp, yp]).transpose()
+
+    extra_kw, test_file = {'cressman': ({'r': 20, 'min_neighbors': 1}, 'cressman_r20_mn1.npz'),
+                           'barnes': ({'r': 40, 'kappa': 100}, 'barnes_r40_k100.npz')}[method]
+
+    with get_test_data(test_file) as fobj:
+        truth = np.load(fobj)['img'].reshape(-1)
+
+    analysis = ObjectiveAnalysis(obs_points, test_points, kind=method, **extra_kw)
+    img = analysis(units.Quantity(np.stack([z, 2 * z, z + 1], axis=-1), 'mbar'))
+
+    assert img.shape == (len(test_points), 3)
+    assert_array_almost_equal(img[:, 0], units.Quantity(truth, 'mbar'))
+    assert_array_almost_equal(img[:, 1], units.Quantity(2 * truth, 'mbar'))
+    assert_array_almost_equal(img[:, 2], units.Quantity(truth + 1, 'mbar'))
+
+
+def test_objective_analysis_min_neighbors(test_data):
+    r"""Test objective analysis only fills points with enough neighbors."""
+    xp, yp, z = test_data
+    obs_points = np.vstack([xp, yp]).transpose()
+    xi = np.array([[30, 30], [60, 60], [200, 200]])
+
+    analysis = ObjectiveAnalysis(obs_points, xi, 40, min_neighbors=4)
+
+    assert_array_almost_equal(analysis(z), [1.05499444, 4.12569873, np.nan])
+
+
+@pytest.mark.parametrize('passes', [2, 3])
+def test_objective_analysis_passes(passes, test_data, test_points):
+    r"""Test multi-pass barnes analysis against a point-by-point calculation."""
+    xp, yp, z = test_data
+    obs_points = np.vstack([xp, yp]).transpose()
+    r, kappa, gamma = 40, 100, 0.3
+
+    def barnes(points, values, gamma, min_neighbors=3):
+        dists = [dist_2(*pt, xp, yp) for pt in points]
+        return np.array([barnes_point(d[d <= r**2], values[d <= r**2], kappa, gamma)
+                         if np.count_nonzero(d <= r**2) >= min_neighbors else np.nan
+                         for d in dists])
+
+    truth = barnes(test_points, z, 1)
+    analysis = barnes(obs_points, z, 1, 1)
+    for _ in range(passes - 1):
+        truth += barnes(test_points, z - analysis, gamma)
+        analysis += barnes(obs_points, z - analysis, gamma, 1)
+
+    img = inverse_distance_to_points(obs_points, z, test_points, r, gamma, kappa,
+                                     kind='barnes', passes=passes)
+    assert_array_almost_equal(truth, img)
+
+
+def test_objective_analysis_passes_cressman(test_data, test_points):
+    r"""Test that multiple passes are rejected for cressman analysis."""
+    xp, yp, z = test_data
+    obs_points = np.vstack([xp, yp]).transpose()
+    with pytest.raises(ValueError):
+        ObjectiveAnalysis(obs_points, test_points, 40, kind='cressman', passes=2)
+
+
 def test_interpolate_to_points_invalid(test_data):
     """Test that interpolate_to_points raises when given an invalid method."""
     xp, yp, z = test_data
@@ -175,5 +281,9 @@ def test_interpolate_to_points(method, assume_units, test_data):
         z = units.Quantity(z, assume_units)
         truth = units.Quantity(truth, assume_units)
 
+    if method == 'natural_neighbor':
+        # The stored results have NaN at the point that lands on an observation
+        truth[(test_points == obs_points[6]).all(axis=1)] = z[6]
+
     img = interpolate_to_points(obs_points, z, test_points, interp_type=method, **extra_kw)
     assert_array_almost_equal(truth, img)
@@ -4,6 +4,7 @@
 """Test the `gempak` module."""
 
 from datetime import datetime
+from io import BytesIO
 import logging
 
 import numpy as np
@@ -44,6 +45,39 @@ def test_grid_loading(grid_name):
     assert_allclose(gio, gempak, rtol=1e-6, atol=0)
 
 
+@pytest.mark.parametrize('bits', [1, 7, 12, 16, 23, 32])
+def test_unpack_bits(bits):
+    """Test unpacking integers packed across 32-bit word boundaries."""
+    rng = np.random.default_rng(bits)
+    values = rng.integers(0, 2**bits, size=101)
+
+    # Pack the values, most significant bit first, into 32-bit words
+    stream = ''.join(f'{val:0{bits}b}' for val in values)
+    stream += '0' * (-len(stream) % 32)
+    words = np.array([int(stream[i:i + 32], 2) for i in range(0, len(stream), 32)],
+                     dtype=np.uint32).view(np.int32)
+
+    assert_equal(GempakGrid._unpack_bits(words, bits, values.size), values)
+
+
+def test_grid_loading_not_mmap():
+    """Test reading grids from a file object that cannot be memory-mapped."""
+    with open(get_test_data('gem_packing_diff.grd', as_file_obj=False), 'rb') as fobj:
+        data = BytesIO(fobj.read())
+    grid = GempakGrid(data).gdxarray(parameter='TMPK', level=850)[0]
+    truth = GempakGrid(get_test_data('gem_packing_diff.grd')).gdxarray(parameter='TMPK',
+                                                                       level=850)[0]
+    assert_equal(grid.values, truth.values)
+
+
+def test_grid_close():
+    """Test closing a memory-mapped GEMPAK file."""
+    with GempakGrid(get_test_data('gem_packing_diff.grd', as_file_obj=False)) as grid:
+        data = grid.gdxarray(parameter='TMPK', level=850)[0]
+    assert grid._buffer._data.closed
+    assert data.notnull().any()
+
+
 def test_merged_sounding():
     """Test loading a merged sounding.
 
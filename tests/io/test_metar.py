@@ -6,12 +6,14 @@ from datetime import datetime
 
 import numpy as np
 from numpy.testing import assert_almost_equal
+import pandas as pd
 import pytest
 
 from metpy.cbook import get_test_data
-from metpy.io import parse_metar_file, parse_metar_to_dataframe
-from metpy.io._metar_parser.metar_parser import parse
-from metpy.io.metar import Metar, parse_metar
+from metpy.io import iter_metar_file, parse_metar_file, parse_metar_to_dataframe
+from metpy.io._metar_parser.metar_parser import parse, ParseError
+from metpy.io.metar import _MetarColumns, _parse_tree, Metar, parse_metar
+from metpy.testing import needs_module
 from metpy.units import is_quantity, units
 
 
@@ -364,6 +366,43 @@ def test_parse_file_object():
     assert_almost_equal(test.northward_wind.values, 6)
 
 
+def test_iter_metar_file():
+    """Test parsing a file in batches."""
+    input_file = get_test_data('metar_20190701_1200.txt', as_file_obj=False)
+    truth = parse_metar_file(input_file, year=2019, month=7)
+
+    batches = list(iter_metar_file(input_file, chunksize=5000, year=2019, month=7))
+    assert len(batches) == 4
+    assert all(len(batch) <= 5000 for batch in batches)
+
+    # Duplicates are only removed within a batch, so there can be extra reports
+    station_ids = [stid for batch in batches for stid in batch.station_id]
+    assert len(station_ids) >= len(truth)
+    assert set(truth.station_id) <= set(station_ids)
+
+    # KVPZ 011156Z AUTO 27005KT 10SM CLR 23/19 A3004 RMK AO2 SLP166
+    test = next(batch[batch.station_id == 'KVPZ'] for batch in batches
+                if 'KVPZ' in batch.index)
+    assert test.air_temperature.values == 23
+    assert test.air_pressure_at_sea_level.values == 1016.76
+    assert batches[0].units == truth.units
+
+
+@needs_module('pyarrow')
+@pytest.mark.parametrize('ext', ['parquet', 'feather'])
+def test_iter_metar_file_output(tmp_path, ext):
+    """Test writing out batches of reports to files."""
+    input_file = get_test_data('metar_20190701_1200.txt', as_file_obj=False)
+    output = str(tmp_path / f'metars_{{:02d}}.{ext}')
+    batches = list(iter_metar_file(input_file, chunksize=10000, output=output))
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == [f'metars_00.{ext}',
+                                                          f'metars_01.{ext}']
+    df = getattr(pd, f'read_{ext}')(output.format(1))
+    assert df.station_id.tolist() == batches[1].station_id.tolist()
+    assert isinstance(df.low_cloud_type.dtype, pd.CategoricalDtype)
+
+
 def test_parse_no_pint_objects_in_df():
     """Test that there are no Pint quantities in dataframes created by parser."""
     input_file = get_test_data('metar_20190701_1200.txt', mode='rt')
@@ -401,6 +440,64 @@ def test_repr():
                    "remarks=TreeNode(text='', offset=47), end=TreeNode(text='', offset=47))")
 
 
+@pytest.mark.parametrize('fname', ['metar_20190701_1200.txt', '2020010600_sao.wmo'])
+def test_fast_parse_matches_parser(fname):
+    """Test that the regular expression decodes reports the same as the full parser."""
+    with open(get_test_data(fname, as_file_obj=False), errors='replace') as f:
+        reports = [line.strip() for line in f if len(line.strip()) > 25]
+
+    for report in reports:
+        try:
+            truth = parse(report)
+        except ParseError:
+            with pytest.raises(ParseError):
+                _parse_tree(report)
+            continue
+
+        tree = _parse_tree(report)
+        for field in ('siteid', 'datetime', 'wind', 'vis', 'curwx', 'skyc', 'temp_dewp',
+                      'altim', 'remarks'):
+            assert getattr(tree, field).text == getattr(truth, field).text, report
+        if truth.wind.text:
+            for field in ('wind_dir', 'wind_spd', 'gust'):
+                assert getattr(tree.wind, field).text == getattr(truth.wind, field).text
+        if truth.temp_dewp.text:
+            assert tree.temp_dewp.temp.text == truth.temp_dewp.temp.text
+            assert tree.temp_dewp.dewp.text == truth.temp_dewp.dewp.text
+
+
+def test_metar_columns():
+    """Test accumulating METARs into columns, including growing the storage."""
+    metars = _MetarColumns(size=1)
+    for metar in ['KLOT 261155Z AUTO 00000KT 10SM BKN100 05/00 A3001 RMK AO2=',
+                  'KMKE 266155Z AUTO /////KT 10SM FEW100 05/00 A3001 RMK AO2=',
+                  'KORD 261155Z 27010G20KT 1/2SM -RA BR OVC004 M01/M02 A2992']:
+        metars.append(parse_metar(metar, 2017, 5, station_metadata={}))
+    df = metars.to_dataframe()
+
+    assert len(metars) == 3
+    assert df.station_id.tolist() == ['KLOT', 'KMKE', 'KORD']
+    assert df.date_time.iloc[0] == datetime(2017, 5, 26, 11, 55)
+    assert pd.isna(df.date_time.iloc[1])
+    assert_almost_equal(df.wind_gust.values, [np.nan, np.nan, 20])
+    assert df.skyc1.tolist() == ['BKN', 'FEW', 'OVC']
+    assert list(df.skyc1.cat.categories) == ['BKN', 'FEW', 'OVC']
+    assert df.current_wx1.iloc[2] == '-RA'
+    assert df.current_wx2.isna().tolist() == [True, True, False]
+    assert df.cloudcover.tolist() == [6, 2, 8]
+
+
+def test_parse_metar_to_dataframe_categoricals():
+    """Test that weather and cloud type columns are categoricals."""
+    df = parse_metar_to_dataframe('KDEN 012153Z 09010KT 10SM -RA FEW060 BKN110 27/13 A3010')
+    for col in ('current_wx1', 'current_wx2', 'current_wx3', 'low_cloud_type',
+                'medium_cloud_type', 'high_cloud_type', 'highest_cloud_type'):
+        assert isinstance(df[col].dtype, pd.CategoricalDtype)
+    assert df.current_wx1.iloc[0] == '-RA'
+    assert df.medium_cloud_type.iloc[0] == 'BKN'
+    assert df.high_cloud_type.isna().all()
+
+
 def test_metar_units_in_place():
     """Test that parsing a METAR yields units that can be changed safely in-place."""
     df = parse_metar_to_dataframe('KDEN 012153Z 09010KT 10SM FEW060 BKN110 BKN220 27/13 A3010')
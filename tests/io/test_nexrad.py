@@ -2,6 +2,7 @@
 # Distributed under the terms of the BSD 3-Clause License.
 # SPDX-License-Identifier: BSD-3-Clause
 """Test the `nexrad` module."""
+import bz2
 import contextlib
 from datetime import datetime
 from io import BytesIO
@@ -12,7 +13,8 @@ import numpy as np
 import pytest
 
 from metpy.cbook import get_test_data, POOCH
-from metpy.io import is_precip_mode, Level2File, Level3File
+from metpy.io import is_precip_mode, Level2File, Level2Stream, Level3File
+from metpy.io.nexrad import bzip_blocks_decompress_all
 
 # Turn off the warnings for tests
 logging.getLogger('metpy.io.nexrad').setLevel(logging.CRITICAL)
@@ -136,6 +138,141 @@ def test_build19_level2_additions():
     assert f.sweeps[0][0].header.az_spacing == 0.5
 
 
+@pytest.mark.parametrize('fname, sweep, name',
+                         [('Level2_KFTG_20150430_1419.ar2v', 0, b'REF'),
+                          ('Level2_KFTG_20150430_1419.ar2v', 1, 'VEL'),
+                          ('KTLX19990503_235621.gz', 0, 'REF'),
+                          ('KTLX19990503_235621.gz', 1, b'SW')])
+def test_level2_moment_array(fname, sweep, name):
+    """Test getting a moment for a whole sweep matches the data from each radial."""
+    f = Level2File(get_test_data(fname, as_file_obj=False))
+    sweep = f.sweeps[sweep]
+    key = next(key for key in (name, name.encode('ascii') if isinstance(name, str)
+                               else name.decode('ascii')) if key in sweep[0][-1])
+    truth = np.array([radial[-1][key][1] for radial in sweep])
+
+    data = sweep.moment_array(name)
+    assert data.shape == truth.shape
+    np.testing.assert_array_equal(data, truth)
+
+
+def test_level2_moments_lazy():
+    """Test that moment data are kept raw until they are accessed."""
+    f = Level2File(get_test_data('Level2_KFTG_20150430_1419.ar2v', as_file_obj=False))
+    moments = f.sweeps[0][0].moments
+    hdr, raw = moments.raw(b'REF')
+    assert raw.dtype.kind == 'u'
+    assert not moments._scaled
+
+    ref_hdr, ref = moments[b'REF']
+    assert ref_hdr is hdr
+    assert np.all(np.isnan(ref[raw <= 1]))
+    np.testing.assert_array_almost_equal(ref[raw > 1],
+                                         (raw[raw > 1] - hdr.offset) / hdr.scale)
+    assert b'REF' in dict(moments)
+
+
+def test_level2_workers():
+    """Test that decompressing the bzip2 blocks using threads gives the same data."""
+    fname = get_test_data('Level2_KFTG_20150430_1419.ar2v', as_file_obj=False)
+    f = Level2File(fname)
+    f_threaded = Level2File(fname, workers=4)
+    assert len(f_threaded.sweeps) == len(f.sweeps)
+    assert [len(sweep) for sweep in f_threaded.sweeps] == [len(sweep) for sweep in f.sweeps]
+    np.testing.assert_array_equal(f_threaded.sweeps[-1].moment_array('REF'),
+                                  f.sweeps[-1].moment_array('REF'))
+
+
+@pytest.mark.parametrize('workers', [None, 3])
+def test_bzip_blocks_bad_block(workers, caplog):
+    """Test that a corrupt block stops decompression but keeps the earlier blocks."""
+    blocks = [bz2.compress(bytes([i]) * 1000) for i in range(5)]
+    blocks[3] = b'not bzip2 data'
+    data = b''.join(len(block).to_bytes(4, 'big', signed=True) + block for block in blocks)
+
+    frames = bzip_blocks_decompress_all(data, workers=workers)
+    assert frames == b''.join(bytes([i]) * 1000 for i in range(3))
+    assert 'Error decompressing bz2 block' in caplog.text
+
+
+def test_bzip_blocks_not_bzip():
+    """Test that data which are not bzip2-ed are rejected."""
+    with pytest.raises(ValueError, match='Not a bz2 stream'):
+        bzip_blocks_decompress_all(b'\x00\x00\x00\x10' + b'y' * 100, workers=2)
+
+
+@pytest.mark.parametrize('fname', ['Level2_KFTG_20150430_1419.ar2v',
+                                   'KTLX19990503_235621.gz'])
+def test_level2_selected_sweeps_moments(fname):
+    """Test only decoding requested sweeps and moments."""
+    fname = get_test_data(fname, as_file_obj=False)
+    f = Level2File(fname)
+    f_select = Level2File(fname, sweeps=[1], moments=['REF', b'VEL'])
+
+    assert len(f_select.sweeps) == len(f.sweeps)
+    assert [len(sweep) for sweep in f_select.sweeps] == [
+        len(sweep) if i == 1 else 0 for i, sweep in enumerate(f.sweeps)]
+
+    radial = f_select.sweeps[1][0]
+    assert {name.strip() for name in radial[-1]} <= {'REF', 'VEL', b'REF', b'VEL'}
+    for name in radial[-1]:
+        np.testing.assert_array_equal(f_select.sweeps[1].moment_array(name),
+                                      f.sweeps[1].moment_array(name))
+
+
+def test_level2_stream():
+    """Test adding chunks to a stream one at a time gives the same sweeps as the file."""
+    fname = get_test_data('Level2_KFTG_20150430_1419.ar2v', as_file_obj=False)
+    with open(fname, 'rb') as fobj:
+        data = fobj.read()
+
+    # Split into chunks like real-time data: volume header with the metadata record,
+    # followed by chunks of several compressed records
+    offsets = [24]
+    while offsets[-1] < len(data):
+        offsets.append(offsets[-1] + 4
+                       + int.from_bytes(data[offsets[-1]:offsets[-1] + 4], 'big', signed=True))
+    chunk_bounds = [0] + offsets[1:-1:5] + [len(data)]
+
+    f = Level2File(fname)
+    stream = Level2Stream()
+    completed = []
+    for start, end in zip(chunk_bounds[:-1], chunk_bounds[1:], strict=True):
+        assert not stream.volume_complete
+        completed.extend(stream.add_chunk(data[start:end]))
+        # Completed sweeps are available right away
+        for ind in completed:
+            assert len(stream.sweeps[ind]) == len(f.sweeps[ind])
+
+    assert stream.volume_complete
+    assert stream.stid == f.stid
+    assert completed == stream.completed_sweeps == list(range(len(f.sweeps)))
+    np.testing.assert_array_equal(stream.sweeps[3].moment_array('VEL'),
+                                  f.sweeps[3].moment_array('VEL'))
+
+
+def test_level2_stream_single_chunk(caplog):
+    """Test adding a real-time chunk without a volume header from a file."""
+    caplog.set_level(logging.INFO, 'metpy.io.nexrad')
+    stream = Level2Stream(moments=['REF'])
+    assert stream.stid is None
+    assert stream.dt is None
+    assert stream.add_chunk(get_test_data('Level2_KLBB_single_chunk')) == []
+    assert stream.vol_hdr is None
+    assert len(stream.sweeps) == 1
+    assert len(stream.sweeps[0]) == 120
+    assert list(stream.sweeps[0][0].moments) == [b'REF']
+    # Skipping the other moments should not look like padding
+    assert 'Padding detected' not in caplog.text
+
+
+def test_level2_moment_array_missing():
+    """Test that asking for a moment not in the sweep errors out."""
+    f = Level2File(get_test_data('Level2_KFTG_20150430_1419.ar2v', as_file_obj=False))
+    with pytest.raises(KeyError, match='CFP'):
+        f.sweeps[0].moment_array('CFP')
+
+
 #
 # NIDS/Level 3 Tests
 #
@@ -3,7 +3,13 @@
 # SPDX-License-Identifier: BSD-3-Clause
 """Test the `_tools` module."""
 
-from metpy.io._tools import NamedStruct
+import gzip
+from io import BytesIO
+import mmap
+
+import numpy as np
+
+from metpy.io._tools import IOBuffer, NamedStruct
 
 
 def test_unpack():
@@ -21,3 +27,39 @@ def test_pack():
 
     b = struct.pack(field1=8, field2=3)
     assert b == b'\x00\x00\x00\x08\x00\x03'
+
+
+def test_iobuffer_mmap(tmp_path):
+    """Test memory-mapping a file on disk into an IOBuffer."""
+    path = tmp_path / 'data.bin'
+    path.write_bytes(b'\x00\x01\x00\x01\x00\x02' + np.arange(4, dtype='>i4').tobytes())
+    struct = NamedStruct([('field1', 'i'), ('field2', 'h')], '>')
+
+    with open(path, 'rb') as fobj:
+        buf = IOBuffer.fromfile(fobj, use_mmap=True)
+    assert isinstance(buf._data, mmap.mmap)
+
+    s = buf.read_struct(struct)
+    assert s.field1 == 65537
+    assert s.field2 == 2
+    np.testing.assert_array_equal(buf.read_array(4, '>i4'), np.arange(4))
+    assert buf.at_end()
+
+    buf.close()
+    assert buf._data.closed
+
+
+def test_iobuffer_mmap_fallback(tmp_path):
+    """Test that sources which cannot be memory-mapped are read instead."""
+    path = tmp_path / 'data.bin.gz'
+    with gzip.open(path, 'wb') as fobj:
+        fobj.write(b'\x00\x01\x00\x01')
+
+    with gzip.open(path, 'rb') as fobj:
+        buf = IOBuffer.fromfile(fobj, use_mmap=True)
+    assert isinstance(buf._data, bytearray)
+    assert buf.read_int(4, 'big', signed=False) == 65537
+
+    buf = IOBuffer.fromfile(BytesIO(b'\x00\x02'), use_mmap=True)
+    assert isinstance(buf._data, bytearray)
+    assert buf.read_int(2, 'big', signed=False) == 2
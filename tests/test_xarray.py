@@ -12,7 +12,7 @@ import xarray as xr
 
 from metpy.plots.mapping import CFProjection
 from metpy.testing import (assert_almost_equal, assert_array_almost_equal, assert_array_equal,
-                           get_test_data)
+                           get_test_data, needs_module)
 from metpy.units import DimensionalityError, is_quantity, units
 from metpy.xarray import (add_vertical_dim_from_xarray, check_axis, check_matching_coordinates,
                           grid_deltas_from_dataarray, preprocess_and_wrap)
@@ -1406,6 +1406,88 @@ def test_preprocess_and_wrap_with_variable():
     assert_array_equal(result_21, expected_21)
 
 
+@needs_module('dask')
+def test_preprocess_and_wrap_lazy_elementwise():
+    """Test that elementwise calculations on dask-backed DataArrays stay lazy."""
+    data = xr.DataArray(np.arange(12.).reshape(3, 4), dims=('y', 'x'),
+                        coords={'y': [0, 1, 2], 'x': [0, 1, 2, 3]},
+                        attrs={'units': 'm'}).chunk({'x': 2})
+    calls = []
+
+    @preprocess_and_wrap(wrap_like='a', lazy='elementwise')
+    def func(a, b):
+        calls.append(a.shape)
+        return a * b
+
+    result = func(data, 2 * units('1/s'))
+    assert result.chunks == data.chunks
+    assert is_quantity(result.data)
+    assert result.metpy.units == units('m/s')
+    assert len(calls) == 1
+
+    xr.testing.assert_identical(result.coords.to_dataset(), data.coords.to_dataset())
+    assert_array_equal(result.compute().metpy.unit_array,
+                       2 * np.arange(12.).reshape(3, 4) * units('m/s'))
+    assert (3, 2) in calls
+
+
+@needs_module('dask')
+def test_preprocess_and_wrap_lazy_match_unit():
+    """Test lazy calculations converting output to the units of the matching argument."""
+    data = xr.DataArray([1., 2., 3., 4.], dims=('x',), attrs={'units': 'km'}).chunk(2)
+
+    @preprocess_and_wrap(wrap_like=('a', 'a'), match_unit=True, lazy='elementwise')
+    def func(a):
+        return a.to('m'), 2 * a.to('cm')
+
+    first, second = func(data)
+    assert first.metpy.units == units.km
+    assert second.metpy.units == units.km
+    assert_array_almost_equal(second.compute().metpy.unit_array, [2., 4., 6., 8.] * units.km)
+
+
+@needs_module('dask')
+def test_preprocess_and_wrap_lazy_vertical():
+    """Test that column calculations on dask-backed DataArrays keep whole columns."""
+    data = xr.DataArray(np.arange(24.).reshape(2, 3, 4) ** 2, dims=('y', 'z', 'x'),
+                        attrs={'units': 'K'})
+    shapes = []
+
+    @preprocess_and_wrap(wrap_like='a', lazy='vertical')
+    def func(a, vertical_dim=0):
+        shapes.append((a.shape, vertical_dim))
+        return np.gradient(a, axis=vertical_dim)
+
+    result = func(data.chunk({'y': 1, 'z': 1}), vertical_dim=1)
+    assert result.dims == data.dims
+    assert_array_almost_equal(result.values, np.gradient(data.values, axis=1))
+    assert all(shape[-1] == 3 and dim == -1 for shape, dim in shapes)
+
+
+@needs_module('dask')
+def test_preprocess_and_wrap_lazy_matches_eager():
+    """Test that lazy calculations give the same kind of output as in-memory ones."""
+    data = xr.DataArray(np.arange(12.).reshape(3, 4), dims=('y', 'x'), attrs={'units': 'm'})
+
+    @preprocess_and_wrap(wrap_like='a', lazy='elementwise')
+    def func(a):
+        return 2 * a
+
+    eager = func(data)
+    lazy = func(data.chunk({'x': 2}))
+    assert lazy.chunks is not None
+    assert is_quantity(eager.data)
+    assert is_quantity(lazy.data)
+    assert lazy.metpy.units == eager.metpy.units
+    assert_array_equal(lazy.compute().metpy.unit_array, eager.metpy.unit_array)
+
+
+def test_preprocess_and_wrap_lazy_bad_mode():
+    """Test that an unknown lazy mode errors out."""
+    with pytest.raises(ValueError, match='Unknown lazy mode'):
+        preprocess_and_wrap(lazy='columnwise')
+
+
 def test_grid_deltas_from_dataarray_lonlat(test_da_lonlat):
     """Test grid_deltas_from_dataarray with a lonlat grid."""
     dx, dy = grid_deltas_from_dataarray(test_da_lonlat)
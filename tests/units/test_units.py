@@ -3,6 +3,8 @@
 # SPDX-License-Identifier: BSD-3-Clause
 r"""Tests the operation of MetPy's unit support code."""
 
+import contextlib
+
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
@@ -11,7 +13,8 @@ import pytest
 from metpy.testing import (assert_almost_equal, assert_array_almost_equal, assert_array_equal,
                            assert_nan)
 from metpy.units import (check_units, concatenate, is_quantity,
-                         pandas_dataframe_to_unit_arrays, units)
+                         pandas_dataframe_to_unit_arrays, process_units, trusted_inputs,
+                         units)
 
 
 def test_concatenate():
@@ -116,6 +119,51 @@ def test_bad_masked_array(func):
     assert 'units.Quantity' in message
 
 
+def test_repeated_units_still_checked():
+    """Test that remembering good units does not let different, bad units through."""
+    func = check_units('[temperature]', '[pressure]')(lambda temp, press: None)
+    func(30 * units.degC, 1000 * units.mbar)
+    func(30 * units.degC, 1000 * units.mbar)
+    with pytest.raises(ValueError):
+        func(30 * units.degC, 1000 * units.meter)
+    with pytest.raises(ValueError):
+        func(30 * units.degC, 1000)
+
+
+def test_trusted_inputs():
+    """Test that unit checks are skipped only within trusted_inputs."""
+    func = check_units('[temperature]', '[pressure]')(lambda temp, press: press)
+    with trusted_inputs():
+        assert func(30 * units.degC, 1000 * units.meter) == 1000 * units.meter
+    with pytest.raises(ValueError):
+        func(30 * units.degC, 1000 * units.meter)
+
+
+@process_units({'temp': '[temperature]', 'speed': '[speed]'}, ('[temperature]', '[speed]'))
+def base_unit_calc(temp, speed, scale=1):
+    r"""Stub calculation for testing unit conversion."""
+    return temp + 1, speed * scale
+
+
+@pytest.mark.parametrize('trusted', [False, True])
+def test_process_units_conversions(trusted):
+    """Test converting arguments to base units and results back, repeatedly."""
+    temp = np.array([32., 50.]) * units.degF
+    speed = np.array([10., 20.]) * units.knots
+    with trusted_inputs() if trusted else contextlib.nullcontext():
+        for _ in range(2):
+            result_temp, result_speed = base_unit_calc(temp, speed, scale=2)
+            assert result_temp.units == units.degF
+            assert_array_almost_equal(result_temp,
+                                      (temp.to('K') + 1 * units.delta_degC).to('degF'), 10)
+            assert result_speed.units == units.knots
+            assert_array_almost_equal(result_speed, 2 * speed, 10)
+
+    # Same function, different units
+    result_temp, _ = base_unit_calc(units.Quantity(0., 'degC'), speed=1 * units('m/s'))
+    assert_almost_equal(result_temp, units.Quantity(1., 'degC'), 10)
+
+
 def test_pandas_units_simple():
     """Simple unit attachment to two columns."""
     df = pd.DataFrame(data=[[1, 4], [2, 5], [3, 6]], columns=['cola', 'colb'])